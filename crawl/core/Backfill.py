@@ -0,0 +1,445 @@
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from crawl.core.Frontier import canonical_url
+from crawl.core.SourceRegistry import SourceRegistry
+from crawl.core.Sinks import Sink
+from crawl.core.domain.entity.Pipeline import FetchJob, CrawlRecord
+from utils.CreditLedger import BudgetExceeded
+from utils.TimeNormalizer import normalize_timestamp
+
+# 실시간 수집(목록 0, 상세 1)보다 뒤: 예산이 live reserve에 닿으면 백필 요청부터 멈춥니다.
+BACKFILL_PRIORITY = 5
+
+
+class Throttle:
+    """
+    Bounded pool for backfill fetches that gives way when the rendering service pushes back.
+    At most `limit` fetches run at once, started at least `1 / rate` seconds apart. The limit
+    grows by about one per `limit` clean responses up to `max_concurrency`; a blocked or failed
+    fetch (e.g. 429s while the live crawl is using the account's concurrency) halves it and
+    holds new fetches for `cooldown` seconds.
+    """
+
+    def __init__(self, max_concurrency: int = 8, rate: Optional[float] = None, cooldown: float = 30.0):
+        self.max_concurrency = max_concurrency
+        self.limit = float(max_concurrency)
+        self.interval = 1 / rate if rate else 0.0
+        self.cooldown = cooldown
+        self.active = 0
+        self.backoffs = 0
+        self._next_at = 0.0
+        self._backoff_until = 0.0
+        self._changed = asyncio.Event()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            has_slot = self.active < int(self.limit)
+            if has_slot and self._next_at <= now:
+                self.active += 1
+                self._next_at = now + self.interval
+                return
+            # 슬롯이 비면 release()가 깨우고, 시작 간격/쿨다운만 남았으면 그 시각까지 기다립니다.
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), self._next_at - now if has_slot else None)
+            except asyncio.TimeoutError:
+                pass
+
+    def release(self, ok: bool) -> None:
+        self.active -= 1
+        now = time.monotonic()
+        if ok:
+            self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+        elif now >= self._backoff_until:
+            # 동시에 실패한 요청들은 한 번의 후퇴로 셉니다.
+            self.limit = max(1.0, self.limit / 2)
+            self.backoffs += 1
+            self._backoff_until = now + self.cooldown
+            self._next_at = max(self._next_at, self._backoff_until)
+        self._changed.set()
+
+    def stats(self) -> Dict[str, float]:
+        return {"limit": round(self.limit, 2), "backoffs": self.backoffs}
+
+
+@dataclass
+class Progress:
+    source: str
+    category: str
+    until: float  # 이 범위까지 채운 (또는 채우는 중인) 목표 시각
+    page: int = 0  # 마지막으로 끝낸 페이지
+    oldest: Optional[float] = None
+    done: bool = False
+
+
+class BackfillState:
+    """
+    Per-category checkpoints, the article URLs backfilled so far and the articles that failed
+    (retried by later runs, since their listing page is not walked again), in a small SQLite file.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS progress (source TEXT NOT NULL, category TEXT NOT NULL,"
+            " until REAL NOT NULL, page INTEGER NOT NULL, oldest REAL, done INTEGER NOT NULL,"
+            " updated_at REAL NOT NULL, PRIMARY KEY (source, category))")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS stored (url TEXT PRIMARY KEY, source TEXT NOT NULL, published_ts REAL,"
+            " stored_at REAL NOT NULL)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS failed (url TEXT PRIMARY KEY, source TEXT NOT NULL, category TEXT NOT NULL,"
+            " job TEXT NOT NULL, attempts INTEGER NOT NULL, failed_at REAL NOT NULL)")
+
+    def progress(self, source: str, category: Optional[str]) -> Optional[Progress]:
+        row = self.conn.execute(
+            "SELECT until, page, oldest, done FROM progress WHERE source = ? AND category = ?",
+            (source, category or "")).fetchone()
+        if row is None:
+            return None
+        return Progress(source, category or "", row[0], row[1], row[2], bool(row[3]))
+
+    def checkpoint(self, progress: Progress) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO progress (source, category, until, page, oldest, done, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (progress.source, progress.category, progress.until, progress.page, progress.oldest,
+             int(progress.done), time.time()))
+        self.conn.commit()
+
+    def is_stored(self, url: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM stored WHERE url = ?", (canonical_url(url),)).fetchone() is not None
+
+    def mark_stored(self, source: str, items: List[Any]) -> None:
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO stored (url, source, published_ts, stored_at) VALUES (?, ?, ?, ?)",
+            [(canonical_url(item.url), source, getattr(item, "published_ts", None), now) for item in items])
+        self.conn.executemany("DELETE FROM failed WHERE url = ?", [(canonical_url(item.url),) for item in items])
+        self.conn.commit()
+
+    def mark_failed(self, source: str, category: Optional[str], jobs: List[FetchJob]) -> None:
+        now = time.time()
+        self.conn.executemany(
+            "INSERT INTO failed (url, source, category, job, attempts, failed_at) VALUES (?, ?, ?, ?, 1, ?)"
+            " ON CONFLICT(url) DO UPDATE SET attempts = attempts + 1, failed_at = excluded.failed_at",
+            [(canonical_url(job.url), source, category or "", json.dumps(asdict(job), ensure_ascii=False), now)
+             for job in jobs])
+        self.conn.commit()
+
+    def failed_jobs(self, source: str, category: Optional[str], max_attempts: int) -> List[FetchJob]:
+        """Articles of the category that failed fewer than `max_attempts` times, oldest failure first."""
+        rows = self.conn.execute(
+            "SELECT job FROM failed WHERE source = ? AND category = ? AND attempts < ? ORDER BY failed_at",
+            (source, category or "", max_attempts))
+        return [FetchJob(**json.loads(row[0])) for row in rows]
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class Backfill:
+    """
+    Walks each category's listing pages from the newest back to `until`, fetching every article
+    that is not stored yet and writing it to the sinks. Progress is checkpointed after each page,
+    so an interrupted run resumes where it stopped. A walk ends when a page's oldest article is
+    older than `until`, when the archive runs out, or after `known_pages` pages in a row with
+    nothing new (history that is already stored). Articles that fail are recorded and retried
+    at the start of the next runs, up to `retries` times. Every fetch goes through the Throttle
+    at a priority below the live crawl's.
+    """
+
+    def __init__(self, registry: SourceRegistry, sinks: List[Sink], state: BackfillState, until: float,
+                 throttle: Optional[Throttle] = None, max_pages: int = 50, known_pages: int = 2,
+                 attempts: int = 2, archive: Any = None, retries: int = 3):
+        self.registry = registry
+        self.util = registry.util
+        self.sinks = sinks
+        self.state = state
+        self.until = until
+        self.throttle = throttle or Throttle()
+        # 한 실행에서 카테고리당 넘길 최대 페이지 수 (남은 범위는 다음 실행이 이어감)
+        self.max_pages = max_pages
+        self.known_pages = known_pages
+        self.attempts = attempts
+        self.archive = archive
+        self.retries = retries
+
+    def walks(self, names: List[str], categories: Optional[List[str]] = None) -> List[Tuple[str, Optional[str]]]:
+        """(source, category) pairs to backfill; without categories every category of the source."""
+        walks = []
+        for name in names:
+            spec = self.registry.spec(name)
+            if not hasattr(self.registry.use_case(name), "archive_job"):
+                print(f"⚠️ {name} has no paginated archive, skipping")
+                continue
+            selected = spec.select_categories(categories) if categories else list(spec.categories) or [None]
+            walks.extend((name, category) for category in selected)
+        return walks
+
+    async def _fetch(self, job: FetchJob) -> Optional[str]:
+        """The page's HTML through the throttle; None when it was blocked or failed."""
+        await self.throttle.acquire()
+        ok = False
+        try:
+            response = await self.util.fetch_response(job.url, job.wait, job.js_instructions,
+                                                      source=job.source, priority=job.priority)
+            ok = not response.is_blocked
+            if not ok:
+                print(f"⚠️ Backfill fetch blocked (status {response.status}): {job.url}")
+                return None
+            if self.archive is not None:
+                self.archive.put(job, response.text, time.time())
+            return response.text
+        except BudgetExceeded:
+            ok = True  # 예산은 후퇴할 이유가 아니라 멈출 이유입니다.
+            raise
+        except Exception as e:
+            print(f"❌ Backfill fetch failed {job.url}: {e}")
+            return None
+        finally:
+            self.throttle.release(ok)
+
+    async def _parse(self, job: FetchJob) -> Optional[Tuple[List[Any], List[FetchJob]]]:
+        for _ in range(self.attempts):
+            html = await self._fetch(job)
+            if html is None:
+                continue
+            try:
+                result = self.registry.parse_raw(job, html) if self.util.structured_data else None
+                if result is None:
+                    async with self.util.parsed(html) as soup:
+                        result = self.registry.use_case(job.source).parse_job(job, soup)
+            except Exception as e:
+                print(f"❌ Failed to parse {job.url}: {e}")
+                return None
+            if self.util.ledger is not None:
+                self.util.ledger.record_yield(job.source, job.url, len(result[0]) + len(result[1]))
+            return result
+        return None
+
+    def _known(self, result_name: str, url: str) -> bool:
+        if self.state.is_stored(url):
+            return True
+        # 실시간 수집이 같은 SQLite 싱크에 저장한 기사도 건너뜁니다.
+        return any(sink.contains(result_name, url) for sink in self.sinks if hasattr(sink, "contains"))
+
+    async def _articles(self, name: str, category: Optional[str], result_name: str, links: List[FetchJob],
+                        stats: Dict[str, Any]) -> Tuple[bool, List[List[Any]]]:
+        """
+        Fetch, write and record the articles, keeping failures for retry.
+        Returns whether the budget held out and the items of each article written.
+        """
+        outcomes = await asyncio.gather(*(self._parse(link) for link in links), return_exceptions=True)
+        pages_items = [outcome[0] for outcome in outcomes if isinstance(outcome, tuple)]
+        stats["articles"] += await self._write(result_name, pages_items)
+        # 예산 초과는 실패로 세지 않습니다 (그 페이지는 체크포인트되지 않아 다음 실행이 다시 봅니다).
+        failed = [link for link, outcome in zip(links, outcomes) if not isinstance(outcome, (tuple, BudgetExceeded))]
+        self.state.mark_failed(name, category, failed)
+        stats["failed"] += len(failed)
+        return not any(isinstance(outcome, BudgetExceeded) for outcome in outcomes), pages_items
+
+    async def _walk(self, name: str, category: Optional[str]) -> Dict[str, Any]:
+        result_name = self.registry.spec(name).result_name(category)
+        stats: Dict[str, Any] = {"pages": 0, "articles": 0, "known": 0, "failed": 0, "retried": 0, "stopped": None}
+        retry = self.state.failed_jobs(name, category, self.retries)
+        if retry:
+            within_budget, pages_items = await self._articles(name, category, result_name, retry, stats)
+            stats["retried"] = len(pages_items)
+            if not within_budget:
+                print(f"⚠️ Render budget exhausted, stopping backfill of {result_name}")
+                stats.update(stopped="budget", oldest=None)
+                return stats
+        progress = self.state.progress(name, category)
+        if progress is not None and progress.done and progress.until <= self.until:
+            stats.update(stopped="covered", oldest=progress.oldest)
+            return stats
+        if progress is None:
+            progress = Progress(name, category or "", self.until)
+        progress.until, progress.done = self.until, False
+
+        visited = set()  # 이 실행에서 이미 시도한 기사 (누적되는 스크롤 목록용)
+        nothing_new = 0
+        page = progress.page + 1
+        while True:
+            if stats["pages"] >= self.max_pages:
+                stats["stopped"] = "max_pages"
+                break
+            job = self.registry.archive_job(name, category, page)
+            if job is None:
+                stats["stopped"] = "end"
+                break
+            job.priority = BACKFILL_PRIORITY
+            try:
+                result = await self._parse(job)
+            except BudgetExceeded as e:
+                print(f"⚠️ {e}")
+                stats["stopped"] = "budget"
+                break
+            if result is None:
+                stats["stopped"] = "failed"
+                break
+            stats["pages"] += 1
+            if not result[1]:
+                stats["stopped"] = "end"
+                break
+
+            new = []
+            for link in result[1]:
+                if canonical_url(link.url) in visited:
+                    continue
+                visited.add(canonical_url(link.url))
+                if self._known(result_name, link.url):
+                    stats["known"] += 1
+                else:
+                    new.append(link)
+            nothing_new = 0 if new else nothing_new + 1
+            if not new:
+                # 모두 저장된 페이지도 끝난 것이므로, 다음 실행은 그 뒤부터 이어갑니다.
+                progress.page = page
+                self.state.checkpoint(progress)
+            if nothing_new >= self.known_pages:
+                stats["stopped"] = "known"
+                break
+
+            within_budget, pages_items = await self._articles(name, category, result_name, new, stats)
+            if not within_budget:
+                # 페이지를 끝내지 못했으므로 체크포인트를 옮기지 않습니다 (저장한 기사는 다음 실행이 건너뜀).
+                print(f"⚠️ Render budget exhausted, stopping backfill of {result_name}")
+                stats["stopped"] = "budget"
+                break
+
+            published = [ts for items in pages_items for ts in (getattr(item, "published_ts", None)
+                                                                  for item in items) if ts is not None]
+            if published:
+                oldest = min(published)
+                progress.oldest = oldest if progress.oldest is None else min(progress.oldest, oldest)
+            progress.page = page
+            self.state.checkpoint(progress)
+            if published and min(published) < self.until:
+                stats["stopped"] = "target"
+                break
+            page += 1
+
+        # 이미 저장된 기사를 만나 멈춘 경우는 목표 시각까지 내려간 것이 확인될 때만 끝난 것으로 봅니다.
+        reached = progress.oldest is not None and progress.oldest <= self.until
+        if stats["stopped"] in ("target", "end") or (stats["stopped"] == "known" and reached):
+            progress.done = True
+            if stats["stopped"] == "end":
+                progress.until = 0.0  # 더 오래된 기사가 없으므로 어떤 목표 시각도 채운 것으로 봅니다.
+        self.state.checkpoint(progress)
+        stats["oldest"] = progress.oldest
+        return stats
+
+    async def _write(self, result_name: str, pages_items: List[List[Any]]) -> int:
+        fetched_at = time.time()
+        written = 0
+        for items in pages_items:
+            for item in items:
+                record = CrawlRecord(source=result_name, kind="article", item=item, url=item.url,
+                                     fetched_at=fetched_at, meta={"backfill": True})
+                for sink in self.sinks:
+                    await sink.write(record)
+                written += 1
+            self.state.mark_stored(result_name, items)
+        return written
+
+    async def run(self, names: List[str], categories: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Backfill every selected category at once; returns per-category stats by result name."""
+        walks = self.walks(names, categories)
+        for sink in self.sinks:
+            await sink.open()
+        try:
+            results = await asyncio.gather(*(self._walk(name, category) for name, category in walks))
+        finally:
+            for sink in self.sinks:
+                await sink.close()
+        return {self.registry.spec(name).result_name(category): stats
+                for (name, category), stats in zip(walks, results)}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    from crawl.core.main import RESULTS_DIR
+
+    parser = argparse.ArgumentParser(description="Backfill history by walking category archives back to a date.")
+    parser.add_argument("--until", required=True,
+                        help='Oldest publication date to reach: "2024-01-31", an ISO timestamp or "30 days ago".')
+    parser.add_argument("-s", "--source", dest="sources", action="append",
+                        help="Source to backfill (repeatable). Defaults to every source with a paginated archive.")
+    parser.add_argument("-c", "--category", dest="categories", action="append",
+                        help="Category to backfill (repeatable). Defaults to every category.")
+    parser.add_argument("-o", "--output", default=RESULTS_DIR, help="Directory for the state and default sink.")
+    parser.add_argument("--sink", dest="sinks", action="append", metavar="SPEC",
+                        help='Output: "stdout", "file:<dir>", "sqlite:<path>" or a webhook URL (repeatable). '
+                             "Articles already in a sqlite sink are skipped. Defaults to file:<output>/backfill.")
+    parser.add_argument("-j", "--concurrency", type=int, default=8, help="Maximum concurrent backfill fetches.")
+    parser.add_argument("--rate", type=float, help="Maximum backfill fetches started per second.")
+    parser.add_argument("--cooldown", type=float, default=30.0,
+                        help="Seconds to hold new fetches after a blocked or failed one.")
+    parser.add_argument("--max-pages", type=int, default=50,
+                        help="Listing pages per category in this run; the next run continues from there.")
+    parser.add_argument("--known-pages", type=int, default=2,
+                        help="Stop a category after this many pages in a row with nothing new.")
+    parser.add_argument("--run-budget", type=int, help="Maximum render credits for this backfill.")
+    parser.add_argument("--daily-budget", type=int,
+                        help="Daily render credits, shared with the live crawl through the credit ledger.")
+    parser.add_argument("--live-reserve", type=float, default=0.3,
+                        help="Share of the daily budget the backfill never uses, kept for the live crawl.")
+    parser.add_argument("--archive", metavar="DIR", help="Also keep the fetched pages in a raw HTML archive.")
+    parser.add_argument("--dom-only", action="store_true",
+                        help="Parse the DOM even where pages embed JSON-LD/hydration data.")
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    from crawl.core.Sinks import build_sink
+    from utils.CreditLedger import CreditLedger
+    from utils.ZenrowsUtil import ZenrowsUtil
+
+    args = parse_args(argv)
+    until = normalize_timestamp(args.until)
+    if until is None:
+        raise SystemExit(f"Invalid --until: {args.until!r}")
+
+    ledger = CreditLedger(args.run_budget, args.daily_budget, args.live_reserve,
+                          state_path=os.path.join(args.output, "credit_ledger.json"))
+    registry = SourceRegistry(ZenrowsUtil(ledger=ledger, structured_data=not args.dom_only))
+    archive = None
+    if args.archive:
+        from crawl.core.HtmlArchive import HtmlArchive
+
+        archive = HtmlArchive(args.archive)
+    sinks = [build_sink(spec) for spec in (args.sinks or [f"file:{os.path.join(args.output, 'backfill')}"])]
+    state = BackfillState(os.path.join(args.output, "backfill.db"))
+    throttle = Throttle(args.concurrency, args.rate, args.cooldown)
+    backfill = Backfill(registry, sinks, state, until, throttle, max_pages=args.max_pages,
+                        known_pages=args.known_pages, archive=archive)
+    started = time.time()
+    try:
+        results = await backfill.run(args.sources or registry.names(), args.categories)
+    finally:
+        state.close()
+        if archive is not None:
+            archive.close()
+        ledger.save()
+
+    for name, stats in results.items():
+        oldest = time.strftime("%Y-%m-%d %H:%M", time.gmtime(stats["oldest"])) if stats.get("oldest") else "-"
+        print(f"{name:<28} {stats['stopped']:<10} {stats['pages']:>4} pages {stats['articles']:>5} articles "
+              f"{stats['known']:>5} known {stats['failed']:>4} failed {stats['retried']:>4} retried  oldest {oldest}")
+    print(f"✅ Backfill finished in {time.time() - started:.0f}s, {ledger.run_credits} credits, "
+          f"throttle {throttle.stats()}")
+    return results
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
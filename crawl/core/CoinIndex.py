@@ -0,0 +1,89 @@
+import bisect
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from crawl.core.TimeIndex import record_timestamp
+from crawl.core.domain.entity.Pipeline import CrawlRecord
+from utils.TickerMatcher import TickerMatcher
+
+# 티커를 찾을 item 필드
+TEXT_FIELDS = ("title", "content", "description")
+
+
+class CoinIndex:
+    """
+    Inverted index from coin ticker to the records mentioning it, each list kept in time order.
+    A record is indexed once per (source, url): indexing it again replaces its earlier postings.
+    """
+
+    def __init__(self, matcher: TickerMatcher):
+        self.matcher = matcher
+        self._postings: Dict[str, List[Tuple[float, int, CrawlRecord]]] = {}
+        # (source, url) -> (timestamp, sequence, coins): 같은 기사가 다시 수집되면 이전 posting을 지우기 위해 보관
+        self._entries: Dict[Tuple[str, str], Tuple[float, int, List[str]]] = {}
+        self._sequence = 0
+
+    def coins_of(self, record: CrawlRecord) -> List[str]:
+        """Tickers mentioned by the record, including Coinness' own coin tags."""
+        item = record.item
+        text = "\n".join(getattr(item, name, None) or "" for name in TEXT_FIELDS)
+        coins = self.matcher.find(text)
+        coins.update(tag.strip().upper() for tag in getattr(item, "coin_tags", None) or [])
+        return sorted(coins)
+
+    def _remove(self, timestamp: float, sequence: int, coins: List[str]) -> None:
+        for coin in coins:
+            postings = self._postings.get(coin)
+            if not postings:
+                continue
+            position = bisect.bisect_left(postings, (timestamp, sequence))
+            if position < len(postings) and postings[position][:2] == (timestamp, sequence):
+                del postings[position]
+            if not postings:
+                del self._postings[coin]
+
+    def add(self, record: CrawlRecord, coins: Iterable[str]) -> None:
+        key = (record.source, record.url)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._remove(*previous)
+        coins = list(coins)
+        timestamp = record_timestamp(record)
+        self._sequence += 1
+        for coin in coins:
+            bisect.insort(self._postings.setdefault(coin, []), (timestamp, self._sequence, record))
+        self._entries[key] = (timestamp, self._sequence, coins)
+
+    def index_record(self, record: CrawlRecord) -> CrawlRecord:
+        """Pipeline enricher: tag the record with meta["coins"] and index it."""
+        coins = self.coins_of(record)
+        record.meta["coins"] = coins
+        self.add(record, coins)
+        return record
+
+    def lookup(self, coin: str, since: Optional[float] = None, until: Optional[float] = None,
+               newest_first: bool = False) -> List[CrawlRecord]:
+        """Records mentioning `coin`, optionally limited to since <= timestamp < until."""
+        postings = self._postings.get(coin.upper(), [])
+        low = bisect.bisect_left(postings, (since, 0)) if since is not None else 0
+        high = bisect.bisect_left(postings, (until, 0)) if until is not None else len(postings)
+        selected = postings[low:high]
+        if newest_first:
+            selected.reverse()
+        return [record for _, _, record in selected]
+
+    def recent(self, coin: str, seconds: float, now: Optional[float] = None) -> List[CrawlRecord]:
+        """Records mentioning `coin` in the last `seconds` seconds."""
+        return self.lookup(coin, since=(now if now is not None else time.time()) - seconds)
+
+    def coins(self) -> Dict[str, int]:
+        return {coin: len(postings) for coin, postings in self._postings.items()}
+
+    def prune(self, before: float) -> None:
+        """Drop postings older than `before`."""
+        for coin in list(self._postings):
+            postings = self._postings[coin]
+            del postings[:bisect.bisect_left(postings, (before, 0))]
+            if not postings:
+                del self._postings[coin]
+        self._entries = {key: entry for key, entry in self._entries.items() if entry[0] >= before}
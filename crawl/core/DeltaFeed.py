@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Any, List, Optional
+
+# 실행할 때마다 값이 바뀌는 필드 (상대 시간 변환 등)는 변경으로 보지 않습니다.
+IGNORED_FIELDS = {"published_time", "published_ts"}
+
+
+def flatten_items(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Pull the item dicts out of a use case result, whatever its nesting."""
+    data = result.get("data")
+    items: List[Dict[str, Any]] = []
+    if isinstance(data, dict):
+        for value in data.values():
+            if isinstance(value, list):
+                items.extend(value)
+    elif isinstance(data, list):
+        # Coinness: [{"date": ..., "items": [...]}]
+        for group in data:
+            items.extend(group.get("items", []))
+    return items
+
+
+def item_key(item: Dict[str, Any]) -> str:
+    """Stable identity of an item across runs."""
+    if item.get("url"):
+        return item["url"]
+    if "date" in item and "time" in item:
+        return f"{item['date']} {item['time']} {item.get('title', '')}"
+    raw = item.get("title") or json.dumps(item, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def diff_fields(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields whose values changed, with their new values."""
+    return {
+        name: value for name, value in current.items()
+        if name not in IGNORED_FIELDS and previous.get(name) != value
+    }
+
+
+class DeltaFeed:
+    """Compares each run with the previous snapshot and appends the changes to a feed file."""
+
+    def __init__(self, output_dir: str, feed_name: str = "changes.jsonl"):
+        self.snapshot_dir = os.path.join(output_dir, "snapshots")
+        self.feed_path = os.path.join(output_dir, feed_name)
+
+    def _snapshot_path(self, source: str) -> str:
+        return os.path.join(self.snapshot_dir, f"{source}.json")
+
+    def load_snapshot(self, source: str) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._snapshot_path(source), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_snapshot(self, source: str, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        path = self._snapshot_path(source)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def compute(previous: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]],
+                removals: bool = True) -> List[Dict[str, Any]]:
+        """Added, updated and (unless `removals` is False) removed entries between two snapshots."""
+        changes = []
+        for key, item in current.items():
+            if key not in previous:
+                changes.append({"op": "added", "key": key, "item": item})
+                continue
+            changed = diff_fields(previous[key], item)
+            if changed:
+                changes.append({"op": "updated", "key": key, "changes": changed})
+        if removals:
+            for key in previous.keys() - current.keys():
+                changes.append({"op": "removed", "key": key})
+        return changes
+
+    def publish(self, results: Dict[str, Dict[str, Any]], run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Diff every successful source against its last snapshot and append the changes to the feed.
+        Partial results are merged into the snapshot: their missing items are not reported as removed.
+        """
+        run_id = run_id or time.strftime("%Y%m%dT%H%M%S")
+        feed: List[Dict[str, Any]] = []
+
+        for source, result in results.items():
+            if "error" in result:
+                # 실패한 소스는 스냅샷을 유지해 전부 삭제된 것으로 보이지 않게 합니다.
+                continue
+
+            current = {item_key(item): item for item in flatten_items(result)}
+            previous = self.load_snapshot(source)
+            partial = bool(result.get("partial"))
+            changes = self.compute(previous, current, removals=not partial)
+            for change in changes:
+                change.update({"run_id": run_id, "source": source})
+            feed.extend(changes)
+            # 부분 결과에 없는 항목은 사라진 것인지 알 수 없으므로 이전 스냅샷에 남겨 둡니다.
+            self.save_snapshot(source, {**previous, **current} if partial else current)
+
+        if feed:
+            os.makedirs(os.path.dirname(self.feed_path) or ".", exist_ok=True)
+            with open(self.feed_path, "a", encoding="utf-8") as f:
+                for change in feed:
+                    f.write(json.dumps(change, ensure_ascii=False) + "\n")
+        print(f"✅ {len(feed)} changes written to {self.feed_path}")
+        return feed
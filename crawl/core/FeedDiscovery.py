@@ -0,0 +1,232 @@
+import asyncio
+import json
+import os
+import time
+import xml.etree.ElementTree as ElementTree
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from crawl.core.SourceRegistry import SourceRegistry
+from crawl.core.domain.entity.Feed import FeedEntry
+from crawl.core.domain.entity.Pipeline import FetchJob
+from utils.FetchTransport import DEFAULT_HEADERS
+from utils.TimeNormalizer import normalize_timestamp
+
+SEEN_URLS_KEPT = 1000
+
+
+@dataclass(frozen=True)
+class FeedSpec:
+    url: str
+    # "articles": 링크를 use case의 기사 파서로 가져옴, "entries": 피드 항목 자체를 결과로 냄
+    mode: str = "articles"
+
+
+# 소스별 피드, 앞에서부터 시도합니다 (RSS/Atom 또는 news sitemap).
+FEEDS: Dict[str, List[FeedSpec]] = {
+    "cointelegrap": [FeedSpec("https://cointelegraph.com/rss")],
+    "decrypt": [FeedSpec("https://decrypt.co/feed")],
+    "bitcoin_news": [FeedSpec("https://news.bitcoin.com/feed/")],
+    "coindesk_latest_news": [FeedSpec("https://www.coindesk.com/arc/outboundfeeds/rss/", "entries")],
+    "cryptoslate_top_news": [FeedSpec("https://cryptoslate.com/feed/", "entries"),
+                             FeedSpec("https://cryptoslate.com/news-sitemap.xml", "entries")],
+}
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(elem: ElementTree.Element, *names: str) -> Optional[str]:
+    for child in elem:
+        if _local(child.tag) in names and child.text and child.text.strip():
+            return child.text.strip()
+    return None
+
+
+def _entry(elem: ElementTree.Element) -> Optional[FeedEntry]:
+    """RSS <item>, Atom <entry> or sitemap <url> → FeedEntry."""
+    kind = _local(elem.tag)
+    if kind == "url":
+        url = _child_text(elem, "loc")
+        news = next((child for child in elem if _local(child.tag) == "news"), None)
+        title = _child_text(news, "title") if news is not None else None
+        published = (_child_text(news, "publication_date") if news is not None else None) or \
+            _child_text(elem, "lastmod")
+        summary = None
+    else:
+        url = _child_text(elem, "link")
+        if kind == "entry" or url is None:
+            # Atom: <link rel="alternate" href="..."/>
+            for child in elem:
+                if _local(child.tag) == "link" and child.get("href") and child.get("rel", "alternate") == "alternate":
+                    url = child.get("href")
+                    break
+        title = _child_text(elem, "title")
+        published = _child_text(elem, "pubDate", "published", "updated", "date")
+        summary = _child_text(elem, "description", "summary")
+    if not url:
+        return None
+    return FeedEntry(title=title or "", url=url, summary=summary, published_time=published,
+                     published_ts=normalize_timestamp(published))
+
+
+def parse_feed(stream: Any) -> List[FeedEntry]:
+    """Stream-parse a feed or sitemap, clearing each entry once read."""
+    entries = []
+    for _, elem in ElementTree.iterparse(stream, events=("end",)):
+        if _local(elem.tag) in ("item", "entry", "url"):
+            entry = _entry(elem)
+            if entry is not None:
+                entries.append(entry)
+            elem.clear()
+    return entries
+
+
+@dataclass
+class FeedState:
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    newest_ts: Optional[float] = None
+    checked_at: Optional[float] = None
+    seen: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Discovery:
+    jobs: List[FetchJob] = field(default_factory=list)  # 렌더링할 목록 페이지 / 피드에서 찾은 기사
+    entries: List[Tuple[FetchJob, List[FeedEntry]]] = field(default_factory=list)  # "entries" 모드 결과
+    via_feed: List[str] = field(default_factory=list)
+    fallback: List[str] = field(default_factory=list)
+
+
+class FeedDiscovery:
+    """
+    Feed-first discovery of new articles. Feeds are fetched directly with conditional requests;
+    a source falls back to rendering its listing pages when it has no feed, the feed fails,
+    or its newest entry is older than `stale_after` seconds. Entries stay new until mark_seen()
+    is called for them (once their items are written), so a failed run rediscovers them.
+    """
+
+    def __init__(self, state_path: Optional[str] = None, feeds: Optional[Dict[str, List[FeedSpec]]] = None,
+                 stale_after: float = 6 * 3600, first_run_limit: int = 20, timeout: float = 15.0):
+        self.feeds = feeds if feeds is not None else FEEDS
+        self.state_path = state_path
+        self.stale_after = stale_after
+        self.first_run_limit = first_run_limit
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.headers["Accept"] = "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8"
+        self.state: Dict[str, FeedState] = {}
+        # 발견됐지만 아직 저장되지 않은 항목 URL -> 피드 URL
+        self._pending: Dict[str, str] = {}
+        if state_path:
+            try:
+                with open(state_path, encoding="utf-8") as f:
+                    self.state = {url: FeedState(**value) for url, value in json.load(f).items()}
+            except (FileNotFoundError, json.JSONDecodeError):
+                pass
+
+    def _get(self, url: str, state: FeedState) -> Tuple[int, List[FeedEntry], Dict[str, str]]:
+        headers = {}
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+        with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+            if response.status_code != 200:
+                return response.status_code, [], dict(response.headers)
+            response.raw.decode_content = True
+            return 200, parse_feed(response.raw), dict(response.headers)
+
+    async def check(self, spec: FeedSpec) -> Optional[List[FeedEntry]]:
+        """New entries of a feed ([] when unchanged), or None when the feed is missing or stale."""
+        state = self.state.setdefault(spec.url, FeedState())
+        try:
+            status, entries, headers = await asyncio.to_thread(self._get, spec.url, state)
+        except (requests.RequestException, ElementTree.ParseError) as e:
+            print(f"⚠️ Feed {spec.url} failed: {e}")
+            return None
+        state.checked_at = time.time()
+        if status == 304:
+            entries = []
+        elif status != 200 or not entries:
+            return None
+        else:
+            state.etag = headers.get("ETag") or headers.get("etag")
+            state.last_modified = headers.get("Last-Modified") or headers.get("last-modified")
+            newest = max((entry.published_ts for entry in entries if entry.published_ts), default=None)
+            state.newest_ts = max(filter(None, (newest, state.newest_ts)), default=None)
+
+        if state.newest_ts is None or time.time() - state.newest_ts > self.stale_after:
+            return None
+
+        first_run = not state.seen
+        seen = set(state.seen)
+        new = [entry for entry in entries if entry.url not in seen]
+        new.sort(key=lambda entry: entry.published_ts or 0, reverse=True)
+        if first_run:
+            # 첫 실행에서 제한을 넘는 오래된 항목은 가져오지 않으므로 바로 본 것으로 둡니다.
+            state.seen = [entry.url for entry in new[self.first_run_limit:]][:SEEN_URLS_KEPT]
+            new = new[:self.first_run_limit]
+        for entry in new:
+            self._pending[entry.url] = spec.url
+        return new
+
+    def is_pending(self, url: str) -> bool:
+        return url in self._pending
+
+    def mark_seen(self, url: str) -> None:
+        """Record a discovered entry as done, so later runs no longer report it as new."""
+        feed_url = self._pending.pop(url, None)
+        if feed_url is None:
+            return
+        state = self.state[feed_url]
+        state.seen = ([url] + state.seen)[:SEEN_URLS_KEPT]
+
+    async def discover(self, registry: SourceRegistry, names: List[str],
+                       categories: Optional[List[str]] = None) -> Discovery:
+        """Jobs and feed entries for the selected sources, using feeds where they are fresh."""
+        result = Discovery()
+
+        async def source(name: str) -> Tuple[str, Optional[FeedSpec], Optional[List[FeedEntry]]]:
+            spec = registry.spec(name)
+            # 카테고리별 목록은 피드가 대신할 수 없으므로 기본 카테고리일 때만 사용
+            if name not in self.feeds or spec.select_categories(categories) != [spec.default_category]:
+                return name, None, None
+            for feed in self.feeds[name]:
+                entries = await self.check(feed)
+                if entries is not None:
+                    return name, feed, entries
+            return name, None, None
+
+        for name, feed, entries in await asyncio.gather(*(source(name) for name in names)):
+            listing_jobs = registry.listing_jobs([name], categories)
+            if feed is None:
+                result.jobs.extend(listing_jobs)
+                if name in self.feeds:
+                    result.fallback.append(name)
+                continue
+            result.via_feed.append(name)
+            base = listing_jobs[0] if listing_jobs else FetchJob(url=feed.url, kind="feed", source=name)
+            if feed.mode == "articles":
+                result.jobs.extend(replace(base, url=entry.url, kind="article", priority=base.priority + 1)
+                                   for entry in entries)
+            elif entries:
+                result.entries.append((replace(base, url=feed.url, kind="feed"), entries))
+        return result
+
+    def save(self) -> None:
+        if not self.state_path:
+            return
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({url: vars(state) for url, state in self.state.items()}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+    def close(self) -> None:
+        self.session.close()
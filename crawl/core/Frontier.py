@@ -0,0 +1,165 @@
+import asyncio
+import heapq
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from bs4 import BeautifulSoup
+
+from crawl.core.domain.entity.Article import ArticleBody
+from crawl.core.domain.entity.Pipeline import FetchJob
+from utils.ArticleExtractor import extract_article, find_article_body, find_published_time
+from utils.TimeNormalizer import normalize_timestamp
+
+# 목록에서 제목/미리보기/URL만 수집하는 소스
+LISTING_ONLY_SOURCES = (
+    "coindesk_latest_news", "coindesk_top_stories", "coindesk_most_read",
+    "cryptonews", "cryptoslate_insights", "cryptoslate_top_news",
+)
+BODY_KIND = "body"
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid")
+
+
+def canonical_url(url: str) -> str:
+    """Dedup key: lower-case host, no fragment, tracking parameters or trailing slash."""
+    parts = urlsplit(url)
+    query = urlencode([(key, value) for key, value in parse_qsl(parts.query)
+                       if not key.lower().startswith(_TRACKING_PARAMS)])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower().removeprefix("www."),
+                       parts.path.rstrip("/") or "/", query, ""))
+
+
+def item_priority(item: Any, now: float) -> Tuple[int, float]:
+    """Heap key for an item's body fetch: most-read rank first, then the most recent."""
+    rank = getattr(item, "rank", None)
+    published = getattr(item, "published_ts", None)
+    age = now - published if published else float("inf")
+    return (rank if isinstance(rank, int) else 1000), age
+
+
+class CrawlFrontier:
+    """
+    Article URLs emitted by listing-only sources, waiting for their bodies to be fetched.
+    URLs are deduplicated across sources within a run and, through a small SQLite table,
+    across runs. Each host gets at most `per_host` fetches at once, started at least
+    `host_delay` seconds apart; within those limits the highest-priority URL goes first.
+    """
+
+    def __init__(self, path: Optional[str] = None, sources: Iterable[str] = LISTING_ONLY_SOURCES,
+                 per_host: int = 2, host_delay: float = 1.0, max_per_run: Optional[int] = None):
+        self.sources: Set[str] = set(sources)
+        self.per_host = per_host
+        self.host_delay = host_delay
+        self.max_per_run = max_per_run
+        self.conn: Optional[sqlite3.Connection] = None
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self.conn = sqlite3.connect(path)
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS frontier (url TEXT PRIMARY KEY, source TEXT NOT NULL,"
+                " first_seen REAL NOT NULL, fetched_at REAL)")
+
+        self._queued: Set[str] = set()
+        self._queues: Dict[str, List[Tuple[Tuple[int, float], int, FetchJob]]] = {}
+        self._active: Dict[str, int] = {}
+        self._next_at: Dict[str, float] = {}
+        self._sequence = 0
+        self._changed = asyncio.Event()
+        self.stats = {"offered": 0, "duplicates": 0, "queued": 0, "fetched": 0, "failed": 0}
+
+    def _already_fetched(self, key: str) -> bool:
+        if self.conn is None:
+            return False
+        row = self.conn.execute("SELECT fetched_at FROM frontier WHERE url = ?", (key,)).fetchone()
+        return row is not None and row[0] is not None
+
+    def offer(self, job: FetchJob, items: List[Any]) -> int:
+        """Queue body fetches for the items of a parsed listing page; returns how many were new."""
+        if job.source not in self.sources:
+            return 0
+        now = time.time()
+        added = 0
+        for item in items:
+            url = getattr(item, "url", None)
+            if not url or not url.startswith(("http://", "https://")):
+                continue
+            self.stats["offered"] += 1
+            key = canonical_url(url)
+            if key in self._queued or self._already_fetched(key):
+                self.stats["duplicates"] += 1
+                continue
+            if self.max_per_run is not None and len(self._queued) >= self.max_per_run:
+                break
+            self._queued.add(key)
+            if self.conn is not None:
+                self.conn.execute("INSERT OR IGNORE INTO frontier (url, source, first_seen) VALUES (?, ?, ?)",
+                                  (key, job.source, now))
+            host = urlsplit(url).netloc.lower()
+            self._sequence += 1
+            body_job = FetchJob(url=url, kind=BODY_KIND, source=job.source, category=job.category,
+                                priority=job.priority + 1)
+            heapq.heappush(self._queues.setdefault(host, []), (item_priority(item, now), self._sequence, body_job))
+            added += 1
+        if self.conn is not None:
+            self.conn.commit()
+        self.stats["queued"] += added
+        if added:
+            self._changed.set()
+        return added
+
+    def pending(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    async def next(self) -> FetchJob:
+        """Wait for the best job whose host has a free slot and whose delay has elapsed."""
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            best_host, best_key, wait = None, None, None
+            for host, queue in self._queues.items():
+                if not queue or self._active.get(host, 0) >= self.per_host:
+                    continue
+                ready_in = self._next_at.get(host, 0.0) - now
+                if ready_in > 0:
+                    wait = ready_in if wait is None else min(wait, ready_in)
+                elif best_key is None or queue[0][:2] < best_key:
+                    best_host, best_key = host, queue[0][:2]
+            if best_host is not None:
+                _, _, job = heapq.heappop(self._queues[best_host])
+                self._active[best_host] = self._active.get(best_host, 0) + 1
+                self._next_at[best_host] = now + self.host_delay
+                return job
+
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def done(self, job: FetchJob, fetched: bool) -> None:
+        """Release the host slot; successfully fetched URLs are not queued again in later runs."""
+        host = urlsplit(job.url).netloc.lower()
+        self._active[host] -= 1
+        self.stats["fetched" if fetched else "failed"] += 1
+        if fetched and self.conn is not None:
+            self.conn.execute("UPDATE frontier SET fetched_at = ? WHERE url = ?", (time.time(), canonical_url(job.url)))
+            self.conn.commit()
+        self._changed.set()
+
+    @staticmethod
+    def parse(job: FetchJob, soup: BeautifulSoup) -> List[ArticleBody]:
+        """Extract the article body without site-specific selectors."""
+        article = extract_article(find_article_body(soup), job.url)
+        if not article.paragraphs:
+            return []
+        title_tag = soup.find("h1")
+        return [ArticleBody(url=job.url, content=article.text,
+                            title=title_tag.get_text(strip=True) if title_tag else None,
+                            word_count=article.word_count, links=article.links,
+                            published_ts=normalize_timestamp(find_published_time(soup)))]
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
@@ -0,0 +1,272 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import asdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from crawl.core.domain.entity.Pipeline import FetchJob
+
+ZLIB_DICT_BYTES = 32 * 1024  # zlib 창 크기보다 큰 사전은 의미가 없습니다.
+
+
+class ZstdCodec:
+    """zstd with dictionaries trained on a source's own pages."""
+    name = "zstd"
+
+    def __init__(self, level: int = 9):
+        import zstandard
+
+        self._zstd = zstandard
+        self.level = level
+        self._compressors: Dict[int, "zstandard.ZstdCompressor"] = {}
+        self._decompressors: Dict[int, "zstandard.ZstdDecompressor"] = {}
+
+    def train(self, samples: List[bytes], size: int) -> Optional[bytes]:
+        try:
+            return self._zstd.train_dictionary(size, samples).as_bytes()
+        except self._zstd.ZstdError:
+            return None  # 표본이 너무 적거나 비슷하지 않음
+
+    def _dict(self, data: Optional[bytes]):
+        return self._zstd.ZstdCompressionDict(data) if data else None
+
+    def compress(self, data: bytes, dict_id: int, dictionary: Optional[bytes]) -> bytes:
+        compressor = self._compressors.get(dict_id)
+        if compressor is None:
+            compressor = self._compressors[dict_id] = self._zstd.ZstdCompressor(
+                level=self.level, dict_data=self._dict(dictionary))
+        return compressor.compress(data)
+
+    def decompress(self, data: bytes, dict_id: int, dictionary: Optional[bytes]) -> bytes:
+        decompressor = self._decompressors.get(dict_id)
+        if decompressor is None:
+            decompressor = self._decompressors[dict_id] = self._zstd.ZstdDecompressor(
+                dict_data=self._dict(dictionary))
+        return decompressor.decompress(data)
+
+
+class ZlibCodec:
+    """
+    Fallback when zstandard is not installed: deflate with a preset dictionary made of the
+    markup fragments most of a source's pages share.
+    """
+    name = "zlib"
+
+    def __init__(self, level: int = 9):
+        self.level = level
+
+    @staticmethod
+    def train(samples: List[bytes], size: int) -> Optional[bytes]:
+        counts: Counter = Counter()
+        for sample in samples:
+            counts.update(set(fragment for fragment in sample.split(b">") if len(fragment) > 8))
+        shared = [(count, fragment) for fragment, count in counts.items() if count * 2 >= len(samples)]
+        if not shared:
+            return None
+        # 자주 나오는 조각일수록 사전 끝(가까운 거리)에 둡니다.
+        shared.sort()
+        dictionary = b">".join(fragment for _, fragment in shared)
+        return dictionary[-min(size, ZLIB_DICT_BYTES):]
+
+    def compress(self, data: bytes, dict_id: int, dictionary: Optional[bytes]) -> bytes:
+        compressor = zlib.compressobj(self.level, zdict=dictionary) if dictionary else zlib.compressobj(self.level)
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(self, data: bytes, dict_id: int, dictionary: Optional[bytes]) -> bytes:
+        decompressor = zlib.decompressobj(zdict=dictionary) if dictionary else zlib.decompressobj()
+        return decompressor.decompress(data) + decompressor.flush()
+
+
+def default_codec(name: Optional[str] = None):
+    """zstd when available (or requested), otherwise zlib."""
+    if name == "zlib":
+        return ZlibCodec()
+    try:
+        return ZstdCodec()
+    except ImportError:
+        if name == "zstd":
+            raise
+        return ZlibCodec()
+
+
+class HtmlArchive:
+    """
+    Raw pages as fetched, one SQLite row per page, compressed per source.
+    The first `train_after` pages of a source are kept as training samples; once there are
+    enough, a dictionary is trained and those pages are recompressed with it.
+    Compression, training and the inserts run on a writer thread with its own connection, so
+    put() never blocks the event loop; close() (or flush()) waits for the queued pages.
+    """
+
+    def __init__(self, directory: str, codec: Optional[str] = None, train_after: int = 64,
+                 dict_size: int = 112 * 1024, max_pending: int = 256):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "archive.db")
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS dictionaries ("
+            " id INTEGER PRIMARY KEY, source TEXT NOT NULL, codec TEXT NOT NULL, data BLOB NOT NULL,"
+            " created_at REAL NOT NULL)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " id INTEGER PRIMARY KEY, source TEXT NOT NULL, url TEXT NOT NULL, job TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL, codec TEXT NOT NULL, dict_id INTEGER NOT NULL DEFAULT 0,"
+            " raw_size INTEGER NOT NULL, data BLOB NOT NULL)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS pages_source ON pages (source, url, fetched_at)")
+        self.codec = default_codec(codec)
+        self.train_after = train_after
+        self.dict_size = dict_size
+        self._dictionaries: Dict[int, bytes] = {}
+        # source -> 사용할 사전 id (현재 코덱으로 학습된 가장 최근 것)
+        self._active: Dict[str, int] = {}
+        # source -> 학습에 실패한 뒤 다시 시도할 사전 없는 페이지 수 (페이지마다 재학습하지 않도록)
+        self._retrain_at: Dict[str, int] = {}
+        for dict_id, source, codec_name, data in self.conn.execute(
+                "SELECT id, source, codec, data FROM dictionaries ORDER BY id"):
+            self._dictionaries[dict_id] = data
+            if codec_name == self.codec.name:
+                self._active[source] = dict_id
+        # 쓰기 전용 스레드와 그 스레드의 연결 (첫 put에서 시작)
+        self._writes: "queue.Queue[Optional[Tuple[FetchJob, str, float]]]" = queue.Queue(max_pending)
+        self._writer: Optional[threading.Thread] = None
+        self._wconn: Optional[sqlite3.Connection] = None
+
+    def _codec(self, name: str):
+        return self.codec if name == self.codec.name else default_codec(name)
+
+    def put(self, job: FetchJob, html: str, fetched_at: Optional[float] = None) -> None:
+        """Queue one fetched page for the writer thread; drops it (with a warning) when the writer is behind."""
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="html-archive", daemon=True)
+            self._writer.start()
+        try:
+            self._writes.put_nowait((job, html, fetched_at or time.time()))
+        except queue.Full:
+            print(f"⚠️ Archive writer is behind, not archiving {job.url}")
+
+    def _write_loop(self) -> None:
+        self._wconn = sqlite3.connect(self.path, timeout=30)
+        try:
+            while True:
+                entry = self._writes.get()
+                try:
+                    if entry is None:
+                        return
+                    self._store(*entry)
+                except Exception as e:
+                    print(f"❌ Failed to archive {entry[0].url}: {e}")
+                finally:
+                    self._writes.task_done()
+        finally:
+            self._wconn.close()
+            self._wconn = None
+
+    def _store(self, job: FetchJob, html: str, fetched_at: float) -> None:
+        """
+        Compress and insert one page; trains the source's dictionary once enough pages are in.
+        When training fails, it is retried after another `train_after` pages.
+        """
+        raw = html.encode("utf-8")
+        dict_id = self._active.get(job.source, 0)
+        data = self.codec.compress(raw, dict_id, self._dictionaries.get(dict_id))
+        self._wconn.execute(
+            "INSERT INTO pages (source, url, job, fetched_at, codec, dict_id, raw_size, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (job.source, job.url, json.dumps(asdict(job), ensure_ascii=False), fetched_at,
+             self.codec.name, dict_id, len(raw), data))
+        self._wconn.commit()
+        if not dict_id:
+            undictionaried = self._wconn.execute(
+                "SELECT COUNT(*) FROM pages WHERE source = ? AND dict_id = 0", (job.source,)).fetchone()[0]
+            if undictionaried >= self._retrain_at.get(job.source, self.train_after):
+                if self.train(job.source, self._wconn) is None:
+                    self._retrain_at[job.source] = undictionaried + self.train_after
+
+    def flush(self) -> None:
+        """Wait until every queued page is written."""
+        if self._writer is not None:
+            self._writes.join()
+
+    def train(self, source: str, conn: Optional[sqlite3.Connection] = None) -> Optional[int]:
+        """Train a dictionary from the source's pages and recompress the ones stored without one."""
+        conn = conn or self.conn
+        rows = conn.execute(
+            "SELECT id, codec, dict_id, data FROM pages WHERE source = ? ORDER BY id DESC LIMIT ?",
+            (source, max(self.train_after, 16) * 4)).fetchall()
+        samples = [self._decode(codec, dict_id, data, conn) for _, codec, dict_id, data in rows]
+        dictionary = self.codec.train(samples, self.dict_size)
+        if not dictionary:
+            return None
+        cursor = conn.execute(
+            "INSERT INTO dictionaries (source, codec, data, created_at) VALUES (?, ?, ?, ?)",
+            (source, self.codec.name, dictionary, time.time()))
+        dict_id = cursor.lastrowid
+        self._dictionaries[dict_id] = dictionary
+        self._active[source] = dict_id
+
+        pending = conn.execute(
+            "SELECT id, codec, dict_id, data FROM pages WHERE source = ? AND dict_id = 0", (source,)).fetchall()
+        for page_id, codec, old_dict, data in pending:
+            raw = self._decode(codec, old_dict, data, conn)
+            conn.execute("UPDATE pages SET codec = ?, dict_id = ?, data = ? WHERE id = ?",
+                         (self.codec.name, dict_id, self.codec.compress(raw, dict_id, dictionary), page_id))
+        conn.commit()
+        return dict_id
+
+    def _decode(self, codec: str, dict_id: int, data: bytes, conn: Optional[sqlite3.Connection] = None) -> bytes:
+        if dict_id and dict_id not in self._dictionaries:
+            row = (conn or self.conn).execute("SELECT data FROM dictionaries WHERE id = ?", (dict_id,)).fetchone()
+            self._dictionaries[dict_id] = row[0]
+        return self._codec(codec).decompress(data, dict_id, self._dictionaries.get(dict_id))
+
+    def page_ids(self, sources: Optional[List[str]] = None, since: Optional[float] = None,
+                 until: Optional[float] = None, latest: bool = True) -> List[int]:
+        """Ids of the archived pages to re-parse; with `latest`, only the newest copy of each page."""
+        where, params = [], []
+        if sources:
+            where.append(f"source IN ({', '.join('?' * len(sources))})")
+            params.extend(sources)
+        if since is not None:
+            where.append("fetched_at >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("fetched_at < ?")
+            params.append(until)
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+        if latest:
+            query = f"SELECT MAX(id) FROM pages{clause} GROUP BY source, url, job ORDER BY 1"
+        else:
+            query = f"SELECT id FROM pages{clause} ORDER BY id"
+        return [row[0] for row in self.conn.execute(query, params)]
+
+    def pages(self, ids: List[int]) -> Iterator[Tuple[FetchJob, str, float]]:
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT job, fetched_at, codec, dict_id, data FROM pages WHERE id IN ({', '.join('?' * len(chunk))})"
+                " ORDER BY id", chunk)
+            for job, fetched_at, codec, dict_id, data in rows:
+                yield FetchJob(**json.loads(job)), self._decode(codec, dict_id, data).decode("utf-8"), fetched_at
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Pages, raw and stored bytes and compression ratio per source."""
+        rows = self.conn.execute(
+            "SELECT source, COUNT(*), SUM(raw_size), SUM(LENGTH(data)), MAX(dict_id) FROM pages GROUP BY source")
+        return {
+            source: {"pages": pages, "raw_bytes": raw, "stored_bytes": stored,
+                     "ratio": round(raw / stored, 1) if stored else 0.0, "dictionary": bool(dict_id)}
+            for source, pages, raw, stored, dict_id in rows
+        }
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writes.put(None)
+            self._writer.join()
+            self._writer = None
+        self.conn.close()
@@ -0,0 +1,524 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field, asdict, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+from crawl.core.Pipeline import CrawlPipeline, StageConfig
+from crawl.core.Sinks import Sink
+from crawl.core.SourceRegistry import SourceRegistry, SOURCES
+from crawl.core.domain.entity.Pipeline import FetchJob, CrawlRecord
+
+BENCH_DIR = "./bench_results"
+ARTICLE_MARK = "bench-article-"
+
+@dataclass(frozen=True)
+class PageTemplate:
+    """
+    Synthetic page shaped like the real use case's selectors. `listing` wraps the rendered items
+    ({items}, {date}); `item` takes {slug}, {title}, {rank}, {clock} and {published}; `article`
+    takes {body} and {published} and is None for listing-only sources.
+    """
+    item: str
+    listing: str = "<main>{items}</main>"
+    article: Optional[str] = None
+    prefix: str = ""
+
+
+# 가짜 페이지 템플릿: "<host>" 또는 "<host>/<path>" 중 요청 경로와 가장 길게 일치하는 것을 사용합니다.
+# CoinDesk 홈페이지(top stories, most read)는 두 섹션이 한 페이지를 나눠 쓰므로 아직 템플릿이 없습니다.
+PAGE_TEMPLATES: Dict[str, PageTemplate] = {
+    "cointelegraph.com": PageTemplate(
+        item='<div class="post-card-inline"><a class="post-card-inline__figure-link" href="{slug}">{title}</a></div>',
+        article='<div class="post__content-wrapper"><time datetime="{published}"></time>'
+                '<div class="post-content">{body}</div></div>',
+        prefix="/news/",
+    ),
+    "decrypt.co": PageTemplate(
+        item='<div class="linkbox"><a class="linkbox__overlay" href="{slug}">{title}</a></div>',
+        article='<div class="z-2"><time datetime="{published}"></time><div class="post-content">{body}</div></div>',
+    ),
+    "news.bitcoin.com": PageTemplate(
+        item='<div class="sc-fRrnCe"><a class="sc-iDJa-DH" href="{slug}">{title}</a></div>',
+        article='<div class="sc-ledASJ"><time datetime="{published}"></time>'
+                '<div class="article__body">{body}</div></div>',
+    ),
+    "finance.yahoo.com": PageTemplate(
+        item='<a class="subtle-link" href="{slug}">{title}</a>',
+        listing='<div class="stream-items">{items}</div>',
+        article='<div class="body-wrap"><time datetime="{published}"></time><div class="body">{body}</div></div>',
+        prefix="https://finance.yahoo.com/news/",
+    ),
+    "www.coindesk.com/latest-crypto-news": PageTemplate(
+        item='<div class="flex gap-4"><div class="flex flex-col"><a class="text-charcoal-600" href="/markets">Markets</a>'
+             '<a class="text-color-charcoal-900" href="{slug}"><h3>{title}</h3></a>'
+             '<p class="line-clamp-3">{title}</p></div></div>',
+        listing='<div class="flex flex-wrap justify-center flex-col border-0 md:gap-6 mdmax:gap-4 container-mobile-md '
+                'container-tablet-medium container-desktop-lg md:mt-8 mdmax:mt-6 mdmax:mx-0">{items}</div>',
+        prefix="/markets/",
+    ),
+    "cryptonews.com": PageTemplate(
+        item='<div class="archive-template-latest-news__wrap"><a class="archive-template-latest-news" href="{slug}">'
+             '<h5>{title}</h5><div class="archive-template-latest-news__time">{published}</div></a></div>',
+        listing='<div class="main"><div class="container archive-template"><div></div><div><main>'
+                '<div class="archive-template-latest-news-list">{items}</div></main></div></div></div>',
+        prefix="https://cryptonews.com/news/",
+    ),
+    "cryptoslate.com/insights": PageTemplate(
+        item='<article><a href="{slug}"><h2>{title}</h2></a><div class="inner"><span>Bitcoin</span></div>'
+             '<span class="read">{published}</span></article>',
+        listing='<div id="main"><div class="container clearfix"><div class="news-feed slate">'
+                '<div class="list-feed insights icon-feed">{items}</div></div></div></div>',
+        prefix="https://cryptoslate.com/insights/",
+    ),
+    "cryptoslate.com/top-news": PageTemplate(
+        item='<article><a href="{slug}"><h2>{title}</h2></a><div class="post-meta"><span>News</span>'
+             '<span>Bench</span><span class="read">{published}</span></div></article>',
+        listing='<div id="24Hours"><div class="posts">{items}</div></div>',
+        prefix="https://cryptoslate.com/",
+    ),
+    "coinness.com": PageTemplate(
+        item='<div class="BreakingNewsWrap-sc-glfxh-1"><div class="TimeBlock-sc-glfxh-2">{clock}</div>'
+             '<div class="BreakingNewsTitle-sc-glfxh-4"><a href="{slug}">{title}</a></div>'
+             '<div class="BreakingNewsContents-sc-glfxh-5"><span>{title}</span></div>'
+             '<span type="bull">{rank}</span><span type="bear">0</span><span class="QuoteCount-sc-w7d7vw-0">0</span>'
+             '</div>',
+        listing='<div id="root"><div><div class="Wrap-sc-v065lx-0 hwmGSB"><div><main>'
+                '<div class="Wrap-sc-n14h4a-0 izBKQg"><div><div class="Wrap-sc-907me6-0 cjdwpI"><div>{date}</div>'
+                '</div></div></div>{items}</main></div></div></div></div>',
+        prefix="/article/",
+    ),
+}
+BENCH_SOURCES = ("cointelegrap", "decrypt", "bitcoin_news", "yahoo_finance", "coindesk_latest_news", "cryptonews",
+                 "cryptoslate_insights", "cryptoslate_top_news", "coinness_news")
+
+_FILLER = ("Bitcoin and Ethereum traded sideways as ETF flows slowed; analysts at several desks expect "
+           "volatility to return once the macro calendar clears and liquidity improves across venues. ")
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    Latency distribution in milliseconds:
+      fixed:300, uniform:100-900, exp:400, lognormal:600,0.5 (median, sigma)
+    Returns a sampler giving seconds.
+    """
+    kind, _, args = spec.partition(":")
+    try:
+        if kind == "fixed":
+            value = float(args) / 1000
+            return lambda rng: value
+        if kind == "uniform":
+            low, high = (float(v) / 1000 for v in args.split("-"))
+            return lambda rng: rng.uniform(low, high)
+        if kind == "exp":
+            mean = float(args) / 1000
+            return lambda rng: rng.expovariate(1 / mean)
+        if kind == "lognormal":
+            median, sigma = args.split(",")
+            mu = math.log(float(median) / 1000)
+            return lambda rng: rng.lognormvariate(mu, float(sigma))
+    except ValueError:
+        pass
+    raise ValueError(f"Invalid latency spec: {spec!r}")
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class FakeRenderServer:
+    """
+    Local stand-in for the rendering endpoint. Requests are made to /<host><path>?<query>
+    and answered with synthetic listing or article pages after a sampled delay.
+    """
+
+    def __init__(self, latency: str = "lognormal:600,0.5", pages: int = 10, article_kb: int = 8,
+                 listing_kb: int = 64, host: str = "127.0.0.1", port: int = 0, seed: int = 7):
+        self.sample = parse_latency(latency)
+        self.pages = pages
+        self.article_kb = article_kb
+        self.listing_kb = listing_kb
+        self.host = host
+        self.port = port
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.server: Optional[asyncio.AbstractServer] = None
+        self._connections: set = set()
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            # 유지 중인 keep-alive 연결은 직접 닫아야 wait_closed가 끝납니다.
+            for task in self._connections:
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self.server.wait_closed()
+
+    @staticmethod
+    def template(host: str, path: str) -> Optional[PageTemplate]:
+        target = f"{host}/{path}".rstrip("/")
+        matches = [key for key in PAGE_TEMPLATES if target == key or target.startswith(key + "/")]
+        return PAGE_TEMPLATES[max(matches, key=len)] if matches else None
+
+    def render(self, target: str) -> Optional[str]:
+        parts = urlsplit(target)
+        host, _, path = parts.path.lstrip("/").partition("/")
+        template = self.template(host, path)
+        if template is None:
+            return None
+        if ARTICLE_MARK in path:
+            if template.article is None:
+                return None
+            published = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - self.rng.randint(0, 7200)))
+            paragraphs = "".join(f"<p>{_FILLER * 4}</p>" for _ in range(max(1, self.article_kb * 1024 // 800)))
+            return f"<html><body><div class=\"nav\">{_FILLER}</div>" \
+                   f"{template.article.format(body=paragraphs, published=published)}</body></html>"
+
+        clone = parse_qs(parts.query).get("bench", ["0"])[0]
+        section = path.strip("/").replace("/", "-") or "home"
+        now = time.time()
+        links = "".join(
+            template.item.format(slug=f"{template.prefix}{ARTICLE_MARK}{clone}-{section}-{i}", title=f"Story {i}",
+                                 rank=i + 1, clock=time.strftime("%H:%M", time.localtime(now - i * 60)),
+                                 published=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now - i * 60)))
+            for i in range(self.pages))
+        listing = template.listing.format(items=links, date=time.strftime("%Y년 %m월 %d일", time.localtime(now)))
+        noise = f"<div class=\"noise\">{_FILLER}</div>" * max(1, self.listing_kb * 1024 // len(_FILLER))
+        return f"<html><body>{noise}{listing}</body></html>"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                target = lines[0].split(" ")[1] if lines[0].count(" ") >= 2 else "/"
+                keep_alive = not any(line.lower() == "connection: close" for line in lines[1:])
+                self.requests += 1
+                await asyncio.sleep(self.sample(self.rng))
+
+                html = self.render(target)
+                status, body = (200, html.encode("utf-8")) if html is not None else (404, b"not found")
+                writer.write((f"HTTP/1.1 {status} {'OK' if status == 200 else 'Not Found'}\r\n"
+                              "Content-Type: text/html; charset=utf-8\r\n"
+                              f"Content-Length: {len(body)}\r\n"
+                              f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode("latin-1")
+                             + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+
+def build_transport(server: FakeRenderServer, pool_size: int, timings: Dict[str, float]):
+    """Direct HTTP transport registered as "zenrows" that sends every request to the fake server."""
+    from utils.FetchTransport import DirectHttpTransport
+
+    class FakeRenderTransport(DirectHttpTransport):
+        name = "zenrows"
+        supports_js = True
+
+        async def get(self, url: str, wait: int, js_instructions: Optional[str]):
+            parts = urlsplit(url)
+            local = f"http://{server.host}:{server.port}/{parts.netloc}{parts.path}"
+            if parts.query:
+                local += f"?{parts.query}"
+            timings.setdefault(url, time.perf_counter())
+            response = await super().get(local, wait, js_instructions)
+            return replace(response, url=url)
+
+    return FakeRenderTransport(pool_size=pool_size)
+
+
+class BenchRegistry(SourceRegistry):
+    """Registry of `clones` synthetic copies of each source; clones share the real use case classes."""
+
+    def __init__(self, util: Any, names: List[str], clones: int, pages: int):
+        sources = {}
+        for name in names:
+            for clone in range(clones):
+                sources[f"{name}~{clone}"] = replace(SOURCES[name], name=f"{name}~{clone}")
+        super().__init__(util, sources)
+        self.pages = pages
+
+    def use_case(self, name: str) -> Any:
+        use_case = super().use_case(name)
+        if hasattr(use_case, "article_limit"):
+            use_case.article_limit = self.pages
+        return use_case
+
+    def listing_jobs(self, names: List[str], categories: Optional[List[str]] = None) -> List[FetchJob]:
+        jobs = super().listing_jobs(names, categories)
+        for job in jobs:
+            # 복제본마다 다른 URL이 되도록 표시를 붙입니다 (기사 링크도 이 값으로 구분됨).
+            clone = job.source.rsplit("~", 1)[1]
+            job.url += ("&" if "?" in job.url else "?") + f"bench={clone}"
+        return jobs
+
+
+class LatencySink(Sink):
+    """Records, for every item reaching the sink, how long ago its page fetch started."""
+
+    def __init__(self, timings: Dict[str, float], started: float):
+        self.timings = timings
+        self.started = started
+        self.item_latency: List[float] = []
+        self.time_to_item: List[float] = []
+
+    async def write(self, record: CrawlRecord) -> None:
+        now = time.perf_counter()
+        self.time_to_item.append(now - self.started)
+        fetch_started = self.timings.get(record.url)
+        if fetch_started is not None:
+            self.item_latency.append(now - fetch_started)
+
+
+class LoopMonitor:
+    """Samples event-loop lag (how late a short sleep wakes up) and process memory."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.lags: List[float] = []
+        self.peak_rss = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def rss_bytes() -> int:
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            import resource
+
+            # macOS는 바이트, Linux는 KB 단위
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return peak if sys.platform == "darwin" else peak * 1024
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, loop.time() - expected))
+            self.peak_rss = max(self.peak_rss, self.rss_bytes())
+
+    def start(self) -> None:
+        self.peak_rss = self.rss_bytes()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+@dataclass
+class StepResult:
+    clones: int
+    sources: int
+    fetch_workers: int
+    listings: int
+    requests: int
+    items: int
+    fetch_errors: int
+    parse_errors: int
+    seconds: float
+    items_per_second: float
+    pages_per_second: float
+    item_latency_p50: Optional[float]
+    item_latency_p99: Optional[float]
+    time_to_item_p50: Optional[float]
+    time_to_item_p99: Optional[float]
+    loop_lag_p50: Optional[float]
+    loop_lag_p99: Optional[float]
+    loop_lag_max: Optional[float]
+    peak_rss_mb: float
+    peak_traced_mb: Optional[float] = None
+    parse_peak_mb: Optional[float] = None
+    notes: List[str] = field(default_factory=list)
+
+
+def _ms(value: Optional[float]) -> Optional[float]:
+    return round(value * 1000, 1) if value is not None else None
+
+
+async def run_step(server: FakeRenderServer, names: List[str], clones: int, fetch_workers: int,
+                   parse_workers: int, threads: int, memory_budget: Optional[int] = None,
+                   trace_memory: bool = False) -> StepResult:
+    """One crawl of `clones` copies of every source at the given fetch concurrency."""
+    from utils.ZenrowsUtil import ZenrowsUtil
+
+    timings: Dict[str, float] = {}
+    transport = build_transport(server, fetch_workers, timings)
+    util = ZenrowsUtil(transports={"zenrows": transport}, routes=[], memory_budget=memory_budget)
+    registry = BenchRegistry(util, names, clones, server.pages)
+    bench_names = registry.names()
+    listings = len(registry.listing_jobs(bench_names))
+    requests_before = server.requests
+
+    started = time.perf_counter()
+    sink = LatencySink(timings, started)
+    monitor = LoopMonitor()
+    config = StageConfig(fetch_workers=fetch_workers, parse_workers=parse_workers,
+                         queue_size=max(64, fetch_workers * 2))
+    if trace_memory:
+        tracemalloc.start()
+    monitor.start()
+    try:
+        stats = await CrawlPipeline(registry, [sink], config).run(bench_names)
+    finally:
+        await monitor.stop()
+        traced_peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        if trace_memory:
+            tracemalloc.stop()
+        util.close()
+    seconds = time.perf_counter() - started
+
+    notes = []
+    if fetch_workers > threads:
+        notes.append("fetch workers exceed the thread pool size; fetches queue for threads")
+    return StepResult(
+        clones=clones, sources=len(bench_names), fetch_workers=fetch_workers, listings=listings,
+        requests=server.requests - requests_before, items=stats.written,
+        fetch_errors=stats.fetch_errors, parse_errors=stats.parse_errors, seconds=round(seconds, 3),
+        items_per_second=round(stats.written / seconds, 2) if seconds else 0.0,
+        pages_per_second=round(stats.fetched / seconds, 2) if seconds else 0.0,
+        item_latency_p50=_ms(percentile(sink.item_latency, 50)),
+        item_latency_p99=_ms(percentile(sink.item_latency, 99)),
+        time_to_item_p50=_ms(percentile(sink.time_to_item, 50)),
+        time_to_item_p99=_ms(percentile(sink.time_to_item, 99)),
+        loop_lag_p50=_ms(percentile(monitor.lags, 50)),
+        loop_lag_p99=_ms(percentile(monitor.lags, 99)),
+        loop_lag_max=_ms(max(monitor.lags) if monitor.lags else None),
+        peak_rss_mb=round(monitor.peak_rss / 1024 / 1024, 1),
+        peak_traced_mb=round(traced_peak / 1024 / 1024, 1) if traced_peak is not None else None,
+        parse_peak_mb=round(util.budget.peak / 1024 / 1024, 1) if util.budget else None,
+        notes=notes,
+    )
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Throughput and p99 changes for steps present in both reports."""
+    previous = {(s["clones"], s["fetch_workers"]): s for s in baseline.get("steps", [])}
+    lines = []
+    for step in current["steps"]:
+        before = previous.get((step["clones"], step["fetch_workers"]))
+        if before is None or not before["items_per_second"]:
+            continue
+        change = (step["items_per_second"] / before["items_per_second"] - 1) * 100
+        lines.append(f"x{step['clones']:<4} workers={step['fetch_workers']:<4} "
+                     f"items/s {before['items_per_second']} → {step['items_per_second']} ({change:+.1f}%), "
+                     f"p99 {before['item_latency_p99']} → {step['item_latency_p99']} ms")
+    return lines
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Synthetic load test of the crawl pipeline.")
+    parser.add_argument("-s", "--source", dest="sources", action="append", choices=BENCH_SOURCES,
+                        help="Source to clone (repeatable). Defaults to all sources with page templates.")
+    parser.add_argument("--scale", default="1,10,100",
+                        help="Comma-separated clone counts per source (1 = today's source count).")
+    parser.add_argument("--workers", default="4,16,64", help="Comma-separated fetch worker counts.")
+    parser.add_argument("--parse-workers", type=int, default=2)
+    parser.add_argument("--pages", type=int, default=10, help="Articles per listing page.")
+    parser.add_argument("--latency", default="lognormal:600,0.5",
+                        help="Render latency in ms: fixed:N, uniform:A-B, exp:MEAN or lognormal:MEDIAN,SIGMA.")
+    parser.add_argument("--article-kb", type=int, default=8)
+    parser.add_argument("--listing-kb", type=int, default=64)
+    parser.add_argument("--threads", type=int, help="Size of the thread pool used for blocking HTTP calls.")
+    parser.add_argument("--memory-budget", type=int, default=0, metavar="MB")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Also report the Python heap peak (tracemalloc; slows the run).")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--baseline", help="Previous report to compare against.")
+    parser.add_argument("-o", "--output", default=BENCH_DIR, help="Directory for the JSON report.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Keep the crawler's per-request output.")
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    names = args.sources or list(BENCH_SOURCES)
+    # asyncio.to_thread의 기본 스레드 풀 크기와 같게 맞춥니다.
+    threads = args.threads or min(32, (os.cpu_count() or 1) + 4)
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(threads))
+
+    server = FakeRenderServer(args.latency, args.pages, args.article_kb, args.listing_kb, seed=args.seed)
+    await server.start()
+    print(f"✅ Fake render endpoint on http://{server.host}:{server.port} ({args.latency})")
+
+    steps = []
+    try:
+        for clones in (int(v) for v in args.scale.split(",")):
+            for workers in (int(v) for v in args.workers.split(",")):
+                with open(os.devnull, "w") as devnull, redirect_stdout(sys.stdout if args.verbose else devnull):
+                    result = await run_step(server, names, clones, workers, args.parse_workers, threads,
+                                            args.memory_budget * 1024 * 1024 or None, args.trace_memory)
+                steps.append(asdict(result))
+                print(f"x{clones:<4} workers={workers:<4} {result.items} items in {result.seconds}s "
+                      f"({result.items_per_second}/s), item p50/p99 {result.item_latency_p50}/"
+                      f"{result.item_latency_p99} ms, loop lag p99 {result.loop_lag_p99} ms, "
+                      f"rss {result.peak_rss_mb} MB")
+    finally:
+        await server.stop()
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "threads": threads,
+        "config": {key: value for key, value in vars(args).items() if key not in ("baseline", "output", "verbose")},
+        "steps": steps,
+    }
+    os.makedirs(args.output, exist_ok=True)
+    path = os.path.join(args.output, f"loadbench_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"✅ Report written to {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            for line in compare(report, json.load(f)):
+                print(line)
+    return report
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
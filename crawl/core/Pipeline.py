@@ -0,0 +1,336 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from crawl.core.SourceRegistry import SourceRegistry
+from crawl.core.Frontier import BODY_KIND, CrawlFrontier
+from crawl.core.Sinks import Sink
+from crawl.core.domain.entity.Pipeline import FetchJob, CrawlRecord
+from utils.CreditLedger import BudgetExceeded
+from utils.Deadline import Deadline, DeadlineExceeded, current_deadline
+
+# record를 받아 수정된 record를 반환하거나, None을 반환해 버립니다.
+Enricher = Callable[[CrawlRecord], Optional[CrawlRecord]]
+
+
+@dataclass
+class StageConfig:
+    fetch_workers: int = 4
+    parse_workers: int = 2
+    enrich_workers: int = 1
+    sink_workers: int = 1
+    body_workers: int = 4
+    queue_size: int = 64
+
+
+@dataclass
+class PipelineStats:
+    fetched: int = 0
+    fetch_errors: int = 0
+    budget_skipped: int = 0
+    deadline_skipped: int = 0
+    parsed: int = 0
+    structured: int = 0  # DOM 없이 내장 JSON으로 파싱한 페이지
+    extracted: int = 0  # 원격 CSS 추출로 HTML 없이 받은 페이지
+    parse_errors: int = 0
+    items: int = 0
+    written: int = 0
+    per_source: Dict[str, int] = field(default_factory=dict)
+    partial: List[str] = field(default_factory=list)  # 마감 시각에 걸린 소스
+    incomplete: List[str] = field(default_factory=list)  # 가져오지 못한 페이지가 있는 결과 이름 (마감, 예산, 오류)
+    via_feed: List[str] = field(default_factory=list)  # 피드로 탐색한 소스
+
+
+class CrawlPipeline:
+    """
+    fetch → parse → enrich → sink stages joined by bounded queues.
+    Parsers may emit follow-up jobs (e.g. article pages), which go back to the fetch stage.
+    """
+
+    def __init__(self, registry: SourceRegistry, sinks: List[Sink], config: Optional[StageConfig] = None,
+                 enrichers: Optional[List[Enricher]] = None, sla: Optional[float] = None,
+                 deadline: Optional[float] = None, source_deadlines: Optional[Dict[str, float]] = None,
+                 archive: Any = None, frontier: Optional[CrawlFrontier] = None, discovery: Any = None):
+        self.registry = registry
+        self.util = registry.util
+        self.sinks = sinks
+        self.config = config or StageConfig()
+        self.enrichers = enrichers or []
+        self.stats = PipelineStats()
+        # 실행 전체(sla)와 소스별(deadline, source_deadlines) 마감, 초 단위로 실행 시작부터 계산
+        self.sla = sla
+        self.deadline = deadline
+        self.source_deadlines = source_deadlines or {}
+        self._deadlines: Dict[str, Optional[Deadline]] = {}
+        # 가져온 원본 HTML을 재파싱용으로 보관 (HtmlArchive)
+        self.archive = archive
+        # 목록 전용 소스의 기사 본문을 가져올 대기열 (CrawlFrontier)
+        self.frontier = frontier
+        # 피드 우선 탐색 (FeedDiscovery); 없거나 오래된 피드의 소스만 목록 페이지를 렌더링
+        self.discovery = discovery
+        # 모든 싱크에 쓰였지만 배치로 모아 두는 싱크가 아직 전달하지 않은 피드 항목
+        self._undelivered: List[str] = []
+
+        # 후속 작업은 parse 단계에서 다시 넣으므로 fetch 큐는 제한하지 않습니다 (교착 방지).
+        self.fetch_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.parse_queue: asyncio.Queue = asyncio.Queue(self.config.queue_size)
+        self.enrich_queue: asyncio.Queue = asyncio.Queue(self.config.queue_size)
+        self.sink_queue: asyncio.Queue = asyncio.Queue(self.config.queue_size)
+
+        self._sequence = 0
+        self._outstanding = 0
+        self._jobs_done = asyncio.Event()
+
+    def submit(self, job: FetchJob) -> None:
+        """Queue a fetch job; ties on priority keep submission order."""
+        self._sequence += 1
+        self._outstanding += 1
+        self._jobs_done.clear()
+        self.fetch_queue.put_nowait((job.priority, self._sequence, job))
+
+    def _mark_incomplete(self, job: FetchJob) -> None:
+        name = self.registry.spec(job.source).result_name(job.category)
+        if name not in self.stats.incomplete:
+            self.stats.incomplete.append(name)
+
+    def _job_finished(self) -> None:
+        self._outstanding -= 1
+        if self._outstanding == 0:
+            self._jobs_done.set()
+
+    async def _fetch(self, job: FetchJob) -> bool:
+        """Fetch one page and hand it to the parse stage; False when it was skipped or failed."""
+        token = current_deadline.set(self._deadlines.get(job.source))
+        try:
+            if await self._fetch_extracted(job):
+                return True
+            html = await self.util.fetch_html(job.url, job.wait, job.js_instructions,
+                                              source=job.source, priority=job.priority)
+            self.stats.fetched += 1
+            fetched_at = time.time()
+            if self.archive is not None:
+                self.archive.put(job, html, fetched_at)
+            await self.parse_queue.put((job, html, fetched_at))
+            return True
+        except DeadlineExceeded:
+            # 이미 가져온 페이지는 계속 파싱되어 부분 결과로 나갑니다.
+            self.stats.deadline_skipped += 1
+            if job.source not in self.stats.partial:
+                self.stats.partial.append(job.source)
+            self._mark_incomplete(job)
+        except BudgetExceeded as e:
+            self.stats.budget_skipped += 1
+            self._mark_incomplete(job)
+            print(f"⚠️ {e}")
+        except Exception as e:
+            self.stats.fetch_errors += 1
+            self._mark_incomplete(job)
+            print(f"❌ Failed to fetch {job.url}: {e}")
+        finally:
+            current_deadline.reset(token)
+        self._job_finished()
+        return False
+
+    async def _fetch_extracted(self, job: FetchJob) -> bool:
+        """Fetch a listing through remote extraction and emit its items directly; False to fetch the page."""
+        if job.kind == BODY_KIND or not self.util.remote_extraction:
+            return False
+        spec = self.registry.extract_spec(job)
+        if spec is None:
+            return False
+        rows = await self.util.fetch_extracted(job.url, job.wait, job.js_instructions, spec,
+                                               source=job.source, priority=job.priority)
+        if not rows:
+            return False
+        self.stats.fetched += 1
+        self.stats.extracted += 1
+        items = self.registry.use_case(job.source).parse_extracted(job, rows)
+        if self.util.ledger is not None:
+            self.util.ledger.record_yield(job.source, job.url, len(items))
+        await self._emit(job, items, time.time())
+        self._job_finished()
+        return True
+
+    async def _fetch_worker(self) -> None:
+        while True:
+            _, _, job = await self.fetch_queue.get()
+            try:
+                await self._fetch(job)
+            finally:
+                self.fetch_queue.task_done()
+
+    async def _body_worker(self) -> None:
+        """Fetch article bodies from the frontier, which enforces per-host limits."""
+        while True:
+            job = await self.frontier.next()
+            fetched = False
+            try:
+                fetched = await self._fetch(job)
+            finally:
+                self.frontier.done(job, fetched)
+
+    async def _parse_worker(self) -> None:
+        while True:
+            job, html, fetched_at = await self.parse_queue.get()
+            try:
+                result = None
+                if job.kind != BODY_KIND and self.util.structured_data:
+                    result = self.registry.parse_raw(job, html)
+                if result is not None:
+                    items, follow_ups = result
+                    self.stats.structured += 1
+                else:
+                    async with self.util.parsed(html) as soup:
+                        del html
+                        if job.kind == BODY_KIND:
+                            items, follow_ups = self.frontier.parse(job, soup), []
+                        else:
+                            items, follow_ups = self.registry.use_case(job.source).parse_job(job, soup)
+                self.stats.parsed += 1
+                if self.util.ledger is not None:
+                    self.util.ledger.record_yield(job.source, job.url, len(items) + len(follow_ups))
+
+                for follow_up in follow_ups:
+                    self.submit(follow_up)
+                await self._emit(job, items, fetched_at)
+            except Exception as e:
+                self.stats.parse_errors += 1
+                self._mark_incomplete(job)
+                print(f"❌ Failed to parse {job.url}: {e}")
+            finally:
+                self._job_finished()
+                self.parse_queue.task_done()
+
+    def _feed_origin(self, job: FetchJob, item: Any) -> Optional[str]:
+        """The feed entry URL an item came from (the article job, or the entry itself), if still pending."""
+        if self.discovery is None:
+            return None
+        for url in (job.url, getattr(item, "url", None)):
+            if url and self.discovery.is_pending(url):
+                return url
+        return None
+
+    async def _emit(self, job: FetchJob, items: List[Any], fetched_at: float) -> None:
+        """Send a page's items downstream and offer their URLs to the frontier."""
+        if self.frontier is not None and job.kind != BODY_KIND:
+            queued = self.frontier.offer(job, items)
+            self._outstanding += queued
+            if queued:
+                self._jobs_done.clear()
+        if not items and self.discovery is not None and self.discovery.is_pending(job.url):
+            # 피드에서 찾은 기사에서 항목이 나오지 않으면 다시 가져와도 같으므로 처리한 것으로 봅니다.
+            self.discovery.mark_seen(job.url)
+
+        name = self.registry.spec(job.source).result_name(job.category)
+        for item in items:
+            self.stats.items += 1
+            record = CrawlRecord(source=name, kind=job.kind, item=item, url=getattr(item, "url", None) or job.url,
+                                 fetched_at=fetched_at)
+            await self.enrich_queue.put((record, self._feed_origin(job, item)))
+
+    async def _enrich_worker(self) -> None:
+        while True:
+            record, origin = await self.enrich_queue.get()
+            source = record.source
+            try:
+                for enrich in self.enrichers:
+                    record = enrich(record)
+                    if record is None:
+                        break
+                if record is not None:
+                    await self.sink_queue.put((record, origin))
+                elif origin is not None:
+                    # 의도적으로 버린 항목도 처리가 끝난 것입니다.
+                    self.discovery.mark_seen(origin)
+            except Exception as e:
+                print(f"❌ Failed to enrich record from {source}: {e}")
+            finally:
+                self.enrich_queue.task_done()
+
+    async def _sink_worker(self) -> None:
+        while True:
+            record, origin = await self.sink_queue.get()
+            try:
+                written = True
+                for sink in self.sinks:
+                    try:
+                        await sink.write(record)
+                    except Exception as e:
+                        written = False
+                        print(f"❌ Sink {type(sink).__name__} failed: {e}")
+                if not written:
+                    # 실패한 쓰기가 앞서 모아 둔 배치를 함께 잃었을 수 있으므로 대기 중인 항목도 다음 실행에서 다시 탐색합니다.
+                    self._undelivered.clear()
+                elif origin is not None:
+                    self._undelivered.append(origin)
+                if not any(sink.undelivered() for sink in self.sinks):
+                    self._mark_delivered()
+                self.stats.written += 1
+                self.stats.per_source[record.source] = self.stats.per_source.get(record.source, 0) + 1
+            finally:
+                self.sink_queue.task_done()
+
+    def _mark_delivered(self) -> None:
+        """Record feed entries as seen once every sink has delivered their items."""
+        for origin in self._undelivered:
+            self.discovery.mark_seen(origin)
+        self._undelivered.clear()
+
+    def _start_workers(self) -> List[asyncio.Task]:
+        stages: List[Tuple[Callable[[], Any], int]] = [
+            (self._fetch_worker, self.config.fetch_workers),
+            (self._parse_worker, self.config.parse_workers),
+            (self._enrich_worker, self.config.enrich_workers),
+            (self._sink_worker, self.config.sink_workers),
+        ]
+        if self.frontier is not None:
+            stages.append((self._body_worker, self.config.body_workers))
+        return [asyncio.create_task(worker()) for worker, count in stages for _ in range(max(1, count))]
+
+    async def run(self, names: List[str], categories: Optional[List[str]] = None) -> PipelineStats:
+        """Crawl the selected sources, streaming every parsed item through to the sinks."""
+        for sink in self.sinks:
+            await sink.open()
+
+        run_deadline = asyncio.get_running_loop().time() + self.sla if self.sla else None
+        self._deadlines = {
+            name: Deadline.after(self.source_deadlines.get(name, self.deadline), run_deadline) for name in names
+        }
+
+        feed_entries = []
+        if self.discovery is not None:
+            found = await self.discovery.discover(self.registry, names, categories)
+            jobs, feed_entries = found.jobs, found.entries
+            self.stats.via_feed = found.via_feed
+        else:
+            jobs = self.registry.listing_jobs(names, categories)
+        for job in jobs:
+            self.submit(job)
+
+        workers = self._start_workers()
+        try:
+            for feed_job, entries in feed_entries:
+                await self._emit(feed_job, entries, time.time())
+            if self._outstanding == 0:
+                self._jobs_done.set()
+            await self._jobs_done.wait()
+            await self.enrich_queue.join()
+            await self.sink_queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            delivered = True
+            for sink in self.sinks:
+                try:
+                    await sink.close()
+                except Exception as e:
+                    delivered = False
+                    print(f"❌ Sink {type(sink).__name__} failed to close: {e}")
+            if delivered:
+                # 마지막 배치까지 전달된 뒤에야 남은 피드 항목을 본 것으로 기록합니다.
+                self._mark_delivered()
+            self._undelivered.clear()
+
+        return self.stats
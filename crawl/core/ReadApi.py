@@ -0,0 +1,249 @@
+import asyncio
+import gzip
+import hashlib
+import heapq
+import json
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+from crawl.core.Sinks import Sink
+from crawl.core.TimeIndex import TimeIndex
+from crawl.core.domain.entity.Pipeline import CrawlRecord
+
+MAX_HEADER_BYTES = 16 * 1024
+GZIP_MIN_BYTES = 512
+
+_REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+class ResultStore:
+    """
+    Latest items per source, held in memory with cached encoded responses. With a CoinIndex,
+    coin queries are answered from its postings instead of scanning every source's items,
+    keeping only the postings that are still among the published items.
+    """
+
+    def __init__(self, cache_size: int = 256, coin_index: Any = None):
+        self.coin_index = coin_index
+        self.sources: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_time: Dict[str, TimeIndex] = {}
+        self._by_url: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.updated_at: Dict[str, float] = {}
+        self.version = 0
+        self._cache: "OrderedDict[Tuple, Tuple[str, bytes, bytes]]" = OrderedDict()
+        self._cache_size = cache_size
+
+    def replace(self, source: str, items: List[Dict[str, Any]]) -> None:
+        """Swap in a source's latest items; readers never see a half-updated list."""
+        by_time = TimeIndex()
+        by_time.extend([(self._timestamp(entry), entry) for entry in items])
+        self.sources[source] = items
+        self._by_time[source] = by_time
+        self._by_url[source] = {entry["url"]: entry for entry in items}
+        self.updated_at[source] = time.time()
+        self.version += 1
+        self._cache.clear()
+
+    @staticmethod
+    def _timestamp(entry: Dict[str, Any]) -> float:
+        published = entry["item"].get("published_ts")
+        return published if published is not None else entry.get("fetched_at", 0)
+
+    @staticmethod
+    def _coins(entry: Dict[str, Any]) -> List[str]:
+        tags = [coin.upper() for coin in entry["item"].get("coin_tags") or []]
+        return tags + entry.get("meta", {}).get("coins", [])
+
+    def query(self, sources: Optional[List[str]] = None, since: Optional[float] = None,
+              until: Optional[float] = None, coin: Optional[str] = None, limit: int = 200) -> List[Dict[str, Any]]:
+        """Newest entries first, merged from each source's time index over since <= timestamp < until."""
+        selected = sources or list(self.sources)
+        coin = coin.upper() if coin else None
+        if coin and self.coin_index is not None:
+            # CoinIndex는 실행을 넘어 누적되므로 현재 게시된 항목에 있는 것만 돌려줍니다.
+            published = {source: self._by_url[source] for source in selected if source in self._by_url}
+            records = self.coin_index.lookup(coin, since, until, newest_first=True)
+            entries = (published.get(record.source, {}).get(record.url) for record in records)
+            return list(islice((entry for entry in entries if entry is not None), limit))
+        start = since if since is not None else float("-inf")
+        end = until if until is not None else float("inf")
+        ranges = [reversed(self._by_time[source].between(start, end))
+                  for source in selected if source in self._by_time]
+        results = heapq.merge(*ranges, key=self._timestamp, reverse=True)
+        if coin:
+            results = (entry for entry in results if coin in self._coins(entry))
+        return list(islice(results, limit))
+
+    def response(self, key: Tuple, build) -> Tuple[str, bytes, bytes]:
+        """Encoded body, its gzip form and ETag for a query, cached until the next update."""
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        body = json.dumps(build(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        # 다른 소스가 갱신돼도 응답 본문이 같으면 304를 돌려줄 수 있도록 본문만 해시합니다.
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        compressed = gzip.compress(body, compresslevel=5) if len(body) >= GZIP_MIN_BYTES else b""
+        cached = (etag, body, compressed)
+        self._cache[key] = cached
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return cached
+
+
+class StoreSink(Sink):
+    """
+    Pipeline sink that publishes each run's records into a ResultStore when the run ends.
+    With `merge`, a run's records are added in front of the source's previous items instead of
+    replacing them (for runs that only discover new items, e.g. from feeds).
+    """
+
+    def __init__(self, store: ResultStore, merge: bool = False, keep: int = 500):
+        self.store = store
+        self.merge = merge
+        self.keep = keep
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+
+    async def open(self) -> None:
+        self._pending = {}
+
+    async def write(self, record: CrawlRecord) -> None:
+        self._pending.setdefault(record.source, []).append(record.to_dict())
+
+    async def close(self) -> None:
+        for source, items in self._pending.items():
+            if self.merge:
+                urls = {entry["url"] for entry in items}
+                items = (items + [entry for entry in self.store.sources.get(source, [])
+                                  if entry["url"] not in urls])[:self.keep]
+            self.store.replace(source, items)
+        self._pending = {}
+
+
+class ReadApi:
+    """
+    Minimal asyncio HTTP/1.1 server over a ResultStore.
+      GET /sources
+      GET /items?source=a,b&since=<epoch>&until=<epoch>&minutes=<n>&coin=BTC&limit=<n>
+      GET /sentiment?coin=BTC  (when a SentimentAggregator is attached)
+      GET /trending?limit=<n>  (when a TrendDetector is attached)
+    """
+
+    def __init__(self, store: ResultStore, host: str = "127.0.0.1", port: int = 8080, sentiment: Any = None,
+                 trends: Any = None):
+        self.store = store
+        self.sentiment = sentiment
+        self.trends = trends
+        self.host = host
+        self.port = port
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        print(f"✅ Read API listening on http://{self.host}:{self.port}")
+
+    async def stop(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    def _route(self, path: str, params: Dict[str, List[str]]) -> Tuple[int, Optional[Tuple], Any]:
+        if path == "/sources":
+            key = ("sources",)
+            return 200, key, lambda: {
+                name: {"count": len(items), "updated_at": self.store.updated_at.get(name)}
+                for name, items in self.store.sources.items()
+            }
+        if path == "/items":
+            def first(name: str) -> Optional[str]:
+                return params.get(name, [None])[0]
+
+            try:
+                sources = [s for s in (first("source") or "").split(",") if s] or None
+                since = float(first("since")) if first("since") else None
+                until = float(first("until")) if first("until") else None
+                if first("minutes"):
+                    # 분 단위 요청은 캐시 키가 매번 달라지지 않도록 10초 단위로 맞춥니다.
+                    since = (int(time.time()) // 10 * 10) - float(first("minutes")) * 60
+                limit = int(first("limit") or 200)
+            except ValueError:
+                return 400, None, {"error": "invalid query"}
+            coin = first("coin")
+            key = ("items", tuple(sources or ()), since, until, coin, limit)
+            return 200, key, lambda: {"items": self.store.query(sources, since, until, coin, limit)}
+        if path == "/sentiment" and self.sentiment is not None:
+            # 집계는 시간에 따라 바뀌므로 캐시하지 않습니다.
+            return 200, None, self.sentiment.snapshot(params.get("coin", [None])[0])
+        if path == "/trending" and self.trends is not None:
+            try:
+                limit = int(params.get("limit", ["20"])[0])
+            except ValueError:
+                return 400, None, {"error": "invalid query"}
+            return 200, None, {"trending": self.trends.trending(limit=limit)}
+        return 404, None, {"error": "not found"}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                if len(head) > MAX_HEADER_BYTES:
+                    break
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._send(writer, 400, b'{"error":"bad request"}', {}, keep_alive=False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+                if method not in ("GET", "HEAD"):
+                    await self._send(writer, 405, b'{"error":"method not allowed"}', {}, keep_alive)
+                else:
+                    await self._respond(writer, method, target, headers, keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, method: str, target: str,
+                       headers: Dict[str, str], keep_alive: bool) -> None:
+        parts = urlsplit(target)
+        status, key, payload = self._route(parts.path, parse_qs(parts.query))
+        if key is None:
+            body = json.dumps(payload).encode("utf-8")
+            await self._send(writer, status, body, {}, keep_alive)
+            return
+
+        etag, body, compressed = self.store.response(key, payload)
+        extra = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if headers.get("if-none-match") == etag:
+            await self._send(writer, 304, b"", extra, keep_alive)
+            return
+        if compressed and "gzip" in headers.get("accept-encoding", ""):
+            body = compressed
+            extra["Content-Encoding"] = "gzip"
+        await self._send(writer, status, b"" if method == "HEAD" else body, extra, keep_alive,
+                         content_length=len(body))
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, status: int, body: bytes, headers: Dict[str, str],
+                    keep_alive: bool, content_length: Optional[int] = None) -> None:
+        lines = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+                 "Content-Type: application/json; charset=utf-8",
+                 f"Content-Length: {len(body) if content_length is None else content_length}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
@@ -0,0 +1,152 @@
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from crawl.core.Frontier import BODY_KIND, CrawlFrontier
+from crawl.core.HtmlArchive import HtmlArchive
+from crawl.core.SourceRegistry import SourceRegistry
+from crawl.core.domain.entity.Pipeline import CrawlRecord
+
+CHUNK_PAGES = 200
+
+# 작업 프로세스마다 한 번만 여는 아카이브와 레지스트리
+_archive: Optional[HtmlArchive] = None
+_registry: Optional[SourceRegistry] = None
+
+
+class OfflineUtil:
+    """
+    Stands in for ZenrowsUtil in the re-parse workers: carries the flags the use cases read
+    and refuses to fetch, since re-parsing never touches the network.
+    """
+    remote_extraction = False
+    ledger = None
+
+    def __init__(self, structured_data: bool = True):
+        self.structured_data = structured_data
+
+    async def fetch_html(self, url: str, *args: Any, **kwargs: Any) -> str:
+        raise RuntimeError(f"No network access while re-parsing ({url})")
+
+
+def _init_worker(directory: str, structured: bool) -> None:
+    global _archive, _registry
+    _archive = HtmlArchive(directory)
+    # 파싱만 하므로 HTTP 클라이언트는 필요 없습니다.
+    _registry = SourceRegistry(OfflineUtil(structured))
+
+
+def _parse_chunk(ids: List[int]) -> Tuple[List[CrawlRecord], int, int]:
+    """Run the current parsers over a chunk of archived pages: (records, pages parsed, errors)."""
+    records, parsed, errors = [], 0, 0
+    for job, html, fetched_at in _archive.pages(ids):
+        try:
+            result = None
+            if job.kind != BODY_KIND and _registry.util.structured_data:
+                result = _registry.parse_raw(job, html)
+            if result is None:
+                soup = BeautifulSoup(html, "html.parser")
+                try:
+                    if job.kind == BODY_KIND:
+                        # 프런티어가 가져온 기사 본문은 사이트별 파서 없이 추출합니다 (Pipeline과 동일).
+                        result = CrawlFrontier.parse(job, soup), []
+                    else:
+                        result = _registry.use_case(job.source).parse_job(job, soup)
+                finally:
+                    soup.decompose()
+            items, _ = result
+            parsed += 1
+        except Exception as e:
+            errors += 1
+            print(f"❌ Failed to re-parse {job.url}: {e}")
+            continue
+        name = _registry.spec(job.source).result_name(job.category)
+        records.extend(
+            CrawlRecord(source=name, kind=job.kind, item=item, url=getattr(item, "url", None) or job.url,
+                        fetched_at=fetched_at, meta={"reparsed_at": time.time()})
+            for item in items)
+    return records, parsed, errors
+
+
+async def reparse(directory: str, sinks: List[Any], sources: Optional[List[str]] = None,
+                  since: Optional[float] = None, until: Optional[float] = None, latest: bool = True,
+                  workers: Optional[int] = None, structured: bool = True) -> Dict[str, int]:
+    """Re-parse archived pages on every core and write the records to the sinks; no network access."""
+    archive = HtmlArchive(directory)
+    try:
+        ids = archive.page_ids(sources, since, until, latest)
+    finally:
+        archive.close()
+    chunks = [ids[start:start + CHUNK_PAGES] for start in range(0, len(ids), CHUNK_PAGES)]
+    stats = {"pages": len(ids), "parsed": 0, "errors": 0, "items": 0}
+
+    for sink in sinks:
+        await sink.open()
+    loop = asyncio.get_running_loop()
+    try:
+        with ProcessPoolExecutor(workers or os.cpu_count(), initializer=_init_worker,
+                                 initargs=(directory, structured)) as pool:
+            futures = [loop.run_in_executor(pool, _parse_chunk, chunk) for chunk in chunks]
+            for future in asyncio.as_completed(futures):
+                records, parsed, errors = await future
+                stats["parsed"] += parsed
+                stats["errors"] += errors
+                stats["items"] += len(records)
+                for record in records:
+                    for sink in sinks:
+                        await sink.write(record)
+    finally:
+        for sink in sinks:
+            await sink.close()
+    return stats
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-run the current parsers over the raw HTML archive.")
+    parser.add_argument("archive", help="Archive directory (as passed to --archive when crawling).")
+    parser.add_argument("-s", "--source", dest="sources", action="append", help="Source to re-parse (repeatable).")
+    parser.add_argument("--since", type=float, help="Only pages fetched at or after this epoch.")
+    parser.add_argument("--until", type=float, help="Only pages fetched before this epoch.")
+    parser.add_argument("--all-versions", action="store_true",
+                        help="Re-parse every archived copy instead of only the newest copy of each page.")
+    parser.add_argument("-w", "--workers", type=int, help="Worker processes (default: all cores).")
+    parser.add_argument("--sink", dest="sinks", action="append",
+                        help='Output: "stdout", "file:<dir>", "sqlite:<path>" or a webhook URL (repeatable).')
+    parser.add_argument("--dom-only", action="store_true",
+                        help="Parse the DOM even where pages embed JSON-LD/hydration data.")
+    parser.add_argument("--stats", action="store_true", help="Only print archive size and compression per source.")
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    from crawl.core.Sinks import build_sink
+
+    args = parse_args(argv)
+    if args.stats:
+        archive = HtmlArchive(args.archive)
+        try:
+            stats = archive.stats()
+        finally:
+            archive.close()
+        for source, row in stats.items():
+            print(f"{source:<24} {row['pages']:>7} pages {row['raw_bytes'] / 1e6:>9.1f} MB → "
+                  f"{row['stored_bytes'] / 1e6:>7.1f} MB (x{row['ratio']}{', dict' if row['dictionary'] else ''})")
+        return stats
+
+    sinks = [build_sink(spec) for spec in (args.sinks or [f"file:{os.path.join(args.archive, 'reparsed')}"])]
+    started = time.time()
+    stats = await reparse(args.archive, sinks, args.sources, args.since, args.until,
+                          latest=not args.all_versions, workers=args.workers,
+                          structured=not args.dom_only)
+    print(f"✅ Re-parsed {stats['parsed']}/{stats['pages']} pages into {stats['items']} items "
+          f"in {time.time() - started:.1f}s ({stats['errors']} errors)")
+    return stats
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
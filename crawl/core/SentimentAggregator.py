@@ -0,0 +1,182 @@
+import json
+import os
+import time
+from dataclasses import asdict, is_dataclass
+from typing import Dict, List, Optional, Tuple
+
+from crawl.core.DeltaFeed import item_key
+from crawl.core.TimeIndex import record_timestamp
+from crawl.core.domain.entity.Pipeline import CrawlRecord
+
+DEFAULT_WINDOWS = {"5m": 300, "1h": 3600, "24h": 86400}
+MARKET = "*"  # 코인 태그와 무관한 전체 합계
+
+Counts = List[int]  # [bull, bear, quote]
+
+
+def _add(target: Counts, delta: Counts, sign: int = 1) -> None:
+    for i in range(3):
+        target[i] += sign * delta[i]
+
+
+class _CoinWindows:
+    """Per-coin time buckets plus a running total for each window."""
+
+    def __init__(self, windows: Dict[str, int], bucket_seconds: int):
+        self.bucket_seconds = bucket_seconds
+        self.spans = {name: max(1, seconds // bucket_seconds) for name, seconds in windows.items()}
+        self.buckets: Dict[int, Counts] = {}
+        self.totals: Dict[str, Counts] = {name: [0, 0, 0] for name in windows}
+        self.starts: Dict[str, int] = {name: 0 for name in windows}
+        self.all_time: Counts = [0, 0, 0]
+        self.current = 0
+
+    def advance(self, now_bucket: int) -> None:
+        """Slide every window forward, subtracting buckets that fell out (amortised O(1) per bucket)."""
+        if now_bucket <= self.current:
+            return
+        self.current = now_bucket
+        for name, span in self.spans.items():
+            start = self.starts[name]
+            new_start = now_bucket - span + 1
+            if new_start - start > len(self.buckets):
+                # 오래 비어 있던 경우: 남은 버킷만 빼고 바로 이동
+                for index, counts in self.buckets.items():
+                    if start <= index < new_start:
+                        _add(self.totals[name], counts, -1)
+                start = new_start
+            while start < new_start:
+                counts = self.buckets.get(start)
+                if counts:
+                    _add(self.totals[name], counts, -1)
+                start += 1
+            self.starts[name] = start
+        oldest = now_bucket - max(self.spans.values()) + 1
+        for index in [index for index in self.buckets if index < oldest]:
+            del self.buckets[index]
+
+    def apply(self, bucket: int, delta: Counts) -> None:
+        _add(self.all_time, delta)
+        if bucket > self.current:
+            self.advance(bucket)
+        if bucket < self.current - max(self.spans.values()) + 1:
+            return
+        _add(self.buckets.setdefault(bucket, [0, 0, 0]), delta)
+        for name in self.spans:
+            if self.starts[name] <= bucket <= self.current:
+                _add(self.totals[name], delta)
+
+
+class SentimentAggregator:
+    """
+    Rolling bull/bear/quote totals per coin and window, updated from Coinness items.
+    Each observation only applies the change since the item was last seen, so the same
+    item re-crawled with new counts moves the totals by the difference. Items are forgotten
+    once their bucket leaves the longest window; older items are not counted again.
+    """
+
+    def __init__(self, windows: Optional[Dict[str, int]] = None, bucket_seconds: int = 60):
+        self.windows = windows or DEFAULT_WINDOWS
+        self.bucket_seconds = bucket_seconds
+        self.coins: Dict[str, _CoinWindows] = {}
+        # item key -> (bucket, coins, counts)
+        self.seen: Dict[str, Tuple[int, List[str], Counts]] = {}
+        self.span = max(1, max(self.windows.values()) // bucket_seconds)
+        self._pruned_at = 0
+
+    def _coin(self, coin: str) -> _CoinWindows:
+        windows = self.coins.get(coin)
+        if windows is None:
+            windows = self.coins[coin] = _CoinWindows(self.windows, self.bucket_seconds)
+            windows.advance(int(time.time()) // self.bucket_seconds)
+        return windows
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Forget items whose bucket is older than every window; returns how many were dropped."""
+        now_bucket = int(now if now is not None else time.time()) // self.bucket_seconds
+        oldest = now_bucket - self.span + 1
+        expired = [key for key, (bucket, _, _) in self.seen.items() if bucket < oldest]
+        for key in expired:
+            del self.seen[key]
+        self._pruned_at = now_bucket
+        return len(expired)
+
+    def observe(self, key: str, coins: List[str], counts: Counts, timestamp: float) -> None:
+        now_bucket = int(time.time()) // self.bucket_seconds
+        if now_bucket > self._pruned_at:
+            # 버킷이 바뀔 때마다 한 번만 정리합니다.
+            self.prune()
+        # 미래 시각(시계 오차)은 현재 버킷으로 맞춥니다.
+        bucket = min(int(timestamp) // self.bucket_seconds, now_bucket)
+        coins = sorted(set(coins) | {MARKET})
+        previous = self.seen.get(key)
+        if previous is None and bucket < now_bucket - self.span + 1:
+            # 윈도우 밖의 항목은 이미 잊혔거나 집계에 영향을 주지 않으므로 다시 세지 않습니다.
+            return
+        if previous is not None:
+            old_bucket, old_coins, old_counts = previous
+            if old_bucket == bucket and old_coins == coins and old_counts == counts:
+                return
+            for coin in old_coins:
+                self._coin(coin).apply(old_bucket, [-value for value in old_counts])
+        for coin in coins:
+            self._coin(coin).apply(bucket, counts)
+        self.seen[key] = (bucket, coins, list(counts))
+
+    def observe_record(self, record: CrawlRecord) -> CrawlRecord:
+        """Pipeline enricher: fold Coinness vote counts into the aggregates."""
+        item = record.item
+        if not hasattr(item, "bull_count"):
+            return record
+        data = asdict(item) if is_dataclass(item) else item
+        coins = [tag.strip().upper() for tag in getattr(item, "coin_tags", None) or []]
+        self.observe(item_key(data), coins, [item.bull_count, item.bear_count, item.quote_count],
+                     record_timestamp(record))
+        return record
+
+    def snapshot(self, coin: Optional[str] = None,
+                 now: Optional[float] = None) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Current totals per coin and window."""
+        now_bucket = int(now if now is not None else time.time()) // self.bucket_seconds
+        selected = [coin.upper()] if coin else list(self.coins)
+        result = {}
+        for name in selected:
+            windows = self.coins.get(name)
+            if windows is None:
+                continue
+            windows.advance(now_bucket)
+            totals = dict(windows.totals, total=windows.all_time)
+            result[name] = {
+                window: {"bull": counts[0], "bear": counts[1], "quote": counts[2]}
+                for window, counts in totals.items()
+            }
+        return result
+
+    def save(self, path: str) -> None:
+        """Persist the last-seen counts (and all-time totals) so a restart does not double-count items."""
+        self.prune()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        state = {
+            "seen": {key: list(value) for key, value in self.seen.items()},
+            "all_time": {coin: windows.all_time for coin, windows in self.coins.items()},
+        }
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> None:
+        """Rebuild the aggregates from a saved state."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if "seen" not in state:
+            # 이전 형식: {item key: [bucket, coins, counts]}
+            state = {"seen": state, "all_time": {}}
+        for key, (bucket, coins, counts) in state["seen"].items():
+            self.observe(key, [coin for coin in coins if coin != MARKET], counts, bucket * self.bucket_seconds)
+        # 잊힌 항목도 누적 합계에는 남아 있어야 하므로 저장된 값으로 덮어씁니다.
+        for coin, counts in state.get("all_time", {}).items():
+            self._coin(coin).all_time = list(counts)
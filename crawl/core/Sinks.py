@@ -0,0 +1,181 @@
+import asyncio
+import json
+import os
+import sqlite3
+from typing import Dict, Any, List, Optional, TextIO
+
+from crawl.core.DeltaFeed import item_key
+from crawl.core.domain.entity.Pipeline import CrawlRecord
+
+
+class Sink:
+    """Destination for crawl records as they come out of the pipeline."""
+
+    async def open(self) -> None:
+        pass
+
+    async def write(self, record: CrawlRecord) -> None:
+        raise NotImplementedError
+
+    def undelivered(self) -> int:
+        """Records accepted by write() but not delivered yet (sinks that send in batches)."""
+        return 0
+
+    async def close(self) -> None:
+        pass
+
+
+class FileSink(Sink):
+    """Appends each record as a JSON line to <output_dir>/<source>.jsonl."""
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self._files: Dict[str, TextIO] = {}
+
+    async def open(self) -> None:
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    async def write(self, record: CrawlRecord) -> None:
+        f = self._files.get(record.source)
+        if f is None:
+            f = open(os.path.join(self.output_dir, f"{record.source}.jsonl"), "a", encoding="utf-8")
+            self._files[record.source] = f
+        f.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+        f.flush()
+
+    async def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+
+class SQLiteSink(Sink):
+    """Upserts records into an `items` table keyed by (source, key)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn: Optional[sqlite3.Connection] = None
+
+    async def open(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " source TEXT NOT NULL, key TEXT NOT NULL, kind TEXT, url TEXT,"
+            " fetched_at REAL, data TEXT, PRIMARY KEY (source, key))"
+        )
+
+    async def write(self, record: CrawlRecord) -> None:
+        data = record.to_dict()["item"]
+        self.conn.execute(
+            "INSERT INTO items (source, key, kind, url, fetched_at, data) VALUES (?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(source, key) DO UPDATE SET"
+            " kind=excluded.kind, url=excluded.url, fetched_at=excluded.fetched_at, data=excluded.data",
+            (record.source, item_key(data), record.kind, record.url, record.fetched_at,
+             json.dumps(data, ensure_ascii=False)),
+        )
+        self.conn.commit()
+
+    def contains(self, source: str, key: str) -> bool:
+        """Whether an item with this key is already stored for the source."""
+        row = self.conn.execute("SELECT 1 FROM items WHERE source = ? AND key = ?", (source, key)).fetchone()
+        return row is not None
+
+    async def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class StdoutSink(Sink):
+    """Prints each record as a JSON line."""
+
+    async def write(self, record: CrawlRecord) -> None:
+        print(json.dumps(record.to_dict(), ensure_ascii=False), flush=True)
+
+
+class DeltaSink(Sink):
+    """
+    Collects a run's items per source in the {source: {"data": {kind: [...]}}} shape that
+    DeltaFeed.publish takes, for run modes that stream records instead of returning results.
+    """
+
+    def __init__(self):
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    async def open(self) -> None:
+        self.results = {}
+
+    async def write(self, record: CrawlRecord) -> None:
+        data = self.results.setdefault(record.source, {"data": {}})["data"]
+        data.setdefault(record.kind, []).append(record.to_dict()["item"])
+
+    def collected(self, partial: Any = ()) -> Dict[str, Dict[str, Any]]:
+        """The collected results; sources in `partial` (or every source when partial is True) are marked partial."""
+        return {
+            source: {"partial": True, **result} if partial is True or source in partial else result
+            for source, result in self.results.items()
+        }
+
+
+class WebhookSink(Sink):
+    """
+    POSTs records in small JSON batches to an HTTP endpoint. A failed POST raises from the
+    write() (or close()) that sent the batch; the batch's records are not retried.
+    """
+
+    def __init__(self, url: str, batch_size: int = 20, timeout: float = 10.0):
+        import requests
+
+        self.url = url
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.session = requests.Session()
+        self._batch: List[Dict[str, Any]] = []
+        # 전송 중인 배치의 레코드 수
+        self._sending = 0
+
+    async def _flush(self) -> None:
+        if not self._batch:
+            return
+        batch, self._batch = self._batch, []
+        self._sending += len(batch)
+        try:
+            response = await asyncio.to_thread(self.session.post, self.url, json=batch, timeout=self.timeout)
+            response.raise_for_status()
+        except Exception as e:
+            raise RuntimeError(f"Failed to post {len(batch)} records to {self.url}: {e}") from e
+        finally:
+            self._sending -= len(batch)
+
+    def undelivered(self) -> int:
+        return len(self._batch) + self._sending
+
+    async def write(self, record: CrawlRecord) -> None:
+        self._batch.append(record.to_dict())
+        if len(self._batch) >= self.batch_size:
+            await self._flush()
+
+    async def close(self) -> None:
+        try:
+            await self._flush()
+        finally:
+            self.session.close()
+
+
+def build_sink(spec: str) -> Sink:
+    """
+    Create a sink from a CLI spec:
+    "stdout", "file:<dir>", "sqlite:<path>" or an http(s) URL.
+    """
+    if spec == "stdout":
+        return StdoutSink()
+    if spec.startswith(("http://", "https://")):
+        return WebhookSink(spec)
+    kind, _, target = spec.partition(":")
+    if kind == "file" and target:
+        return FileSink(target)
+    if kind == "sqlite" and target:
+        return SQLiteSink(target)
+    raise ValueError(f"Unknown sink: {spec}")
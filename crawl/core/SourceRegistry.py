@@ -0,0 +1,137 @@
+import importlib
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Any
+
+from crawl.core.domain.entity.Pipeline import FetchJob
+from utils.AsyncStream import merge
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    name: str
+    module: str
+    class_name: str
+    method: str
+    categories: Tuple[str, ...] = field(default_factory=tuple)
+    default_category: Optional[str] = None
+    jobs_method: str = "listing_jobs"
+
+    @property
+    def stream_method(self) -> str:
+        """Async-iterator counterpart of `method` (fetch_x -> stream_x)."""
+        return "stream_" + self.method.removeprefix("fetch_")
+
+    def result_name(self, category: Optional[str] = None) -> str:
+        """Name results are stored under; non-default categories get a suffix."""
+        if category is None or category == self.default_category:
+            return self.name
+        return f"{self.name}_{category}"
+
+    def select_categories(self, categories: Optional[List[str]] = None) -> List[Optional[str]]:
+        if not self.categories:
+            return [None]
+        return [c for c in (categories or []) if c in self.categories] or [self.default_category]
+
+
+_USECASE_PACKAGE = "crawl.executor.usecase"
+
+SOURCES: Dict[str, SourceSpec] = {spec.name: spec for spec in [
+    SourceSpec("coinness_news", "CoinnessUseCase", "CrawlCoinnessUseCase", "fetch_coinness_news"),
+    SourceSpec("coindesk_latest_news", "CoinDeskLatestNewsUseCase", "CoinDeskLatestNewsUseCase", "fetch_latest_news"),
+    SourceSpec("coindesk_top_stories", "CoinDeskMainPageUseCase", "CoinDeskMainPageUseCase", "fetch_top_stories",
+               jobs_method="top_stories_jobs"),
+    SourceSpec("coindesk_most_read", "CoinDeskMainPageUseCase", "CoinDeskMainPageUseCase", "fetch_most_read",
+               jobs_method="most_read_jobs"),
+    SourceSpec("cryptonews", "CryptoNewsUseCase", "CryptoNewsUseCase", "fetch_news"),
+    SourceSpec("cryptoslate_insights", "CryptoslateInsightUseCase", "CryptoSlateInsightsUseCase", "fetch_insights"),
+    SourceSpec("cryptoslate_top_news", "CryptoslateTopNewsUseCase", "CryptoSlateUseCase", "fetch_top_news"),
+    SourceSpec("cointelegrap", "CointelegraphUseCase", "CointelegraphUseCase", "fetch_news",
+               ("market", "policy", "tech", "nft", "business", "research"), "market"),
+    SourceSpec("decrypt", "DecryptUseCase", "DecryptUseCase", "fetch_news",
+               ("crypto", "nft", "tech", "market", "business"), "crypto"),
+    SourceSpec("yahoo_finance", "YahooFinanceUseCase", "YahooFinanceUseCase", "fetch_news",
+               ("tech", "economy", "crypto", "housing"), "crypto"),
+    SourceSpec("bitcoin_news", "BitcoinNewsUseCase", "BitcoinNewsUseCase", "fetch_news",
+               ("latest", "market", "finance", "policy"), "latest"),
+]}
+
+
+class SourceRegistry:
+    """Resolves source names to use case instances, importing modules only on demand."""
+
+    def __init__(self, util: Any, sources: Optional[Dict[str, SourceSpec]] = None):
+        self.util = util
+        self.sources = sources if sources is not None else SOURCES
+        self._instances: Dict[Tuple[str, str], Any] = {}
+
+    def names(self) -> List[str]:
+        return list(self.sources)
+
+    def spec(self, name: str) -> SourceSpec:
+        try:
+            return self.sources[name]
+        except KeyError:
+            raise KeyError(f"Unknown source: {name}") from None
+
+    def use_case(self, name: str) -> Any:
+        """Import the use case module for a source and return a shared instance of it."""
+        spec = self.spec(name)
+        key = (spec.module, spec.class_name)
+        if key not in self._instances:
+            module = importlib.import_module(f"{_USECASE_PACKAGE}.{spec.module}")
+            self._instances[key] = getattr(module, spec.class_name)(self.util)
+        return self._instances[key]
+
+    def parse_raw(self, job: FetchJob, html: str) -> Optional[Tuple[List[Any], List[FetchJob]]]:
+        """Parse a page from its embedded JSON when the use case supports it; None means parse the DOM."""
+        parse_raw = getattr(self.use_case(job.source), "parse_raw", None)
+        return parse_raw(job, html) if parse_raw else None
+
+    def extract_spec(self, job: FetchJob) -> Optional[Any]:
+        """The use case's remote extraction fields for a job (ExtractSpec), or None to fetch the page."""
+        extract_spec = getattr(self.use_case(job.source), "extract_spec", None)
+        return extract_spec(job) if extract_spec else None
+
+    def archive_job(self, name: str, category: Optional[str], page: int) -> Optional[FetchJob]:
+        """Listing page `page` (1 = newest) of a source's archive; None past its last page or when it has none."""
+        archive_job = getattr(self.use_case(name), "archive_job", None)
+        job = archive_job(category, page) if archive_job else None
+        if job is not None:
+            job.source = name
+        return job
+
+    def jobs(self, names: List[str], categories: Optional[List[str]] = None) -> List[Tuple[str, Any]]:
+        """Build (result name, coroutine) pairs for the selected sources and categories."""
+        jobs = []
+        for name in names:
+            spec = self.spec(name)
+            fetch = getattr(self.use_case(name), spec.method)
+            for category in spec.select_categories(categories):
+                jobs.append((spec.result_name(category), fetch(category) if category else fetch()))
+        return jobs
+
+    def streams(self, names: List[str], categories: Optional[List[str]] = None) -> List[Tuple[str, AsyncIterator[Any]]]:
+        """Build (result name, async iterator of entities) pairs for the selected sources and categories."""
+        streams = []
+        for name in names:
+            spec = self.spec(name)
+            stream = getattr(self.use_case(name), spec.stream_method)
+            for category in spec.select_categories(categories):
+                streams.append((spec.result_name(category), stream(category) if category else stream()))
+        return streams
+
+    def stream(self, names: List[str], categories: Optional[List[str]] = None) -> AsyncIterator[Tuple[str, Any]]:
+        """(result name, entity) pairs from all selected sources at once, in the order they are parsed."""
+        return merge(self.streams(names, categories))
+
+    def listing_jobs(self, names: List[str], categories: Optional[List[str]] = None) -> List[FetchJob]:
+        """Build the first-stage fetch jobs for the selected sources and categories."""
+        jobs = []
+        for name in names:
+            spec = self.spec(name)
+            build = getattr(self.use_case(name), spec.jobs_method)
+            for category in spec.select_categories(categories):
+                for job in build(category):
+                    job.source = name
+                    jobs.append(job)
+        return jobs
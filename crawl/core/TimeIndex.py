@@ -0,0 +1,67 @@
+import bisect
+import time
+from typing import Any, List, Optional, Tuple
+
+from crawl.core.domain.entity.Pipeline import CrawlRecord
+
+
+def record_timestamp(record: CrawlRecord) -> float:
+    """Publication time of a record, falling back to when it was fetched."""
+    published = getattr(record.item, "published_ts", None)
+    return published if published is not None else record.fetched_at
+
+
+class TimeIndex:
+    """Records from every source kept sorted by timestamp for range queries."""
+
+    def __init__(self, retention_seconds: Optional[float] = None):
+        self.retention = retention_seconds
+        self._keys: List[Tuple[float, int]] = []
+        self._records: List[Any] = []
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, timestamp: float, record: Any) -> None:
+        self._sequence += 1
+        key = (timestamp, self._sequence)
+        position = bisect.bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._records.insert(position, record)
+
+    def extend(self, entries: List[Tuple[float, Any]]) -> None:
+        """Add many (timestamp, record) pairs with a single sort."""
+        for timestamp, record in entries:
+            self._sequence += 1
+            self._keys.append((timestamp, self._sequence))
+            self._records.append(record)
+        order = sorted(range(len(self._keys)), key=self._keys.__getitem__)
+        self._keys = [self._keys[i] for i in order]
+        self._records = [self._records[i] for i in order]
+
+    def index_record(self, record: CrawlRecord) -> CrawlRecord:
+        """Pipeline enricher: index the record and pass it on unchanged."""
+        self.add(record_timestamp(record), record)
+        if self.retention is not None:
+            self.prune(time.time() - self.retention)
+        return record
+
+    def between(self, start: float, end: float) -> List[Any]:
+        """Records with start <= timestamp < end, oldest first."""
+        low = bisect.bisect_left(self._keys, (start, 0))
+        high = bisect.bisect_left(self._keys, (end, 0))
+        return self._records[low:high]
+
+    def since(self, seconds: float, now: Optional[float] = None) -> List[Any]:
+        """Records from the last `seconds` seconds."""
+        now = now if now is not None else time.time()
+        return self.between(now - seconds, float("inf"))
+
+    def prune(self, before: float) -> int:
+        """Drop records older than `before`; returns how many were removed."""
+        cut = bisect.bisect_left(self._keys, (before, 0))
+        if cut:
+            del self._keys[:cut]
+            del self._records[:cut]
+        return cut
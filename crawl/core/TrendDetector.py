@@ -0,0 +1,248 @@
+import hashlib
+import json
+import math
+import os
+import re
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from crawl.core.DeltaFeed import item_key
+from crawl.core.TimeIndex import record_timestamp
+from crawl.core.domain.entity.Pipeline import CrawlRecord
+
+# 제목과 미리보기 필드 (본문 전체가 들어오는 경우를 위해 앞부분만 사용)
+TEXT_FIELDS = ("title", "content", "description")
+TEXT_CHARS = 400
+# 영문과 한글 (Coinness 제목) 단어
+_WORD = re.compile(r"[A-Za-z가-힣][A-Za-z0-9가-힣'&.-]*[A-Za-z0-9가-힣]|[A-Za-z가-힣]")
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be been before being below between both
+but by can could did do does doing down during each few for from further had has have having he her here
+hers him his how i if in into is it its itself just may me might more most my new no nor not now of off on
+once only or other our out over own same says said she should so some such than that the their them then
+there these they this those through to too under until up very via was we were what when where which while
+who whom why will with would you your vs amid per week day today yesterday year report reports
+""".split())
+
+# 순방향 감쇠 가중치가 이만큼 커지면 기준 시각을 옮겨 다시 정규화합니다.
+_RESCALE_EXPONENT = 40.0
+
+
+def _hashes(term: str, depth: int, width: int) -> List[int]:
+    """Row indexes for a term by double hashing one 128-bit digest (stable across processes)."""
+    digest = hashlib.blake2b(term.encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [(h1 + row * h2) % width for row in range(depth)]
+
+
+class DecayedCountMin:
+    """
+    Count-min sketch of exponentially decayed counts, with conservative updates.
+    Decay is applied forward: an event at time t adds exp((t - origin) / tau), and estimates
+    are scaled back by exp(-(now - origin) / tau), so old history fades without ever
+    touching the table on reads. Memory is width * depth floats regardless of input size.
+    """
+
+    def __init__(self, half_life: float, width: int = 2048, depth: int = 4, origin: Optional[float] = None):
+        self.tau = half_life / math.log(2)
+        self.width = width
+        self.depth = depth
+        self.origin = origin if origin is not None else time.time()
+        self.rows = [array("d", bytes(8 * width)) for _ in range(depth)]
+
+    def weight(self, timestamp: float) -> float:
+        return math.exp((timestamp - self.origin) / self.tau)
+
+    def scale(self, now: float) -> float:
+        """Factor turning stored (forward-weighted) values into decayed counts at `now`."""
+        return math.exp(-(now - self.origin) / self.tau)
+
+    def add(self, term: str, timestamp: float, count: float = 1.0) -> float:
+        """Add a decayed observation; returns the term's new stored (forward-weighted) estimate."""
+        if (timestamp - self.origin) / self.tau > _RESCALE_EXPONENT:
+            self.rescale(timestamp)
+        columns = _hashes(term, self.depth, self.width)
+        target = min(row[column] for row, column in zip(self.rows, columns)) + count * self.weight(timestamp)
+        for row, column in zip(self.rows, columns):
+            if row[column] < target:
+                row[column] = target
+        return target
+
+    def stored(self, term: str) -> float:
+        return min(row[column] for row, column in zip(self.rows, _hashes(term, self.depth, self.width)))
+
+    def estimate(self, term: str, now: Optional[float] = None) -> float:
+        """Decayed count of the term at `now` (an overestimate, never an underestimate)."""
+        return self.stored(term) * self.scale(now if now is not None else time.time())
+
+    def rescale(self, origin: float) -> float:
+        """Move the origin forward, shrinking every cell; returns the factor applied."""
+        factor = math.exp(-(origin - self.origin) / self.tau)
+        for row in self.rows:
+            for column in range(self.width):
+                row[column] *= factor
+        self.origin = origin
+        return factor
+
+    def state(self) -> Dict[str, Any]:
+        return {"origin": self.origin, "rows": [list(row) for row in self.rows]}
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        if len(state["rows"]) != self.depth or any(len(row) != self.width for row in state["rows"]):
+            return  # 크기가 바뀐 설정에서 저장된 상태는 버립니다.
+        self.origin = state["origin"]
+        self.rows = [array("d", row) for row in state["rows"]]
+
+
+class TrendDetector:
+    """
+    Spiking terms across sources, in bounded memory.
+    Every new item's title and preview are split into words, two-word phrases and coin
+    tickers, which go into two decayed count-min sketches: a fast one (the current rate)
+    and a slow one (the baseline). A space-saving table keeps the `top_k` terms by current
+    rate together with the sources mentioning them; a term trends when its current rate is
+    at least `ratio` times its baseline rate and it was seen `min_count` times across
+    `min_sources` sources. Re-crawled items are counted once.
+    """
+
+    def __init__(self, fast_half_life: float = 3600, slow_half_life: float = 86400, width: int = 2048,
+                 depth: int = 4, top_k: int = 200, ratio: float = 4.0, min_count: float = 5.0,
+                 min_sources: int = 2, prior: float = 1.0, seen_capacity: int = 50000):
+        now = time.time()
+        self.fast = DecayedCountMin(fast_half_life, width, depth, now)
+        self.slow = DecayedCountMin(slow_half_life, width, depth, now)
+        self.top_k = top_k
+        self.ratio = ratio
+        self.min_count = min_count
+        self.min_sources = min_sources
+        # 처음 보는 단어의 기준선 (이만큼 본 적이 있다고 가정)
+        self.prior = prior
+        self.seen_capacity = seen_capacity
+        self.started_at = now
+        # term -> [fast sketch 저장값, {출처: 마지막으로 언급한 시각}]
+        self._top: Dict[str, List[Any]] = {}
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+
+    @staticmethod
+    def terms_of(record: CrawlRecord) -> Set[str]:
+        """Words, two-word phrases and $TICKERs of a record's title and preview."""
+        item = record.item
+        terms: Set[str] = set()
+        for name in TEXT_FIELDS:
+            text = getattr(item, name, None)
+            if not isinstance(text, str):
+                continue
+            previous = None
+            for match in _WORD.finditer(text[:TEXT_CHARS]):
+                word = match.group(0).lower().strip(".'-")
+                if len(word) < 2 or word in STOPWORDS or word.isdigit():
+                    previous = None
+                    continue
+                terms.add(word)
+                if previous:
+                    terms.add(f"{previous} {word}")
+                previous = word
+        coins = record.meta.get("coins") or [tag.strip().upper() for tag in getattr(item, "coin_tags", None) or []]
+        terms.update(f"${coin}" for coin in coins)
+        return terms
+
+    def _remember(self, key: str) -> bool:
+        """False when the item was already counted; the set of keys is capped (oldest forgotten first)."""
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return False
+        self._seen[key] = None
+        if len(self._seen) > self.seen_capacity:
+            self._seen.popitem(last=False)
+        return True
+
+    def observe(self, key: str, terms: Iterable[str], source: str, timestamp: float) -> None:
+        if not self._remember(key):
+            return
+        # 미래 시각(시계 오차)은 현재 시각으로 맞춥니다.
+        timestamp = min(timestamp, time.time())
+        for term in terms:
+            origin = self.fast.origin
+            current = self.fast.add(term, timestamp)
+            if self.fast.origin != origin:
+                factor = math.exp(-(self.fast.origin - origin) / self.fast.tau)
+                for entry in self._top.values():
+                    entry[0] *= factor
+            self.slow.add(term, timestamp)
+            self._offer(term, current, source, timestamp)
+
+    def _offer(self, term: str, current: float, source: str, timestamp: float) -> None:
+        """Space-saving update of the top-k table with the term's current sketch estimate."""
+        entry = self._top.get(term)
+        if entry is not None:
+            entry[0] = current
+            entry[1][source] = max(timestamp, entry[1].get(source, timestamp))
+            return
+        if len(self._top) >= self.top_k:
+            weakest = min(self._top, key=lambda name: self._top[name][0])
+            if self._top[weakest][0] >= current:
+                return
+            del self._top[weakest]
+        self._top[term] = [current, {source: timestamp}]
+
+    def observe_record(self, record: CrawlRecord) -> CrawlRecord:
+        """Pipeline enricher: count the record's terms (runs after the coin index so tickers are tagged)."""
+        data = asdict(record.item) if is_dataclass(record.item) else record.item
+        key = item_key(data) if isinstance(data, dict) else record.url
+        self.observe(key, self.terms_of(record), record.source, record_timestamp(record))
+        return record
+
+    def trending(self, now: Optional[float] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Terms whose current rate is far above their baseline, strongest first."""
+        now = now if now is not None else time.time()
+        # 실행 초기에는 기준선이 없으므로 빠른 창 하나만큼 지켜본 뒤부터 판단합니다.
+        if now - self.started_at < self.fast.tau * math.log(2):
+            return []
+        # 빠른 창의 반감기 두 번 안에 언급한 출처만 셉니다.
+        recent = now - 2 * self.fast.tau * math.log(2)
+        results = []
+        for term, (_, seen_by) in self._top.items():
+            sources = [source for source, seen_at in seen_by.items() if seen_at >= recent]
+            current = self.fast.estimate(term, now)
+            if current < self.min_count or len(sources) < self.min_sources:
+                continue
+            baseline = self.slow.estimate(term, now)
+            score = (current / self.fast.tau) / ((baseline + self.prior) / self.slow.tau)
+            if score >= self.ratio:
+                results.append({"term": term, "score": round(score, 2), "count": round(current, 2),
+                                "baseline": round(baseline, 2), "sources": sorted(sources)})
+        results.sort(key=lambda row: row["score"], reverse=True)
+        return results[:limit]
+
+    def save(self, path: str) -> None:
+        """Persist the sketches, the top-k table and the counted item keys."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        state = {
+            "started_at": self.started_at, "fast": self.fast.state(), "slow": self.slow.state(),
+            "top": self._top,
+            "seen": list(self._seen),
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self.started_at = state["started_at"]
+        self.fast.restore(state["fast"])
+        self.slow.restore(state["slow"])
+        # 저장된 top-k 값은 저장 당시 fast sketch의 기준 시각 기준입니다.
+        factor = math.exp(-(self.fast.origin - state["fast"]["origin"]) / self.fast.tau)
+        self._top = {term: [value * factor, seen_by]
+                     for term, (value, seen_by) in list(state["top"].items())[:self.top_k]}
+        for key in state["seen"][-self.seen_capacity:]:
+            self._seen[key] = None
@@ -0,0 +1,495 @@
+import asyncio
+import heapq
+import json
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from crawl.core.SourceRegistry import SourceRegistry
+from crawl.core.Sinks import Sink
+from crawl.core.domain.entity.Pipeline import FetchJob, CrawlRecord
+from utils.CreditLedger import BudgetExceeded
+
+
+@dataclass
+class LeasedJob:
+    job_id: str
+    job: FetchJob
+    attempts: int
+    owner: str = ""
+
+
+def job_key(run_id: str, job: FetchJob) -> str:
+    """Deduplication key: the same page is only queued once per run."""
+    return f"{run_id}|{job.source}|{job.category or ''}|{job.kind}|{job.url}"
+
+
+class WorkQueue:
+    """Shared queue of fetch jobs with leases, acknowledgements and retries."""
+
+    def __init__(self, lease_seconds: float = 120.0, max_attempts: int = 3, retry_delay: float = 10.0):
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def put(self, run_id: str, job: FetchJob) -> bool:
+        raise NotImplementedError
+
+    def lease(self, run_id: str, worker_id: str) -> Optional[LeasedJob]:
+        raise NotImplementedError
+
+    def renew(self, leased: LeasedJob) -> bool:
+        """Extend a running job's lease; False when it was lost (expired and taken by another worker)."""
+        raise NotImplementedError
+
+    def ack(self, leased: LeasedJob) -> bool:
+        """Mark the job done; False (and nothing changed) when the lease now belongs to another worker."""
+        raise NotImplementedError
+
+    def nack(self, leased: LeasedJob, error: str) -> bool:
+        """Schedule a retry or dead-letter the job; False when the lease now belongs to another worker."""
+        raise NotImplementedError
+
+    def counts(self, run_id: str) -> Dict[str, int]:
+        raise NotImplementedError
+
+    def is_drained(self, run_id: str) -> bool:
+        counts = self.counts(run_id)
+        return counts.get("pending", 0) == 0 and counts.get("leased", 0) == 0
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """Single-host queue; several worker processes can share the same database file."""
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(**kwargs)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY, run_id TEXT NOT NULL, payload TEXT NOT NULL, priority INTEGER NOT NULL,"
+            " state TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0,"
+            " available_at REAL NOT NULL, lease_owner TEXT, lease_expires REAL, last_error TEXT)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (run_id, state, priority, available_at)")
+
+    def put(self, run_id: str, job: FetchJob) -> bool:
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO jobs (id, run_id, payload, priority, available_at) VALUES (?, ?, ?, ?, ?)",
+            (job_key(run_id, job), run_id, json.dumps(asdict(job)), job.priority, time.time()),
+        )
+        return cursor.rowcount > 0
+
+    def lease(self, run_id: str, worker_id: str) -> Optional[LeasedJob]:
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 만료된 리스 중 시도 횟수를 다 쓴 작업(워커를 죽게 만드는 작업)은 dead로 보냅니다.
+            self.conn.execute(
+                "UPDATE jobs SET state = 'dead', lease_owner = NULL, last_error = 'lease expired'"
+                " WHERE run_id = ? AND state = 'leased' AND lease_expires <= ? AND attempts >= ?",
+                (run_id, now, self.max_attempts),
+            )
+            # 나머지 만료된 리스(중단된 워커의 작업)는 다시 가져갑니다.
+            row = self.conn.execute(
+                "SELECT id, payload, attempts FROM jobs WHERE run_id = ? AND ("
+                " (state = 'pending' AND available_at <= ?) OR (state = 'leased' AND lease_expires <= ?))"
+                " ORDER BY priority, available_at LIMIT 1",
+                (run_id, now, now),
+            ).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            job_id, payload, attempts = row
+            self.conn.execute(
+                "UPDATE jobs SET state = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1"
+                " WHERE id = ?",
+                (worker_id, now + self.lease_seconds, job_id),
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return LeasedJob(job_id=job_id, job=FetchJob(**json.loads(payload)), attempts=attempts + 1, owner=worker_id)
+
+    def renew(self, leased: LeasedJob) -> bool:
+        cursor = self.conn.execute(
+            "UPDATE jobs SET lease_expires = ? WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+            (time.time() + self.lease_seconds, leased.job_id, leased.owner),
+        )
+        return cursor.rowcount > 0
+
+    def ack(self, leased: LeasedJob) -> bool:
+        cursor = self.conn.execute(
+            "UPDATE jobs SET state = 'done', lease_owner = NULL WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+            (leased.job_id, leased.owner),
+        )
+        return cursor.rowcount > 0
+
+    def nack(self, leased: LeasedJob, error: str) -> bool:
+        if leased.attempts >= self.max_attempts:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET state = 'dead', lease_owner = NULL, last_error = ?"
+                " WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+                (error, leased.job_id, leased.owner),
+            )
+            return cursor.rowcount > 0
+        cursor = self.conn.execute(
+            "UPDATE jobs SET state = 'pending', lease_owner = NULL, available_at = ?, last_error = ?"
+            " WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+            (time.time() + self.retry_delay * leased.attempts, error, leased.job_id, leased.owner),
+        )
+        return cursor.rowcount > 0
+
+    def counts(self, run_id: str) -> Dict[str, int]:
+        rows = self.conn.execute("SELECT state, COUNT(*) FROM jobs WHERE run_id = ? GROUP BY state", (run_id,))
+        return dict(rows.fetchall())
+
+
+# 리스는 한 번에 처리해야 워커가 중간에 죽어도 작업이 pending/leased 어디에도 없는 상태가 되지 않습니다.
+# KEYS: jobs, pending, leased, delayed, attempts, state, owner / ARGV: now, 리스 만료 시각, max_attempts, worker id
+LEASE_SCRIPT = """
+local now = tonumber(ARGV[1])
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[3], 0, now, 'LIMIT', 0, 100)) do
+  redis.call('ZREM', KEYS[3], id)
+  if tonumber(redis.call('HGET', KEYS[5], id) or '0') >= tonumber(ARGV[3]) then
+    redis.call('HSET', KEYS[6], id, 'dead')
+  else
+    redis.call('HSET', KEYS[6], id, 'pending')
+    redis.call('ZADD', KEYS[2], cjson.decode(redis.call('HGET', KEYS[1], id))['priority'], id)
+  end
+end
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[4], 0, now, 'LIMIT', 0, 100)) do
+  redis.call('ZREM', KEYS[4], id)
+  redis.call('HSET', KEYS[6], id, 'pending')
+  redis.call('ZADD', KEYS[2], cjson.decode(redis.call('HGET', KEYS[1], id))['priority'], id)
+end
+local popped = redis.call('ZPOPMIN', KEYS[2], 1)
+if #popped == 0 then
+  return nil
+end
+local id = popped[1]
+redis.call('ZADD', KEYS[3], ARGV[2], id)
+redis.call('HSET', KEYS[6], id, 'leased')
+redis.call('HSET', KEYS[7], id, ARGV[4])
+local attempts = redis.call('HINCRBY', KEYS[5], id, 1)
+return {id, redis.call('HGET', KEYS[1], id), attempts}
+"""
+
+# 리스가 만료돼 다른 워커가 가져간 작업은 연장하지 않습니다.
+# KEYS: leased, owner / ARGV: job id, 새 리스 만료 시각, worker id
+RENEW_SCRIPT = """
+if redis.call('ZSCORE', KEYS[1], ARGV[1]) and redis.call('HGET', KEYS[2], ARGV[1]) == ARGV[3] then
+  redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+  return 1
+end
+return 0
+"""
+
+# 리스를 가진 워커만 작업을 끝내거나(done/dead) 재시도 대기열로 보낼 수 있습니다.
+# KEYS: leased, state, owner, delayed / ARGV: job id, worker id, 새 상태, 재시도 시각(pending일 때)
+FINISH_SCRIPT = """
+if not redis.call('ZSCORE', KEYS[1], ARGV[1]) or redis.call('HGET', KEYS[3], ARGV[1]) ~= ARGV[2] then
+  return 0
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('HDEL', KEYS[3], ARGV[1])
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[3])
+if ARGV[3] == 'pending' then
+  redis.call('ZADD', KEYS[4], ARGV[4], ARGV[1])
+end
+return 1
+"""
+
+
+class LocalRedis:
+    """
+    In-process stand-in for the handful of Redis commands RedisWorkQueue uses,
+    for running the Redis queue without a server. The Lua scripts are run by their
+    Python equivalents (atomic here, since everything runs on one event loop).
+    """
+
+    def __init__(self):
+        self._hashes: Dict[str, Dict[str, str]] = {}
+        self._zsets: Dict[str, Dict[str, float]] = {}
+        self._scripts = {LEASE_SCRIPT: self._lease_script, RENEW_SCRIPT: self._renew_script,
+                         FINISH_SCRIPT: self._finish_script}
+
+    def eval(self, script: str, numkeys: int, *args: Any) -> Any:
+        return self._scripts[script](list(args[:numkeys]), list(args[numkeys:]))
+
+    def _lease_script(self, keys: List[str], argv: List[Any]) -> Optional[List[Any]]:
+        jobs, pending, leased, delayed, attempts, state, owner = keys
+        now, expires, max_attempts, worker_id = float(argv[0]), float(argv[1]), int(argv[2]), argv[3]
+        for source in (leased, delayed):
+            for job_id in self.zrangebyscore(source, 0, now, start=0, num=100):
+                self.zrem(source, job_id)
+                if source == leased and int(self.hget(attempts, job_id) or 0) >= max_attempts:
+                    self.hset(state, job_id, "dead")
+                    continue
+                self.hset(state, job_id, "pending")
+                self.zadd(pending, {job_id: json.loads(self.hget(jobs, job_id))["priority"]})
+        popped = self.zpopmin(pending, 1)
+        if not popped:
+            return None
+        job_id = popped[0][0]
+        self.zadd(leased, {job_id: expires})
+        self.hset(state, job_id, "leased")
+        self.hset(owner, job_id, worker_id)
+        count = int(self.hget(attempts, job_id) or 0) + 1
+        self.hset(attempts, job_id, str(count))
+        return [job_id, self.hget(jobs, job_id), count]
+
+    def _renew_script(self, keys: List[str], argv: List[Any]) -> int:
+        if argv[0] not in self._zsets.get(keys[0], {}) or self.hget(keys[1], argv[0]) != argv[2]:
+            return 0
+        self.zadd(keys[0], {argv[0]: float(argv[1])})
+        return 1
+
+    def _finish_script(self, keys: List[str], argv: List[Any]) -> int:
+        leased, state, owner, delayed = keys
+        job_id, worker_id, new_state = argv[0], argv[1], argv[2]
+        if job_id not in self._zsets.get(leased, {}) or self.hget(owner, job_id) != worker_id:
+            return 0
+        self.zrem(leased, job_id)
+        self._hashes.get(owner, {}).pop(job_id, None)
+        self.hset(state, job_id, new_state)
+        if new_state == "pending":
+            self.zadd(delayed, {job_id: float(argv[3])})
+        return 1
+
+    def hset(self, name: str, key: str, value: str) -> int:
+        self._hashes.setdefault(name, {})[key] = value
+        return 1
+
+    def hsetnx(self, name: str, key: str, value: str) -> int:
+        bucket = self._hashes.setdefault(name, {})
+        if key in bucket:
+            return 0
+        bucket[key] = value
+        return 1
+
+    def hget(self, name: str, key: str) -> Optional[str]:
+        return self._hashes.get(name, {}).get(key)
+
+    def zadd(self, name: str, mapping: Dict[str, float]) -> int:
+        zset = self._zsets.setdefault(name, {})
+        added = sum(1 for member in mapping if member not in zset)
+        zset.update(mapping)
+        return added
+
+    def zrem(self, name: str, *members: str) -> int:
+        zset = self._zsets.get(name, {})
+        return sum(1 for member in members if zset.pop(member, None) is not None)
+
+    def zcard(self, name: str) -> int:
+        return len(self._zsets.get(name, {}))
+
+    def zrangebyscore(self, name: str, low: float, high: float, start: int = 0, num: int = 1) -> List[str]:
+        zset = self._zsets.get(name, {})
+        members = sorted((score, member) for member, score in zset.items() if low <= score <= high)
+        return [member for _, member in members[start:start + num]]
+
+    def zpopmin(self, name: str, count: int = 1) -> List[Tuple[str, float]]:
+        zset = self._zsets.get(name, {})
+        popped = heapq.nsmallest(count, ((score, member) for member, score in zset.items()))
+        for _, member in popped:
+            del zset[member]
+        return [(member, score) for score, member in popped]
+
+
+class RedisWorkQueue(WorkQueue):
+    """
+    Multi-host queue on Redis (or any server speaking the same commands).
+    Keys: <prefix>:<run>:jobs (hash), :pending (zset by priority), :leased (zset by expiry),
+    :delayed (zset by retry time), :attempts (hash), :state (hash), :owner (hash of lease holders).
+    """
+
+    def __init__(self, client: Any, prefix: str = "crawl", **kwargs):
+        super().__init__(**kwargs)
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisWorkQueue":
+        import redis
+
+        return cls(redis.Redis.from_url(url, decode_responses=True), **kwargs)
+
+    def _key(self, run_id: str, name: str) -> str:
+        return f"{self.prefix}:{run_id}:{name}"
+
+    @staticmethod
+    def _text(value: Any) -> Optional[str]:
+        return value.decode() if isinstance(value, bytes) else value
+
+    def put(self, run_id: str, job: FetchJob) -> bool:
+        job_id = job_key(run_id, job)
+        if not self.client.hsetnx(self._key(run_id, "jobs"), job_id, json.dumps(asdict(job))):
+            return False
+        self.client.hset(self._key(run_id, "state"), job_id, "pending")
+        self.client.zadd(self._key(run_id, "pending"), {job_id: job.priority})
+        return True
+
+    def lease(self, run_id: str, worker_id: str) -> Optional[LeasedJob]:
+        """
+        One script: expired leases go back to pending (or to dead once their attempts are used up),
+        delayed retries that are due go back to pending, and the best pending job is leased.
+        """
+        now = time.time()
+        keys = [self._key(run_id, name) for name in ("jobs", "pending", "leased", "delayed", "attempts", "state", "owner")]
+        leased = self.client.eval(LEASE_SCRIPT, len(keys), *keys, now, now + self.lease_seconds, self.max_attempts,
+                                  worker_id)
+        if not leased:
+            return None
+        job_id, payload, attempts = (self._text(value) for value in leased)
+        return LeasedJob(job_id=job_id, job=FetchJob(**json.loads(payload)), attempts=int(attempts), owner=worker_id)
+
+    def renew(self, leased: LeasedJob) -> bool:
+        run_id = self._run_of(leased)
+        return bool(self.client.eval(RENEW_SCRIPT, 2, self._key(run_id, "leased"), self._key(run_id, "owner"),
+                                     leased.job_id, time.time() + self.lease_seconds, leased.owner))
+
+    def _run_of(self, leased: LeasedJob) -> str:
+        return leased.job_id.split("|", 1)[0]
+
+    def _finish(self, leased: LeasedJob, state: str, retry_at: float = 0.0) -> bool:
+        run_id = self._run_of(leased)
+        keys = [self._key(run_id, name) for name in ("leased", "state", "owner", "delayed")]
+        return bool(self.client.eval(FINISH_SCRIPT, len(keys), *keys, leased.job_id, leased.owner, state, retry_at))
+
+    def ack(self, leased: LeasedJob) -> bool:
+        return self._finish(leased, "done")
+
+    def nack(self, leased: LeasedJob, error: str) -> bool:
+        if leased.attempts >= self.max_attempts:
+            return self._finish(leased, "dead")
+        return self._finish(leased, "pending", time.time() + self.retry_delay * leased.attempts)
+
+    def counts(self, run_id: str) -> Dict[str, int]:
+        return {
+            "pending": self.client.zcard(self._key(run_id, "pending")) + self.client.zcard(self._key(run_id, "delayed")),
+            "leased": self.client.zcard(self._key(run_id, "leased")),
+        }
+
+
+_LOCAL_REDIS = LocalRedis()
+
+
+def open_queue(spec: str, **kwargs) -> WorkQueue:
+    """
+    Open a queue from a CLI spec: "sqlite:<path>", "redis://..." or "local-redis"
+    (the in-process stand-in, shared by workers in the same process).
+    """
+    if spec.startswith(("redis://", "rediss://", "unix://")):
+        return RedisWorkQueue.from_url(spec, **kwargs)
+    if spec == "local-redis":
+        return RedisWorkQueue(_LOCAL_REDIS, **kwargs)
+    kind, _, target = spec.partition(":")
+    if kind == "sqlite" and target:
+        return SQLiteWorkQueue(target, **kwargs)
+    raise ValueError(f"Unknown queue: {spec}")
+
+
+def enqueue_run(queue: WorkQueue, registry: SourceRegistry, run_id: str, names: List[str],
+                categories: Optional[List[str]] = None) -> int:
+    """Seed a run with its listing jobs; re-seeding an existing run adds nothing new."""
+    return sum(queue.put(run_id, job) for job in registry.listing_jobs(names, categories))
+
+
+async def run_worker(queue: WorkQueue, registry: SourceRegistry, sinks: List[Sink], run_id: str,
+                     concurrency: int = 4, poll_interval: float = 1.0, archive: Any = None) -> Dict[str, int]:
+    """Drain the run's jobs until nothing is pending or leased, pushing follow-up jobs back to the queue."""
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+    util = registry.util
+    stats = {"done": 0, "failed": 0, "items": 0, "budget_skipped": 0, "lease_lost": 0}
+
+    async def heartbeat(leased: LeasedJob, work: asyncio.Task) -> None:
+        # 느린 fetch가 리스 시간을 넘겨 다른 워커에 중복 할당되지 않도록 리스를 연장합니다.
+        while True:
+            await asyncio.sleep(queue.lease_seconds / 3)
+            if not queue.renew(leased):
+                # 리스를 잃은 작업은 다른 워커가 처리하므로 여기서는 결과를 버립니다.
+                print(f"⚠️ Lease lost for {leased.job.url}, discarding")
+                work.cancel()
+                return
+
+    async def process(leased: LeasedJob) -> None:
+        renewing = asyncio.create_task(heartbeat(leased, asyncio.current_task()))
+        try:
+            await handle(leased)
+        except asyncio.CancelledError:
+            if renewing.done() and not renewing.cancelled():
+                stats["lease_lost"] += 1
+                return
+            raise
+        finally:
+            renewing.cancel()
+
+    async def handle(leased: LeasedJob) -> None:
+        job = leased.job
+        try:
+            html = await util.fetch_html(job.url, job.wait, job.js_instructions,
+                                         source=job.source, priority=job.priority)
+            fetched_at = time.time()
+            if archive is not None:
+                archive.put(job, html, fetched_at)
+            result = registry.parse_raw(job, html) if util.structured_data else None
+            if result is None:
+                async with util.parsed(html) as soup:
+                    result = registry.use_case(job.source).parse_job(job, soup)
+            items, follow_ups = result
+            if util.ledger is not None:
+                util.ledger.record_yield(job.source, job.url, len(items) + len(follow_ups))
+            for follow_up in follow_ups:
+                queue.put(run_id, follow_up)
+
+            name = registry.spec(job.source).result_name(job.category)
+            for item in items:
+                record = CrawlRecord(source=name, kind=job.kind, item=item,
+                                     url=getattr(item, "url", None) or job.url, fetched_at=fetched_at)
+                for sink in sinks:
+                    await sink.write(record)
+            stats["items"] += len(items)
+            stats["done" if queue.ack(leased) else "lease_lost"] += 1
+        except BudgetExceeded as e:
+            # 예산 초과로 잘린 작업은 재시도하지 않습니다.
+            print(f"⚠️ {e}")
+            stats["budget_skipped" if queue.ack(leased) else "lease_lost"] += 1
+        except Exception as e:
+            print(f"❌ Job failed ({leased.attempts}/{queue.max_attempts}) {job.url}: {e}")
+            stats["failed" if queue.nack(leased, str(e)) else "lease_lost"] += 1
+
+    for sink in sinks:
+        await sink.open()
+    running: set = set()
+    try:
+        while True:
+            while len(running) < concurrency:
+                leased = queue.lease(run_id, worker_id)
+                if leased is None:
+                    break
+                running.add(asyncio.create_task(process(leased)))
+
+            if running:
+                _, running = await asyncio.wait(running, timeout=poll_interval,
+                                                 return_when=asyncio.FIRST_COMPLETED)
+            elif queue.is_drained(run_id):
+                break
+            else:
+                # 다른 워커가 처리 중이거나 재시도 대기 중인 작업을 기다립니다.
+                await asyncio.sleep(poll_interval)
+    finally:
+        for sink in sinks:
+            try:
+                await sink.close()
+            except Exception as e:
+                print(f"❌ Sink {type(sink).__name__} failed to close: {e}")
+
+    print(f"✅ Worker {worker_id} finished run {run_id}: {stats}")
+    return stats
@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class ArticleBody:
+    url: str
+    content: str  # 문단 단위로 줄바꿈된 본문 텍스트
+    title: Optional[str] = None
+    word_count: int = 0
+    links: List[str] = field(default_factory=list)
+    published_ts: Optional[float] = None  # UTC epoch
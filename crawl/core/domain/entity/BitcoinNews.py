@@ -1,6 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 
 @dataclass
 class NewsContent:
-    content: str
\ No newline at end of file
+    content: str  # 문단 단위로 줄바꿈된 본문 텍스트
+    url: Optional[str] = None
+    word_count: int = 0
+    links: List[str] = field(default_factory=list)
+    published_ts: Optional[float] = None  # UTC epoch
+
+    @property
+    def paragraphs(self) -> List[str]:
+        return self.content.split("\n") if self.content else []
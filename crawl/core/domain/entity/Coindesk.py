@@ -11,6 +11,7 @@ class NewsStory:
     category: Optional[str]
     image_url: Optional[str]
     is_sponsored: bool
+    published_ts: Optional[float] = None  # UTC epoch
 
 @dataclass
 class Author:
@@ -26,6 +27,7 @@ class MostReadStory:
     authors: List[Author]
     published_time: str
     image_url: Optional[str]
+    published_ts: Optional[float] = None  # UTC epoch
 
 @dataclass
 class LatestNewsItem:
@@ -35,3 +37,4 @@ class LatestNewsItem:
     category: str
     published_time: str
     image_url: Optional[str]
+    published_ts: Optional[float] = None  # UTC epoch
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 
 @dataclass
@@ -13,3 +13,4 @@ class NewsItem:
     coin_tags: List[str]
     date: str
     isHighlight: bool
+    published_ts: Optional[float] = None  # UTC epoch
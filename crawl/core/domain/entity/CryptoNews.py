@@ -12,3 +12,4 @@ class CryptoNewsItem:
     author: Optional[str]
     image_url: Optional[str]
     is_featured: bool  # True for main news, False for mini news
+    published_ts: Optional[float] = None  # UTC epoch
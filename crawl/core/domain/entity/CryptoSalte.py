@@ -11,6 +11,7 @@ class TopNewsItem:
     author: str
     published_time: str
     type: Optional[str] = None
+    published_ts: Optional[float] = None  # UTC epoch
 
 @dataclass
 class Category:
@@ -23,4 +24,5 @@ class InsightNewsItem:
     image_url: str
     categories: List[Category]
     published_time: str
-    data_source: Optional[str] = None  # For "Data via Farside Investors" cases
\ No newline at end of file
+    data_source: Optional[str] = None  # For "Data via Farside Investors" cases
+    published_ts: Optional[float] = None  # UTC epoch
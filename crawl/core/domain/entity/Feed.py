@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class FeedEntry:
+    title: str
+    url: str
+    summary: Optional[str] = None
+    published_time: Optional[str] = None
+    published_ts: Optional[float] = None  # UTC epoch
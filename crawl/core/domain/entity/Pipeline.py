@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class FetchJob:
+    url: str
+    kind: str  # "listing", "article" 또는 use case별 섹션 이름
+    source: str = ""
+    category: Optional[str] = None
+    wait: int = 5000
+    js_instructions: Optional[str] = None
+    priority: int = 0  # 낮을수록 먼저 처리
+
+
+@dataclass
+class CrawlRecord:
+    source: str
+    kind: str
+    item: Any
+    url: str
+    fetched_at: float
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "source": self.source,
+            "kind": self.kind,
+            "url": self.url,
+            "fetched_at": self.fetched_at,
+            "meta": self.meta,
+            "item": asdict(self.item) if hasattr(self.item, "__dataclass_fields__") else self.item,
+        }
@@ -1,27 +1,23 @@
+import argparse
 import asyncio
 import json
 import os
-from typing import Dict, Any
-
-from crawl.executor.usecase.BitcoinNewsUseCase import BitcoinNewsUseCase
-from crawl.executor.usecase.CoinnessUseCase import CrawlCoinnessUseCase
-from crawl.executor.usecase.CoinDeskLatestNewsUseCase import CoinDeskLatestNewsUseCase
-from crawl.executor.usecase.CoinDeskMainPageUseCase import CoinDeskMainPageUseCase
-from crawl.executor.usecase.CointelegraphUseCase import CointelegraphUseCase
-from crawl.executor.usecase.CryptoNewsUseCase import CryptoNewsUseCase
-from crawl.executor.usecase.CryptoslateInsightUseCase import CryptoSlateInsightsUseCase
-from crawl.executor.usecase.CryptoslateTopNewsUseCase import CryptoSlateUseCase
-from crawl.executor.usecase.DecryptUseCase import DecryptUseCase
-from crawl.executor.usecase.YahooFinanceUseCase import YahooFinanceUseCase
-from utils.ZenrowsUtil import ZenrowsUtil
-
-
-def save_to_json(data: Dict[str, Any], filename: str) -> None:
+from typing import Dict, Any, List, Optional
+
+from crawl.core.DeltaFeed import DeltaFeed, flatten_items
+from crawl.core.SourceRegistry import SourceRegistry, SOURCES
+from utils.CreditLedger import CreditLedger, current_source
+from utils.Deadline import Deadline, current_deadline
+
+RESULTS_DIR = "./../../assets/results"
+
+
+def save_to_json(data: Dict[str, Any], filename: str, output_dir: str = RESULTS_DIR) -> None:
     """Save data to a JSON file in the results directory."""
     # Create results directory if it doesn't exist
-    os.makedirs("./../../assets/results", exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
 
-    filepath = os.path.join('./../../assets/results', filename)
+    filepath = os.path.join(output_dir, filename)
     try:
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
@@ -30,57 +26,378 @@ def save_to_json(data: Dict[str, Any], filename: str) -> None:
         print(f"❌ Error saving to {filepath}: {str(e)}")
 
 
-async def execute_use_case(name: str, coro) -> Dict[str, Any]:
-    """Execute a use case, save results to file, and handle any errors."""
+async def execute_use_case(name: str, coro, output_dir: str = RESULTS_DIR,
+                           semaphore: Optional[asyncio.Semaphore] = None, ledger=None,
+                           deadline: Optional[float] = None, run_deadline: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Execute a use case, save results to file, and handle any errors.
+    Fetches still running `deadline` seconds after the use case starts (or at `run_deadline`,
+    in loop time) are cancelled; the items parsed so far are saved and marked as partial.
+    """
+    # Attribute render credits spent inside this task to the source
+    current_source.set(name)
+    source_deadline = None
     try:
-        result = await coro
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            source_deadline = Deadline.after(deadline, run_deadline)
+            current_deadline.set(source_deadline)
+            result = await coro
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+        if source_deadline is not None and source_deadline.expired:
+            result = {"partial": True, **result}
+            print(f"⏱️ {name} hit its deadline, saving partial results")
         print(f"✅ Successfully executed {name}")
+        if ledger is not None:
+            ledger.record_yield(name, None, len(flatten_items(result)))
 
         # Save individual result to JSON file
         filename = f"{name}.json"
-        save_to_json(result, filename)
+        save_to_json(result, filename, output_dir)
 
         return {name: result}
     except Exception as e:
         error_result = {"error": str(e)}
+        if source_deadline is not None and source_deadline.expired:
+            error_result["partial"] = True
         print(f"❌ Error executing {name}: {str(e)}")
 
         # Save error result to JSON file
         filename = f"{name}_error.json"
-        save_to_json(error_result, filename)
+        save_to_json(error_result, filename, output_dir)
 
         return {name: error_result}
 
 
-async def main():
-    """Execute all use cases concurrently and save their results separately."""
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="crawl", description="Crawl crypto news sources.")
+    parser.add_argument("-s", "--source", action="append", choices=list(SOURCES), dest="sources",
+                        help="Source to crawl (repeatable). Defaults to every source.")
+    parser.add_argument("-c", "--category", action="append", dest="categories",
+                        help="Category for sources that have them (repeatable).")
+    parser.add_argument("-o", "--output", default=RESULTS_DIR, help="Directory for result JSON files.")
+    parser.add_argument("-j", "--concurrency", type=int, default=0,
+                        help="Maximum number of sources crawled at once (0 = unlimited).")
+    parser.add_argument("--memory-budget", type=int, default=0, metavar="MB",
+                        help="Memory-bounded mode: cap the total size of pages parsed at once (0 = off).")
+    parser.add_argument("--no-delta", action="store_true",
+                        help="Skip writing the change feed against the previous run.")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Stream items through the staged fetch/parse/enrich/sink pipeline.")
+    parser.add_argument("--sink", action="append", dest="sinks", metavar="SPEC",
+                        help="Pipeline sink: stdout, file:<dir>, sqlite:<path> or an http(s) URL (repeatable). "
+                             "Defaults to file:<output>.")
+    parser.add_argument("--fetch-workers", type=int, default=4, help="Pipeline/queue worker fetch concurrency.")
+    parser.add_argument("--parse-workers", type=int, default=2, help="Pipeline parse workers.")
+    parser.add_argument("--queue-size", type=int, default=64, help="Capacity of each bounded pipeline queue.")
+    parser.add_argument("--queue", metavar="SPEC",
+                        help="Work-queue mode: sqlite:<path>, redis://host:port/db or local-redis.")
+    parser.add_argument("--run-id", help="Existing run to resume or join as a worker (work-queue mode). "
+                             "Without it a new run id is generated.")
+    parser.add_argument("--enqueue", action="store_true", help="Only seed the run's listing jobs, then exit.")
+    parser.add_argument("--worker", action="store_true", help="Only drain jobs from the queue.")
+    parser.add_argument("--serve", metavar="HOST:PORT",
+                        help="Serve the latest results over HTTP from memory, re-crawling every --interval seconds.")
+    parser.add_argument("--interval", type=float, default=300, help="Seconds between crawls in --serve mode.")
+    parser.add_argument("--tickers", metavar="PATH",
+                        help="JSON ticker/alias dictionary for coin tagging (defaults to the built-in one).")
+    parser.add_argument("--run-budget", type=int, help="Maximum render credits for this run.")
+    parser.add_argument("--daily-budget", type=int, help="Maximum render credits per day (tracked across runs).")
+    parser.add_argument("--detail-reserve", type=float, default=0.2,
+                        help="Share of the budget kept for listing pages; detail fetches stop before it.")
+    parser.add_argument("--sla", type=float, metavar="SECONDS",
+                        help="Run-level deadline; fetches still running are cancelled and partial results saved.")
+    parser.add_argument("--deadline", type=float, metavar="SECONDS", help="Default per-source deadline.")
+    parser.add_argument("--source-deadline", dest="source_deadlines", action="append", default=[],
+                        metavar="NAME=SECONDS", help="Deadline for one source (repeatable).")
+    parser.add_argument("--archive", metavar="DIR",
+                        help="Keep every fetched page in a compressed raw HTML archive for re-parsing "
+                             "(pipeline, queue and serve modes).")
+    parser.add_argument("--follow-articles", action="store_true",
+                        help="Also fetch article bodies for listing-only sources (pipeline and serve modes).")
+    parser.add_argument("--body-workers", type=int, default=4, help="Concurrent article body fetches.")
+    parser.add_argument("--per-host", type=int, default=2, help="Concurrent body fetches per host.")
+    parser.add_argument("--host-delay", type=float, default=1.0,
+                        help="Minimum seconds between body fetches to the same host.")
+    parser.add_argument("--feeds", action="store_true",
+                        help="Discover new articles from RSS/Atom feeds and news sitemaps first, rendering listing "
+                             "pages only for sources whose feed is missing or stale (pipeline and serve modes).")
+    parser.add_argument("--dom-only", action="store_true",
+                        help="Always parse the DOM instead of the JSON-LD/hydration data embedded in pages.")
+    parser.add_argument("--remote-extract", action="store_true",
+                        help="Have ZenRows extract the declared listing fields and return JSON instead of HTML "
+                             "(falls back to local parsing when a source's selectors do not line up).")
+    parser.add_argument("--hedge", action="store_true",
+                        help="Re-send a fetch still running past its source's observed latency percentile and "
+                             "use whichever response arrives first.")
+    parser.add_argument("--hedge-percentile", type=float, default=95.0,
+                        help="Latency percentile after which a fetch is hedged.")
+    parser.add_argument("--hedge-budget", type=float, default=0.05,
+                        help="Maximum hedged (duplicate) fetches as a share of all fetches.")
+    parser.add_argument("--list", action="store_true", help="List available sources and categories, then exit.")
+    return parser.parse_args(argv)
+
+
+def source_deadlines(args: argparse.Namespace) -> Dict[str, float]:
+    """Parse --source-deadline NAME=SECONDS pairs."""
+    deadlines = {}
+    for pair in args.source_deadlines:
+        name, _, seconds = pair.partition("=")
+        try:
+            deadlines[name] = float(seconds)
+        except ValueError:
+            raise SystemExit(f"Invalid --source-deadline: {pair!r}") from None
+    return deadlines
+
+
+def open_archive(args: argparse.Namespace):
+    if not args.archive:
+        return None
+    from crawl.core.HtmlArchive import HtmlArchive
+
+    return HtmlArchive(args.archive)
+
+
+def open_frontier(args: argparse.Namespace):
+    if not args.follow_articles:
+        return None
+    from crawl.core.Frontier import CrawlFrontier
+
+    return CrawlFrontier(os.path.join(args.output, "frontier.db"), per_host=args.per_host,
+                         host_delay=args.host_delay)
+
+
+def open_discovery(args: argparse.Namespace):
+    if not args.feeds:
+        return None
+    from crawl.core.FeedDiscovery import FeedDiscovery
+
+    return FeedDiscovery(os.path.join(args.output, "feed_state.json"))
+
+
+def open_delta(args: argparse.Namespace):
+    """Sink collecting the run's items for the change feed, unless --no-delta."""
+    if args.no_delta:
+        return None
+    from crawl.core.Sinks import DeltaSink
+
+    return DeltaSink()
+
+
+def publish_delta(args: argparse.Namespace, delta, partial) -> None:
+    """Publish what a streaming run collected; `partial` sources (or all, if True) keep unseen items."""
+    if delta is not None:
+        DeltaFeed(args.output).publish(delta.collected(partial))
+
+
+def build_coin_index(args: argparse.Namespace):
+    from crawl.core.CoinIndex import CoinIndex
+    from utils.TickerMatcher import TickerMatcher, load_tickers
+
+    return CoinIndex(TickerMatcher(load_tickers(args.tickers)))
+
+
+async def run_pipeline(registry: SourceRegistry, names: List[str], args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the selected sources through the staged pipeline."""
+    from crawl.core.Pipeline import CrawlPipeline, StageConfig
+    from crawl.core.Sinks import build_sink
+    from crawl.core.SentimentAggregator import SentimentAggregator
+    from crawl.core.TimeIndex import TimeIndex
+    from crawl.core.TrendDetector import TrendDetector
+
+    coin_index = build_coin_index(args)
+    sentiment = SentimentAggregator()
+    sentiment_state = os.path.join(args.output, "sentiment_state.json")
+    sentiment.load(sentiment_state)
+    trends = TrendDetector()
+    trend_state = os.path.join(args.output, "trend_state.json")
+    trends.load(trend_state)
+    delta = open_delta(args)
+    sinks = [build_sink(spec) for spec in (args.sinks or [f"file:{args.output}"])] + ([delta] if delta else [])
+    config = StageConfig(fetch_workers=args.fetch_workers, parse_workers=args.parse_workers,
+                         queue_size=args.queue_size, body_workers=args.body_workers)
+    time_index = TimeIndex()
+    enrichers = [coin_index.index_record, time_index.index_record, sentiment.observe_record, trends.observe_record]
+    pipeline = CrawlPipeline(registry, sinks, config, enrichers=enrichers, sla=args.sla, deadline=args.deadline,
+                             source_deadlines=source_deadlines(args), archive=open_archive(args),
+                             frontier=open_frontier(args), discovery=open_discovery(args))
+    try:
+        stats = await pipeline.run(names, args.categories)
+    finally:
+        if pipeline.archive is not None:
+            # 아카이브 쓰기 스레드에 남은 페이지를 기다립니다.
+            pipeline.archive.close()
+    print(f"✅ Pipeline finished: {stats}")
+    if stats.partial:
+        print(f"⏱️ Partial results (deadline hit): {', '.join(stats.partial)}")
+    if pipeline.frontier is not None:
+        print(f"✅ Article bodies: {pipeline.frontier.stats}")
+        pipeline.frontier.close()
+    if pipeline.discovery is not None:
+        print(f"✅ Discovered via feeds: {', '.join(stats.via_feed) or '-'}")
+        pipeline.discovery.save()
+        pipeline.discovery.close()
+    print(f"✅ {len(time_index.since(3600))} of {len(time_index)} items published in the last hour")
+    print(f"✅ Coin mentions: {coin_index.coins()}")
+    trending = trends.trending(limit=10)
+    if trending:
+        print("📈 Trending: " + ", ".join(f"{row['term']} (x{row['score']})" for row in trending))
+    sentiment.save(sentiment_state)
+    trends.save(trend_state)
+    # 피드 탐색은 새 항목만 가져오므로 그 실행 결과로는 삭제를 판단할 수 없습니다.
+    publish_delta(args, delta, True if pipeline.discovery is not None else stats.incomplete)
+    return stats.per_source
+
+
+async def serve(registry: SourceRegistry, names: List[str], args: argparse.Namespace) -> None:
+    """Crawl on an interval and serve the latest results from memory."""
+    import time
+    from crawl.core.Pipeline import CrawlPipeline, StageConfig
+    from crawl.core.ReadApi import ReadApi, ResultStore, StoreSink
+    from crawl.core.SentimentAggregator import SentimentAggregator
+    from crawl.core.Sinks import build_sink
+    from crawl.core.TrendDetector import TrendDetector
+
+    host, _, port = args.serve.rpartition(":")
+    coin_index = build_coin_index(args)
+    store = ResultStore(coin_index=coin_index)
+    sentiment = SentimentAggregator()
+    sentiment_state = os.path.join(args.output, "sentiment_state.json")
+    sentiment.load(sentiment_state)
+    trends = TrendDetector()
+    trend_state = os.path.join(args.output, "trend_state.json")
+    trends.load(trend_state)
+    api = ReadApi(store, host or "127.0.0.1", int(port), sentiment=sentiment, trends=trends)
+    await api.start()
+
+    config = StageConfig(fetch_workers=args.fetch_workers, parse_workers=args.parse_workers,
+                         queue_size=args.queue_size, body_workers=args.body_workers)
+    deadlines = source_deadlines(args)
+    archive = open_archive(args)
+    frontier = open_frontier(args)
+    discovery = open_discovery(args)
+    ledger = registry.util.ledger
+    try:
+        while True:
+            if ledger is not None:
+                ledger.start_run()
+            delta = open_delta(args)
+            sinks = [StoreSink(store, merge=discovery is not None)] + [build_sink(spec) for spec in (args.sinks or [])]
+            sinks += [delta] if delta else []
+            pipeline = CrawlPipeline(registry, sinks, config,
+                                     enrichers=[coin_index.index_record, sentiment.observe_record,
+                                                trends.observe_record],
+                                     sla=args.sla, deadline=args.deadline, source_deadlines=deadlines,
+                                     archive=archive, frontier=frontier, discovery=discovery)
+            stats = await pipeline.run(names, args.categories)
+            coin_index.prune(time.time() - 86400)
+            sentiment.save(sentiment_state)
+            trends.save(trend_state)
+            if discovery is not None:
+                discovery.save()
+            publish_delta(args, delta, True if discovery is not None else stats.incomplete)
+            if ledger is not None:
+                ledger.save()
+                print(f"✅ Credits this crawl: {ledger.run_credits} (today: {ledger.daily_credits})")
+            print(f"✅ Crawl finished: {stats.per_source}")
+            await asyncio.sleep(args.interval)
+    finally:
+        await api.stop()
+        if archive is not None:
+            archive.close()
+
+
+async def run_queue(registry: SourceRegistry, names: List[str], args: argparse.Namespace) -> Dict[str, Any]:
+    """Seed and/or drain a shared work queue; interrupted runs resume from the queue state."""
+    import time
+    import uuid
+    from crawl.core.Sinks import build_sink
+    from crawl.core.WorkQueue import open_queue, enqueue_run, run_worker
+
+    queue = open_queue(args.queue)
+    if args.worker and not args.run_id:
+        raise SystemExit("--worker needs the --run-id printed when the run was enqueued")
+    # 새 실행은 매번 새 id로 시작합니다. 같은 날 두 번째 실행이 이전 작업과 중복 제거되어 0건이 되지 않도록.
+    run_id = args.run_id or f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    stats: Dict[str, Any] = {"run_id": run_id}
+
+    if not args.worker:
+        stats["enqueued"] = enqueue_run(queue, registry, run_id, names, args.categories)
+        print(f"✅ Enqueued {stats['enqueued']} jobs for run {run_id}")
+    if not args.enqueue:
+        delta = open_delta(args)
+        sinks = [build_sink(spec) for spec in (args.sinks or [f"file:{args.output}"])] + ([delta] if delta else [])
+        archive = open_archive(args)
+        try:
+            stats.update(await run_worker(queue, registry, sinks, run_id, concurrency=args.fetch_workers,
+                                          archive=archive))
+        finally:
+            if archive is not None:
+                archive.close()
+        # 한 워커는 실행의 일부 작업만 처리하므로 빠진 항목을 삭제로 보지 않습니다.
+        publish_delta(args, delta, True)
+    return stats
+
+
+async def main(argv: Optional[List[str]] = None):
+    """Execute the selected use cases concurrently and save their results separately."""
+    args = parse_args(argv)
+
+    if args.list:
+        for spec in SOURCES.values():
+            categories = ", ".join(spec.categories) if spec.categories else "-"
+            print(f"{spec.name:<24} {categories}")
+        return {}
+
+    # Imported here so that `--list` and `--help` never load the HTTP client stack
+    from utils.Hedging import HedgePolicy
+    from utils.ZenrowsUtil import ZenrowsUtil
+
     # Initialize ZenrowsUtil once and share it across use cases
-    zenrows_util = ZenrowsUtil()
-
-    # Initialize all use cases
-    coinness_usecase = CrawlCoinnessUseCase(zenrows_util)
-    coindesk_latest_usecase = CoinDeskLatestNewsUseCase(zenrows_util)
-    coindesk_main_usecase = CoinDeskMainPageUseCase(zenrows_util)
-    cryptonews_usecase = CryptoNewsUseCase(zenrows_util)
-    cryptoslate_insights_usecase = CryptoSlateInsightsUseCase(zenrows_util)
-    cryptoslate_top_usecase = CryptoSlateUseCase(zenrows_util)
-    bitcoin_news_usecase = BitcoinNewsUseCase(zenrows_util)
-    cointelegrap_usecase = CointelegraphUseCase(zenrows_util)
-    decrypt_usecase = DecryptUseCase(zenrows_util)
-    yahoo_finance_usecase = YahooFinanceUseCase(zenrows_util)
-
-    # Create tasks for all use cases
+    ledger = CreditLedger(args.run_budget, args.daily_budget, args.detail_reserve,
+                          state_path=os.path.join(args.output, "credit_ledger.json"))
+    hedging = HedgePolicy(args.hedge_percentile, args.hedge_budget) if args.hedge else None
+    registry = SourceRegistry(ZenrowsUtil(memory_budget=args.memory_budget * 1024 * 1024 or None, ledger=ledger,
+                                          structured_data=not args.dom_only,
+                                          remote_extraction=args.remote_extract, hedging=hedging))
+    try:
+        return await run(registry, args)
+    finally:
+        ledger.save()
+        print(f"✅ Credits this run: {ledger.run_credits} (today: {ledger.daily_credits})")
+        key_stats = registry.util.key_stats()
+        if key_stats and len(key_stats) > 1:
+            print(f"✅ API keys: {key_stats}")
+        hedge_stats = registry.util.hedge_stats()
+        if hedge_stats is not None:
+            print(f"✅ Hedged requests: {hedge_stats}")
+
+
+async def run(registry: SourceRegistry, args: argparse.Namespace):
+    """Dispatch to the selected run mode."""
+    names = args.sources or registry.names()
+
+    if args.serve:
+        return await serve(registry, names, args)
+    if args.queue:
+        return await run_queue(registry, names, args)
+    if args.pipeline:
+        return await run_pipeline(registry, names, args)
+
+    semaphore = asyncio.Semaphore(args.concurrency) if args.concurrency > 0 else None
+
+    deadlines = source_deadlines(args)
+    run_deadline = asyncio.get_running_loop().time() + args.sla if args.sla else None
+
+    # Only the selected sources' modules are imported
     tasks = [
-        execute_use_case("coinness_news", coinness_usecase.fetch_coinness_news()),
-        execute_use_case("coindesk_latest_news", coindesk_latest_usecase.fetch_latest_news()),
-        execute_use_case("coindesk_top_stories", coindesk_main_usecase.fetch_top_stories()),
-        execute_use_case("coindesk_most_read", coindesk_main_usecase.fetch_most_read()),
-        execute_use_case("cryptonews", cryptonews_usecase.fetch_news()),
-        execute_use_case("cryptoslate_insights", cryptoslate_insights_usecase.fetch_insights()),
-        execute_use_case("cryptoslate_top_news", cryptoslate_top_usecase.fetch_top_news()),
-        execute_use_case("cointelegrap", cointelegrap_usecase.fetch_news()),
-        execute_use_case("decrypt", decrypt_usecase.fetch_news()),
-        execute_use_case("yahoo_finance", yahoo_finance_usecase.fetch_news())
+        execute_use_case(result_name, coro, args.output, semaphore, registry.util.ledger,
+                         deadlines.get(result_name, deadlines.get(name, args.deadline)), run_deadline)
+        for name in names
+        for result_name, coro in registry.jobs([name], args.categories)
     ]
 
     print("Starting execution of all use cases...")
@@ -92,6 +409,11 @@ async def main():
     for result in results:
         combined_results.update(result)
 
+    # Publish what changed since the previous run
+    if not args.no_delta:
+        DeltaFeed(args.output).publish(combined_results)
+    return combined_results
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,12 +1,33 @@
-from typing import Optional, List
+from typing import AsyncIterator, Dict, Optional, List, Tuple
 
 from bs4 import BeautifulSoup
 from dataclasses import asdict, dataclass
 from datetime import datetime
 
 from crawl.core.domain.entity.Coindesk import LatestNewsItem
+from crawl.core.domain.entity.Pipeline import FetchJob
+from utils.RemoteExtraction import ExtractSpec
+from utils.TimeNormalizer import normalize_timestamp
 from utils.ZenrowsUtil import ZenrowsUtil
 
+_ITEM = ('div.flex.flex-wrap.justify-center.flex-col.border-0.md\\:gap-6.mdmax\\:gap-4.container-mobile-md'
+         '.container-tablet-medium.container-desktop-lg.md\\:mt-8.mdmax\\:mt-6.mdmax\\:mx-0 div.flex.gap-4')
+# 원격 CSS 추출로 가져올 필드 (parse_latest_news와 같은 요소)
+LATEST_NEWS_SPEC = ExtractSpec(
+    name="coindesk_latest_news",
+    required={
+        "title": f"{_ITEM} a.text-color-charcoal-900 h3",
+        "url": f"{_ITEM} a.text-color-charcoal-900 @href",
+    },
+    optional={
+        "category": f"{_ITEM} a.text-charcoal-600",
+        "content": f"{_ITEM} p.line-clamp-3",
+        "time": f"{_ITEM} span.uppercase",
+        "image_url": f"{_ITEM} img @src",
+    },
+)
+
+
 class CoinDeskLatestNewsUseCase:
     def __init__(self, util: ZenrowsUtil):
         self.zenrows = util
@@ -15,10 +36,49 @@ class CoinDeskLatestNewsUseCase:
 
     async def fetch_latest_news(self):
         """Fetch and parse the latest crypto news from CoinDesk."""
-        soup = await self.zenrows.fetch_page(self.latest_news_url, 5000, None)
-        latest_news = self.parse_latest_news(soup)
+        latest_news = [news_item async for news_item in self.stream_latest_news()]
         return self.convert_latest_news_to_dict(latest_news)
 
+    async def stream_latest_news(self) -> AsyncIterator[LatestNewsItem]:
+        """Yield the latest news items as soon as the page has been parsed."""
+        rows = await self.zenrows.fetch_extracted(self.latest_news_url, 5000, None, LATEST_NEWS_SPEC)
+        if rows:
+            for news_item in self.parse_extracted(FetchJob(url=self.latest_news_url, kind="latest_news"), rows):
+                yield news_item
+            return
+        # 내장 JSON에는 사이드바 등 페이지의 모든 기사가 섞여 있어 최신 뉴스 목록을 구분할 수 없으므로 DOM만 사용합니다.
+        async with self.zenrows.page(self.latest_news_url, 5000, None) as soup:
+            latest_news = self.parse_latest_news(soup)
+        for news_item in latest_news:
+            yield news_item
+
+    def listing_jobs(self, category: Optional[str] = None) -> List[FetchJob]:
+        """Pages the pipeline should fetch for this use case."""
+        return [FetchJob(url=self.latest_news_url, kind="latest_news")]
+
+    def parse_job(self, job: FetchJob, soup: BeautifulSoup) -> Tuple[List[LatestNewsItem], List[FetchJob]]:
+        """Parse a fetched page into items and follow-up jobs."""
+        return self.parse_latest_news(soup), []
+
+    def extract_spec(self, job: FetchJob) -> Optional[ExtractSpec]:
+        """Fields to extract remotely instead of fetching the page."""
+        return LATEST_NEWS_SPEC if job.kind == "latest_news" else None
+
+    def parse_extracted(self, job: FetchJob, rows: List[Dict[str, Optional[str]]]) -> List[LatestNewsItem]:
+        """Map remotely extracted rows to entities, as parse_latest_news would."""
+        return [
+            LatestNewsItem(
+                title=row["title"],
+                content=row["content"],
+                url=row["url"],
+                category=row["category"] or "Uncategorized",
+                published_time=self.parse_time(row["time"]) if row["time"] else None,
+                image_url=row["image_url"],
+                published_ts=normalize_timestamp(row["time"])
+            )
+            for row in rows
+        ]
+
     def parse_latest_news(self, soup: BeautifulSoup) -> List[LatestNewsItem]:
         """Parse the latest news section using the specific selector."""
         news_items = []
@@ -60,7 +120,8 @@ class CoinDeskLatestNewsUseCase:
 
                 # Get published time
                 time_span = article_content.find('span', class_='uppercase')
-                published_time = self.parse_time(time_span.get_text(strip=True)) if time_span else None
+                time_text = time_span.get_text(strip=True) if time_span else None
+                published_time = self.parse_time(time_text) if time_text else None
 
                 # Get image URL
                 image_url = None
@@ -74,7 +135,8 @@ class CoinDeskLatestNewsUseCase:
                     url=url,
                     category=category,
                     published_time=published_time,
-                    image_url=image_url
+                    image_url=image_url,
+                    published_ts=normalize_timestamp(time_text)
                 ))
 
             except Exception as e:
@@ -1,9 +1,11 @@
 from bs4 import BeautifulSoup
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List, Tuple, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
 from crawl.core.domain.entity.Coindesk import NewsStory, MostReadStory, Author
+from crawl.core.domain.entity.Pipeline import FetchJob
+from utils.TimeNormalizer import normalize_timestamp
 from utils.ZenrowsUtil import ZenrowsUtil
 
 class CoinDeskMainPageUseCase:
@@ -13,11 +15,32 @@ class CoinDeskMainPageUseCase:
 
     async def fetch_top_stories(self):
         """Fetch and parse top stories from CoinDesk's main page."""
-        url = self.base_url
-        soup = await self.zenrows.fetch_page(url, 5000, None)
-        news_items = self.parse_top_stories(soup)
+        news_items = [news_item async for news_item in self.stream_top_stories()]
         return self.convert_news_to_dict(news_items)
 
+    async def stream_top_stories(self) -> AsyncIterator[NewsStory]:
+        """Yield top stories as soon as the page has been parsed."""
+        url = self.base_url
+        # 내장 JSON에는 홈페이지의 모든 기사가 섞여 있어 top stories 영역을 구분할 수 없으므로 DOM만 사용합니다.
+        async with self.zenrows.page(url, 5000, None) as soup:
+            news_items = self.parse_top_stories(soup)
+        for news_item in news_items:
+            yield news_item
+
+    def top_stories_jobs(self, category: Optional[str] = None) -> List[FetchJob]:
+        """Pages the pipeline should fetch for the top stories section."""
+        return [FetchJob(url=self.base_url, kind="top_stories")]
+
+    def most_read_jobs(self, category: Optional[str] = None) -> List[FetchJob]:
+        """Pages the pipeline should fetch for the most read section."""
+        return [FetchJob(url=self.base_url, kind="most_read")]
+
+    def parse_job(self, job: FetchJob, soup: BeautifulSoup) -> Tuple[List[Any], List[FetchJob]]:
+        """Parse a fetched page into items and follow-up jobs."""
+        if job.kind == "most_read":
+            return self.parse_most_read(soup), []
+        return self.parse_top_stories(soup), []
+
     def parse_top_stories(self, soup: BeautifulSoup) -> List[NewsStory]:
         """Parse the top stories section using the provided selector."""
         news_items = []
@@ -50,7 +73,8 @@ class CoinDeskMainPageUseCase:
 
                 # Extract publication time
                 time_span = article.find('span', class_='uppercase')
-                published_time = self.parse_time(time_span.get_text(strip=True)) if time_span else None
+                time_text = time_span.get_text(strip=True) if time_span else None
+                published_time = self.parse_time(time_text) if time_text else None
 
                 # Get category
                 category = None
@@ -71,7 +95,8 @@ class CoinDeskMainPageUseCase:
                     published_time=published_time,
                     category=category,
                     image_url=image_url,
-                    is_sponsored=is_sponsored
+                    is_sponsored=is_sponsored,
+                    published_ts=normalize_timestamp(time_text)
                 ))
 
             except Exception as e:
@@ -100,11 +125,17 @@ class CoinDeskMainPageUseCase:
 
     async def fetch_most_read(self):
         """Fetch and parse most read stories from CoinDesk's main page."""
-        url = self.base_url
-        soup = await self.zenrows.fetch_page(url, 5000, None)
-        news_items = self.parse_most_read(soup)
+        news_items = [news_item async for news_item in self.stream_most_read()]
         return self.convert_most_read_to_dict(news_items)
 
+    async def stream_most_read(self) -> AsyncIterator[MostReadStory]:
+        """Yield most read stories in rank order as soon as the page has been parsed."""
+        url = self.base_url
+        async with self.zenrows.page(url, 5000, None) as soup:
+            news_items = self.parse_most_read(soup)
+        for news_item in news_items:
+            yield news_item
+
     def parse_most_read(self, soup: BeautifulSoup) -> List[MostReadStory]:
         """Parse the most read section using the provided selector."""
         news_items = []
@@ -157,7 +188,8 @@ class CoinDeskMainPageUseCase:
                 # Get published time
                 time_span = article_content.find('span', class_='uppercase',
                                                  string=lambda text: text and ('AGO' in text or '202' in text))
-                published_time = self.parse_time(time_span.get_text(strip=True)) if time_span else None
+                time_text = time_span.get_text(strip=True) if time_span else None
+                published_time = self.parse_time(time_text) if time_text else None
 
                 # Get image URL
                 image_url = None
@@ -172,7 +204,8 @@ class CoinDeskMainPageUseCase:
                     content=content,
                     authors=authors,
                     published_time=published_time,
-                    image_url=image_url
+                    image_url=image_url,
+                    published_ts=normalize_timestamp(time_text)
                 ))
 
             except Exception as e:
@@ -1,31 +1,50 @@
 # coinness_crawler.py
-from bs4 import BeautifulSoup
-from typing import List
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import AsyncIterator, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 import re
 
 from crawl.core.domain.entity.Coinness import NewsItem
+from crawl.core.domain.entity.Pipeline import FetchJob
+from utils.TimeNormalizer import coinness_timestamp
 from utils.ZenrowsUtil import ZenrowsUtil
 
+# 큰 페이지는 아래 요소만 파싱합니다
+PAGE_STRAINER = SoupStrainer(id="root")
 
-class CrawlCoinnessUseCase:
-    def __init__(self, util=ZenrowsUtil()):
-        self.zenrows = util
 
-    async def fetch_coinness_news(self):
-        js_instructions = '''
+class CrawlCoinnessUseCase:
+    def __init__(self, util: Optional[ZenrowsUtil] = None):
+        self.zenrows = util if util is not None else ZenrowsUtil()
+        self.url = "https://coinness.com/"
+        self.js_instructions = '''
           [
               {"click": "#root > div > div.Wrap-sc-v065lx-0.hwmGSB > div > main > button"},
               {"wait": 500}
           ]
           '''
-        url = "https://coinness.com/"
-        soup = await self.zenrows.fetch_page(url, 5000, js_instructions)
-        current_date = self.extract_date(soup)
-        news_items = self.parse_news(soup, current_date)
+
+    async def fetch_coinness_news(self):
+        news_items = [news_item async for news_item in self.stream_coinness_news()]
         result = self.convert_news_to_dict(news_items)
         return result
 
+    async def stream_coinness_news(self) -> AsyncIterator[NewsItem]:
+        """페이지를 파싱하는 즉시 뉴스 아이템을 하나씩 반환합니다."""
+        async with self.zenrows.page(self.url, 5000, self.js_instructions, PAGE_STRAINER) as soup:
+            current_date = self.extract_date(soup)
+            news_items = self.parse_news(soup, current_date)
+        for news_item in news_items:
+            yield news_item
+
+    def listing_jobs(self, category: Optional[str] = None) -> List[FetchJob]:
+        """파이프라인에서 가져올 페이지 목록을 반환합니다."""
+        return [FetchJob(url=self.url, kind="listing", js_instructions=self.js_instructions)]
+
+    def parse_job(self, job: FetchJob, soup: BeautifulSoup) -> Tuple[List[NewsItem], List[FetchJob]]:
+        """가져온 페이지에서 뉴스 아이템과 후속 작업을 추출합니다."""
+        return self.parse_news(soup, self.extract_date(soup)), []
+
     @staticmethod
     def extract_date(soup: BeautifulSoup) -> str:
         """페이지에서 날짜 정보를 추출합니다."""
@@ -90,7 +109,8 @@ class CrawlCoinnessUseCase:
                     quote_count=quote_count,
                     coin_tags=coin_tags,
                     date=current_date,
-                    isHighlight=isHighlight
+                    isHighlight=isHighlight,
+                    published_ts=coinness_timestamp(current_date, time)
                 ))
 
             except Exception as e:
@@ -1,15 +1,24 @@
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
+from dataclasses import dataclass, asdict, replace
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from crawl.core.domain.entity.Cointelegraph import NewsContent
+from crawl.core.domain.entity.Pipeline import FetchJob
+from utils.ArticleExtractor import article_strainer, extract_article, find_published_time
+from utils.AsyncStream import completed
+from utils.TimeNormalizer import normalize_timestamp
 from utils.ZenrowsUtil import ZenrowsUtil
 
+# 큰 페이지는 아래 요소만 파싱합니다
+LISTING_STRAINER = SoupStrainer(class_="post-card-inline")
+ARTICLE_STRAINER = article_strainer("post__content-wrapper")
+
 
 class CointelegraphUseCase:
     def __init__(self, util: ZenrowsUtil):
         self.zenrows = util
+        self.article_limit = 3
         self.base_url = "https://cointelegraph.com"
         self.urls = {
             "market": "https://cointelegraph.com/tags/markets",
@@ -21,44 +30,78 @@ class CointelegraphUseCase:
         }
 
     async def fetch_news(self, category: str = "market") -> Dict[str, Any]:
-        """Fetch news from Cointelegraph for a specific category."""
-        url = self.urls.get(category, self.urls["market"])
-        soup = await self.zenrows.fetch_page(url, 5000, None)
-        news_items = await self._parse_news(soup)
+        """Fetch news from Cointelegraph for a specific category, in listing order."""
+        news_items = []
+        # 기사를 목록 순서대로 하나씩 가져와 각 파싱 트리를 다음 기사 전에 해제합니다.
+        for article_url in await self._article_urls(category):
+            news_item = await self._parse_news_item(article_url)
+            if news_item:
+                news_items.append(news_item)
         return self.convert_news_to_dict(news_items)
 
-    async def _parse_news(self, soup: BeautifulSoup) -> List[NewsContent]:
-        """Parse news items from the page."""
-        news_items = []
-        content_list = soup.select(".post-card-inline")
+    async def stream_news(self, category: str = "market") -> AsyncIterator[NewsContent]:
+        """Yield each article as soon as its page has been fetched and parsed (completion order)."""
+        article_urls = await self._article_urls(category)
+        async for news_item in completed(self._parse_news_item(article_url) for article_url in article_urls):
+            if news_item:
+                yield news_item
 
-        for i in range(min(3, len(content_list))):
-            try:
-                article = content_list[i]
-                link = article.find('a', class_='post-card-inline__figure-link')
-                if not link:
-                    continue
+    async def _article_urls(self, category: str) -> List[str]:
+        """Article URLs on the category's listing page, in listing order."""
+        url = self.urls.get(category, self.urls["market"])
+        async with self.zenrows.page(url, 5000, None, LISTING_STRAINER) as soup:
+            article_urls = self.parse_article_links(soup)
+        return article_urls
+
+    def listing_jobs(self, category: Optional[str] = None) -> List[FetchJob]:
+        """Pages the pipeline should fetch for a category."""
+        category = category or "market"
+        return [FetchJob(url=self.urls.get(category, self.urls["market"]), kind="listing", category=category)]
 
-                article_url = self.base_url + link['href']
-                article_soup = await self.zenrows.fetch_page(article_url, 5000, None)
+    def archive_job(self, category: Optional[str], page: int) -> Optional[FetchJob]:
+        """Listing page `page` (1 = newest) of a tag, for backfilling its history."""
+        category = category or "market"
+        url = self.urls.get(category, self.urls["market"])
+        return FetchJob(url=url if page == 1 else f"{url}?page={page}", kind="archive", category=category)
 
-                article_content = article_soup.select(".post__content-wrapper")
-                if article_content:
-                    content = self._clean_text(article_content[0].find('div', class_='post-content'))
-                    news_items.append(NewsContent(content=content))
+    def parse_job(self, job: FetchJob, soup: BeautifulSoup) -> Tuple[List[NewsContent], List[FetchJob]]:
+        """Parse a fetched page into items and follow-up article jobs."""
+        if job.kind == "article":
+            news_item = self.parse_article(soup, job.url)
+            return ([news_item] if news_item else []), []
+        return [], [replace(job, url=url, kind="article", priority=job.priority + 1)
+                    for url in self.parse_article_links(soup, all_links=job.kind == "archive")]
 
-            except Exception as e:
-                print(f"Failed to parse Cointelegraph news item: {e}")
-                continue
+    async def _parse_news_item(self, article_url: str) -> Optional[NewsContent]:
+        """Fetch and parse one article; failures are logged and skipped."""
+        try:
+            async with self.zenrows.page(article_url, 5000, None, ARTICLE_STRAINER,
+                                         priority=1) as article_soup:
+                return self.parse_article(article_soup, article_url)
+        except Exception as e:
+            print(f"Failed to parse Cointelegraph news item: {e}")
+            return None
 
-        return news_items
+    def parse_article_links(self, soup: BeautifulSoup, all_links: bool = False) -> List[str]:
+        """Collect article URLs from the listing page (all of them for archive pages)."""
+        limit = None if all_links else self.article_limit
+        links = []
+        for article in soup.select(".post-card-inline")[:limit]:
+            link = article.find('a', class_='post-card-inline__figure-link')
+            if link and link.get('href'):
+                links.append(self.base_url + link['href'])
+        return links
 
     @staticmethod
-    def _clean_text(text: str) -> str:
-        """Clean HTML text content."""
-        if not isinstance(text, str):
-            text = str(text)
-        return ' '.join(text.split())
+    def parse_article(soup: BeautifulSoup, url: str) -> Optional[NewsContent]:
+        """Extract the clean article body from an article page."""
+        article_content = soup.select(".post__content-wrapper")
+        if not article_content:
+            return None
+
+        article = extract_article(article_content[0].find('div', class_='post-content'), url)
+        return NewsContent(content=article.text, url=url, word_count=article.word_count, links=article.links,
+                           published_ts=normalize_timestamp(find_published_time(soup)))
 
     @staticmethod
     def convert_news_to_dict(news_items: List[NewsContent]) -> Dict[str, Any]:
@@ -1,8 +1,10 @@
 from bs4 import BeautifulSoup
 from dataclasses import asdict, dataclass
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 
 from crawl.core.domain.entity.CryptoNews import CryptoNewsItem
+from crawl.core.domain.entity.Pipeline import FetchJob
+from utils.TimeNormalizer import normalize_timestamp
 from utils.ZenrowsUtil import ZenrowsUtil
 
 class CryptoNewsUseCase:
@@ -12,10 +14,24 @@ class CryptoNewsUseCase:
 
     async def fetch_news(self):
         """Fetch and parse news from CryptoNews."""
-        soup = await self.zenrows.fetch_page(self.news_url, 5000, None)
-        news_items = self.parse_news(soup)
+        news_items = [news_item async for news_item in self.stream_news()]
         return self.convert_news_to_dict(news_items)
 
+    async def stream_news(self) -> AsyncIterator[CryptoNewsItem]:
+        """Yield news items as soon as the page has been parsed."""
+        async with self.zenrows.page(self.news_url, 5000, None) as soup:
+            news_items = self.parse_news(soup)
+        for news_item in news_items:
+            yield news_item
+
+    def listing_jobs(self, category: Optional[str] = None) -> List[FetchJob]:
+        """Pages the pipeline should fetch for this use case."""
+        return [FetchJob(url=self.news_url, kind="news")]
+
+    def parse_job(self, job: FetchJob, soup: BeautifulSoup) -> Tuple[List[CryptoNewsItem], List[FetchJob]]:
+        """Parse a fetched page into items and follow-up jobs."""
+        return self.parse_news(soup), []
+
     def parse_news(self, soup: BeautifulSoup) -> List[CryptoNewsItem]:
         """Parse the news section using the provided selector."""
         news_items = []
@@ -98,7 +114,8 @@ class CryptoNewsUseCase:
                 published_time=published_time,
                 author=author,
                 image_url=image_url,
-                is_featured=is_featured
+                is_featured=is_featured,
+                published_ts=normalize_timestamp(published_time)
             )
 
         except Exception as e:
@@ -1,10 +1,15 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from dataclasses import asdict, dataclass
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 
 from crawl.core.domain.entity.CryptoSalte import InsightNewsItem, Category
+from crawl.core.domain.entity.Pipeline import FetchJob
+from utils.TimeNormalizer import normalize_timestamp
 from utils.ZenrowsUtil import ZenrowsUtil
 
+# 큰 페이지는 아래 요소만 파싱합니다
+PAGE_STRAINER = SoupStrainer(id="main")
+
 
 class CryptoSlateInsightsUseCase:
     def __init__(self, util: ZenrowsUtil):
@@ -13,10 +18,24 @@ class CryptoSlateInsightsUseCase:
 
     async def fetch_insights(self):
         """Fetch and parse insights news from CryptoSlate."""
-        soup = await self.zenrows.fetch_page(self.insights_url, 5000, None)
-        news_items = self.parse_insights(soup)
+        news_items = [news_item async for news_item in self.stream_insights()]
         return self.convert_insights_to_dict(news_items)
 
+    async def stream_insights(self) -> AsyncIterator[InsightNewsItem]:
+        """Yield insights as soon as the page has been parsed."""
+        async with self.zenrows.page(self.insights_url, 5000, None, PAGE_STRAINER) as soup:
+            news_items = self.parse_insights(soup)
+        for news_item in news_items:
+            yield news_item
+
+    def listing_jobs(self, category: Optional[str] = None) -> List[FetchJob]:
+        """Pages the pipeline should fetch for this use case."""
+        return [FetchJob(url=self.insights_url, kind="insights")]
+
+    def parse_job(self, job: FetchJob, soup: BeautifulSoup) -> Tuple[List[InsightNewsItem], List[FetchJob]]:
+        """Parse a fetched page into items and follow-up jobs."""
+        return self.parse_insights(soup), []
+
     def parse_insights(self, soup: BeautifulSoup) -> List[InsightNewsItem]:
         """Parse the insights news section using the provided selector."""
         news_items = []
@@ -73,7 +92,8 @@ class CryptoSlateInsightsUseCase:
                     image_url=image_url,
                     categories=categories,
                     published_time=published_time,
-                    data_source=data_source
+                    data_source=data_source,
+                    published_ts=normalize_timestamp(published_time)
                 ))
 
             except Exception as e:
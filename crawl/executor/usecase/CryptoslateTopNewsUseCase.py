@@ -1,10 +1,46 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from dataclasses import asdict, dataclass
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from crawl.core.domain.entity.CryptoSalte import TopNewsItem
+from crawl.core.domain.entity.Pipeline import FetchJob
+from utils.RemoteExtraction import ExtractSpec
+from utils.TimeNormalizer import normalize_timestamp
 from utils.ZenrowsUtil import ZenrowsUtil
 
+# 큰 페이지는 아래 요소만 파싱합니다
+PAGE_STRAINER = SoupStrainer(id="24Hours")
+
+_ARTICLE = '#\\32 4Hours > div.posts article'
+# 기사 안에서 각 필드를 찾는 선택자. parse_top_news는 select_one으로, 원격 추출은 기사 선택자를 붙여 사용하므로
+# 두 경로가 같은 요소를 가리킵니다 (기사마다 하나씩 일치하지 않으면 ExtractSpec.rows가 로컬 파싱으로 돌립니다).
+_FIELDS = {
+    "title": "h2",
+    "url": "a @href",
+    "image_url": "img @src",
+    # 클래스 없는 첫 번째 span
+    "category": "div.post-meta > span:not([class]):not(span:not([class]) ~ span)",
+    "type": "div.post-meta span.type",
+    "author": "div.post-meta > span:nth-of-type(2)",
+    "published_time": "div.post-meta span.read",
+}
+_REQUIRED = ("title", "url")
+# 원격 CSS 추출로 가져올 필드 (parse_top_news와 같은 요소)
+TOP_NEWS_SPEC = ExtractSpec(
+    name="cryptoslate_top_news",
+    required={name: f"{_ARTICLE} {_FIELDS[name]}" for name in _REQUIRED},
+    optional={name: f"{_ARTICLE} {selector}" for name, selector in _FIELDS.items() if name not in _REQUIRED},
+)
+
+
+def _field(article, name: str) -> Optional[str]:
+    """The field's value inside one article (text, or the attribute after " @"), None when missing."""
+    selector, _, attribute = _FIELDS[name].partition(" @")
+    element = article.select_one(selector)
+    if element is None:
+        return None
+    return element.get(attribute) if attribute else element.get_text(strip=True)
+
 
 class CryptoSlateUseCase:
     def __init__(self, util: ZenrowsUtil):
@@ -13,10 +49,50 @@ class CryptoSlateUseCase:
 
     async def fetch_top_news(self):
         """Fetch and parse top news from CryptoSlate."""
-        soup = await self.zenrows.fetch_page(self.top_news_url, 5000, None)
-        news_items = self.parse_top_news(soup)
+        news_items = [news_item async for news_item in self.stream_top_news()]
         return self.convert_news_to_dict(news_items)
 
+    async def stream_top_news(self) -> AsyncIterator[TopNewsItem]:
+        """Yield top news items as soon as the page has been parsed."""
+        rows = await self.zenrows.fetch_extracted(self.top_news_url, 5000, None, TOP_NEWS_SPEC)
+        if rows:
+            for news_item in self.parse_extracted(FetchJob(url=self.top_news_url, kind="top_news"), rows):
+                yield news_item
+            return
+        async with self.zenrows.page(self.top_news_url, 5000, None, PAGE_STRAINER) as soup:
+            news_items = self.parse_top_news(soup)
+        for news_item in news_items:
+            yield news_item
+
+    def listing_jobs(self, category: Optional[str] = None) -> List[FetchJob]:
+        """Pages the pipeline should fetch for this use case."""
+        return [FetchJob(url=self.top_news_url, kind="top_news")]
+
+    def parse_job(self, job: FetchJob, soup: BeautifulSoup) -> Tuple[List[TopNewsItem], List[FetchJob]]:
+        """Parse a fetched page into items and follow-up jobs."""
+        return self.parse_top_news(soup), []
+
+    def extract_spec(self, job: FetchJob) -> Optional[ExtractSpec]:
+        """Fields to extract remotely instead of fetching the page."""
+        return TOP_NEWS_SPEC if job.kind == "top_news" else None
+
+    @staticmethod
+    def parse_extracted(job: FetchJob, rows: List[Dict[str, Optional[str]]]) -> List[TopNewsItem]:
+        """Map remotely extracted rows to entities, as parse_top_news would."""
+        return [
+            TopNewsItem(
+                title=row["title"],
+                url=row["url"],
+                image_url=row["image_url"] or "",
+                category=row["category"] or "Uncategorized",
+                type=row["type"],
+                author=row["author"] or "Unknown",
+                published_time=row["published_time"],
+                published_ts=normalize_timestamp(row["published_time"])
+            )
+            for row in rows
+        ]
+
     @staticmethod
     def parse_top_news(soup: BeautifulSoup) -> List[TopNewsItem]:
         """Parse the top news section using the provided selector."""
@@ -31,38 +107,25 @@ class CryptoSlateUseCase:
         for article in news_container.find_all('article'):
             try:
                 # Get article link element
-                link = article.find('a')
-                if not link:
+                if not article.find('a'):
                     continue
 
                 # Get title and URL
-                title_elem = article.find('h2')
-                title = title_elem.get_text(strip=True) if title_elem else ""
-                url = link.get('href', '')
+                title = _field(article, "title") or ""
+                url = _field(article, "url") or ""
 
                 # Get image URL
-                img = article.find('img')
-                image_url = img.get('src', '') if img else ''
+                image_url = _field(article, "image_url") or ''
 
                 # Get post metadata
-                post_meta = article.find('div', class_='post-meta')
-                if not post_meta:
+                if not article.find('div', class_='post-meta'):
                     continue
 
-                # Get category and type
-                category_span = post_meta.find('span', {'class': None})
-                type_span = post_meta.find('span', class_='type')
-
-                category = category_span.get_text(strip=True) if category_span else "Uncategorized"
-                article_type = type_span.get_text(strip=True) if type_span else None
-
-                # Get author
-                author_span = post_meta.find_all('span')
-                author = author_span[1].get_text(strip=True) if len(author_span) > 1 else "Unknown"
-
-                # Get published time
-                time_span = post_meta.find('span', class_='read')
-                published_time = time_span.get_text(strip=True) if time_span else None
+                # Get category, type, author and published time
+                category = _field(article, "category") or "Uncategorized"
+                article_type = _field(article, "type")
+                author = _field(article, "author") or "Unknown"
+                published_time = _field(article, "published_time")
 
                 news_items.append(TopNewsItem(
                     title=title,
@@ -71,7 +134,8 @@ class CryptoSlateUseCase:
                     category=category,
                     type=article_type,
                     author=author,
-                    published_time=published_time
+                    published_time=published_time,
+                    published_ts=normalize_timestamp(published_time)
                 ))
 
             except Exception as e:
@@ -1,15 +1,26 @@
-from dataclasses import asdict, dataclass
-from typing import Dict, Any, List
+from dataclasses import asdict, dataclass, replace
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from crawl.core.domain.entity.Decrypt import NewsContent
+from crawl.core.domain.entity.Pipeline import FetchJob
+from utils.ArticleExtractor import article_strainer, ExtractedArticle, extract_article, find_published_time
+from utils.AsyncStream import completed
+from utils.StructuredData import article_records
+from utils.TimeNormalizer import normalize_timestamp
 from utils.ZenrowsUtil import ZenrowsUtil
 
+# 큰 페이지는 아래 요소만 파싱합니다
+LISTING_STRAINER = SoupStrainer(class_="linkbox")
+ARTICLE_STRAINER = article_strainer("z-2")
+
 
 class DecryptUseCase:
     def __init__(self, util: ZenrowsUtil):
         self.zenrows = util
+        self.article_limit = 3
         self.base_url = "https://decrypt.co/"
         self.urls = {
             "crypto": "https://decrypt.co/news/cryptocurrencies",
@@ -20,44 +31,117 @@ class DecryptUseCase:
         }
 
     async def fetch_news(self, category: str = "crypto") -> Dict[str, Any]:
-        """Fetch news from Decrypt for a specific category."""
-        url = self.urls.get(category, self.urls["crypto"])
-        soup = await self.zenrows.fetch_page(url, 5000, None)
-        news_items = await self._parse_news(soup)
+        """Fetch news from Decrypt for a specific category, in listing order."""
+        news_items = []
+        # 기사를 목록 순서대로 하나씩 가져와 각 파싱 트리를 다음 기사 전에 해제합니다.
+        for article_url in await self._article_urls(category):
+            news_item = await self._parse_news_item(article_url)
+            if news_item:
+                news_items.append(news_item)
         return self.convert_news_to_dict(news_items)
 
-    async def _parse_news(self, soup: BeautifulSoup) -> List[NewsContent]:
-        """Parse news items from the page."""
-        news_items = []
-        content_list = soup.select(".linkbox")
+    async def stream_news(self, category: str = "crypto") -> AsyncIterator[NewsContent]:
+        """Yield each article as soon as its page has been fetched and parsed (completion order)."""
+        article_urls = await self._article_urls(category)
+        async for news_item in completed(self._parse_news_item(article_url) for article_url in article_urls):
+            if news_item:
+                yield news_item
 
-        for i in range(min(3, len(content_list))):
-            try:
-                article = content_list[i]
-                link = article.find('a', class_='linkbox__overlay')
-                if not link:
-                    continue
+    async def _article_urls(self, category: str) -> List[str]:
+        """Article URLs on the category's listing page, in listing order."""
+        url = self.urls.get(category, self.urls["crypto"])
+        html = await self.zenrows.fetch_html(url, 5000, None)
+        article_urls = self.parse_article_links_data(html) if self.zenrows.structured_data else []
+        if not article_urls:
+            async with self.zenrows.parsed(html, LISTING_STRAINER) as soup:
+                article_urls = self.parse_article_links(soup)
+        del html
+        return article_urls
 
-                article_url = self.base_url + link['href']
-                article_soup = await self.zenrows.fetch_page(article_url, 5000, None)
+    def listing_jobs(self, category: Optional[str] = None) -> List[FetchJob]:
+        """Pages the pipeline should fetch for a category."""
+        category = category or "crypto"
+        return [FetchJob(url=self.urls.get(category, self.urls["crypto"]), kind="listing", category=category)]
 
-                article_content = article_soup.select(".z-2")
-                if article_content:
-                    content = self._clean_text(article_content[0].find('div', class_='post-content'))
-                    news_items.append(NewsContent(content=content))
+    def archive_job(self, category: Optional[str], page: int) -> Optional[FetchJob]:
+        """Listing page `page` (1 = newest) of a category, for backfilling its history."""
+        category = category or "crypto"
+        url = self.urls.get(category, self.urls["crypto"])
+        return FetchJob(url=url if page == 1 else f"{url}?page={page}", kind="archive", category=category)
 
-            except Exception as e:
-                print(f"Failed to parse Decrypt news item: {e}")
-                continue
+    def parse_job(self, job: FetchJob, soup: BeautifulSoup) -> Tuple[List[NewsContent], List[FetchJob]]:
+        """Parse a fetched page into items and follow-up article jobs."""
+        if job.kind == "article":
+            news_item = self.parse_article(soup, job.url)
+            return ([news_item] if news_item else []), []
+        return [], [replace(job, url=url, kind="article", priority=job.priority + 1)
+                    for url in self.parse_article_links(soup, all_links=job.kind == "archive")]
 
-        return news_items
+    def parse_raw(self, job: FetchJob, html: str) -> Optional[Tuple[List[NewsContent], List[FetchJob]]]:
+        """Parse the page's embedded JSON without a DOM; None when it has none (use parse_job)."""
+        if job.kind == "article":
+            news_item = self.parse_article_data(html, job.url)
+            return ([news_item], []) if news_item else None
+        urls = self.parse_article_links_data(html, all_links=job.kind == "archive")
+        if not urls:
+            return None
+        return [], [replace(job, url=url, kind="article", priority=job.priority + 1) for url in urls]
+
+    async def _parse_news_item(self, article_url: str) -> Optional[NewsContent]:
+        """Fetch and parse one article; failures are logged and skipped."""
+        try:
+            html = await self.zenrows.fetch_html(article_url, 5000, None, priority=1)
+            news_item = self.parse_article_data(html, article_url) if self.zenrows.structured_data else None
+            if news_item is None:
+                async with self.zenrows.parsed(html, ARTICLE_STRAINER) as article_soup:
+                    news_item = self.parse_article(article_soup, article_url)
+            return news_item
+        except Exception as e:
+            print(f"Failed to parse Decrypt news item: {e}")
+            return None
+
+    def parse_article_links(self, soup: BeautifulSoup, all_links: bool = False) -> List[str]:
+        """Collect article URLs from the listing page (all of them for archive pages)."""
+        limit = None if all_links else self.article_limit
+        links = []
+        for article in soup.select(".linkbox")[:limit]:
+            link = article.find('a', class_='linkbox__overlay')
+            if link and link.get('href'):
+                links.append(urljoin(self.base_url, link["href"]))
+        return links
+
+    def parse_article_links_data(self, html: str, all_links: bool = False) -> List[str]:
+        """Article URLs from the listing page's embedded JSON."""
+        host = urlsplit(self.base_url).netloc
+        links = [record["url"] for record in article_records(html, self.base_url)
+                 if urlsplit(record["url"]).netloc == host]
+        return links if all_links else links[:self.article_limit]
 
     @staticmethod
-    def _clean_text(text: str) -> str:
-        """Clean HTML text content."""
-        if not isinstance(text, str):
-            text = str(text)
-        return ' '.join(text.split())
+    def parse_article_data(html: str, url: str) -> Optional[NewsContent]:
+        """
+        The article body from the page's JSON-LD articleBody. It is plain text, so unlike
+        parse_article the links inside the body are not collected.
+        """
+        for record in article_records(html, url):
+            if not record["body"]:
+                continue
+            article = ExtractedArticle(paragraphs=[line.strip() for line in record["body"].splitlines()
+                                                   if line.strip()])
+            return NewsContent(content=article.text, url=url, word_count=article.word_count,
+                               published_ts=normalize_timestamp(record["published"]))
+        return None
+
+    @staticmethod
+    def parse_article(soup: BeautifulSoup, url: str) -> Optional[NewsContent]:
+        """Extract the clean article body from an article page."""
+        article_content = soup.select(".z-2")
+        if not article_content:
+            return None
+
+        article = extract_article(article_content[0].find('div', class_='post-content'), url)
+        return NewsContent(content=article.text, url=url, word_count=article.word_count, links=article.links,
+                           published_ts=normalize_timestamp(find_published_time(soup)))
 
     @staticmethod
     def convert_news_to_dict(news_items: List[NewsContent]) -> Dict[str, Any]:
@@ -1,15 +1,27 @@
-from dataclasses import asdict, dataclass
-from typing import Dict, Any, List
+import json
+from dataclasses import asdict, dataclass, replace
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from crawl.core.domain.entity.YahooFinance import NewsContent
+from crawl.core.domain.entity.Pipeline import FetchJob
+from utils.ArticleExtractor import article_strainer, extract_article, find_published_time
+from utils.AsyncStream import completed
+from utils.TimeNormalizer import normalize_timestamp
 from utils.ZenrowsUtil import ZenrowsUtil
 
+# 큰 페이지는 아래 요소만 파싱합니다
+LISTING_STRAINER = SoupStrainer(class_="stream-items")
+ARTICLE_STRAINER = article_strainer("body-wrap")
+# 무한 스크롤 목록을 과거로 넘길 수 있는 최대 횟수 (렌더링 시간이 스크롤 수에 비례)
+ARCHIVE_SCROLLS = 20
+
 
 class YahooFinanceUseCase:
     def __init__(self, util: ZenrowsUtil):
         self.zenrows = util
+        self.article_limit = 3
         self.base_url = "https://finance.yahoo.com/topic/crypto/"
         self.urls = {
             "tech": "https://finance.yahoo.com/topic/tech/",
@@ -19,45 +31,87 @@ class YahooFinanceUseCase:
         }
 
     async def fetch_news(self, category: str = "crypto") -> Dict[str, Any]:
-        """Fetch news from Yahoo Finance for a specific category."""
-        url = self.urls.get(category, self.urls["crypto"])
-        soup = await self.zenrows.fetch_page(url, 5000, None)
-        news_items = await self._parse_news(soup)
+        """Fetch news from Yahoo Finance for a specific category, in listing order."""
+        news_items = []
+        # 기사를 목록 순서대로 하나씩 가져와 각 파싱 트리를 다음 기사 전에 해제합니다.
+        for article_url in await self._article_urls(category):
+            news_item = await self._parse_news_item(article_url)
+            if news_item:
+                news_items.append(news_item)
         return self.convert_news_to_dict(news_items)
 
-    async def _parse_news(self, soup: BeautifulSoup) -> List[NewsContent]:
-        """Parse news items from the page."""
-        news_items = []
-        content_list = soup.select('.stream-items')
-        if not content_list:
-            return news_items
+    async def stream_news(self, category: str = "crypto") -> AsyncIterator[NewsContent]:
+        """Yield each article as soon as its page has been fetched and parsed (completion order)."""
+        article_urls = await self._article_urls(category)
+        async for news_item in completed(self._parse_news_item(article_url) for article_url in article_urls):
+            if news_item:
+                yield news_item
 
-        main_content = content_list[0]
-        links = main_content.find_all('a', class_='subtle-link')
+    async def _article_urls(self, category: str) -> List[str]:
+        """Article URLs on the category's listing page, in listing order."""
+        url = self.urls.get(category, self.urls["crypto"])
+        async with self.zenrows.page(url, 5000, None, LISTING_STRAINER) as soup:
+            article_urls = self.parse_article_links(soup)
+        return article_urls
+
+    def listing_jobs(self, category: Optional[str] = None) -> List[FetchJob]:
+        """Pages the pipeline should fetch for a category."""
+        category = category or "crypto"
+        return [FetchJob(url=self.urls.get(category, self.urls["crypto"]), kind="listing", category=category)]
+
+    def archive_job(self, category: Optional[str], page: int) -> Optional[FetchJob]:
+        """
+        The topic stream scrolled `page - 1` times, for backfilling its history. The stream has
+        no page URLs; each scroll loads the next batch below the ones already shown.
+        """
+        if page - 1 > ARCHIVE_SCROLLS:
+            return None
+        category = category or "crypto"
+        steps = [{"scroll_y": 3000}, {"wait": 1500}] * (page - 1)
+        return FetchJob(url=self.urls.get(category, self.urls["crypto"]), kind="archive", category=category,
+                        js_instructions=json.dumps(steps) if steps else None)
 
-        for i in range(min(3, len(links))):
-            try:
-                link = links[i]
-                article_url = link['href']
-                article_soup = await self.zenrows.fetch_page(article_url, 5000, None)
+    def parse_job(self, job: FetchJob, soup: BeautifulSoup) -> Tuple[List[NewsContent], List[FetchJob]]:
+        """Parse a fetched page into items and follow-up article jobs."""
+        if job.kind == "article":
+            news_item = self.parse_article(soup, job.url)
+            return ([news_item] if news_item else []), []
+        return [], [replace(job, url=url, kind="article", priority=job.priority + 1)
+                    for url in self.parse_article_links(soup, all_links=job.kind == "archive")]
 
-                article_content = article_soup.select(".body-wrap")
-                if article_content:
-                    content = self._clean_text(article_content[0].find('div', class_='body'))
-                    news_items.append(NewsContent(content=content))
+    async def _parse_news_item(self, article_url: str) -> Optional[NewsContent]:
+        """Fetch and parse one article; failures are logged and skipped."""
+        try:
+            async with self.zenrows.page(article_url, 5000, None, ARTICLE_STRAINER,
+                                         priority=1) as article_soup:
+                return self.parse_article(article_soup, article_url)
+        except Exception as e:
+            print(f"Failed to parse Yahoo Finance news item: {e}")
+            return None
 
-            except Exception as e:
-                print(f"Failed to parse Yahoo Finance news item: {e}")
-                continue
+    def parse_article_links(self, soup: BeautifulSoup, all_links: bool = False) -> List[str]:
+        """Collect article URLs from the listing page (all of them for archive pages)."""
+        limit = None if all_links else self.article_limit
+        links = []
+        content_list = soup.select('.stream-items')
+        if not content_list:
+            return links
 
-        return news_items
+        for link in content_list[0].find_all('a', class_='subtle-link')[:limit]:
+            if link.get('href'):
+                links.append(link['href'])
+        return links
 
     @staticmethod
-    def _clean_text(text: str) -> str:
-        """Clean HTML text content."""
-        if not isinstance(text, str):
-            text = str(text)
-        return ' '.join(text.split())
+    def parse_article(soup: BeautifulSoup, url: str) -> Optional[NewsContent]:
+        """Extract the clean article body from an article page."""
+        article_content = soup.select(".body-wrap")
+        if not article_content:
+            return None
+
+        article = extract_article(article_content[0].find('div', class_='body'), url)
+        return NewsContent(content=article.text, url=url, word_count=article.word_count, links=article.links,
+                           published_ts=normalize_timestamp(find_published_time(soup)))
 
     @staticmethod
     def convert_news_to_dict(news_items: List[NewsContent]) -> Dict[str, Any]:
@@ -0,0 +1,174 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+
+# 키 자체의 문제를 뜻하는 ZenRows 응답 상태
+AUTH_STATUSES = {401}
+QUOTA_STATUSES = {402}
+THROTTLE_STATUSES = {429}
+
+
+class NoApiKeyAvailable(Exception):
+    """Raised when every key in the pool has been ejected (auth or quota errors)."""
+
+
+@dataclass
+class ApiKey:
+    key: str = field(repr=False)
+    concurrency: int = 5
+    rate: Optional[float] = None  # 초당 최대 요청 수 (None = 제한 없음)
+    quota: Optional[int] = None  # 남은 크레딧 (None = 추적하지 않음)
+    label: str = ""
+
+    # 실행 중 상태
+    active: int = field(default=0, init=False)
+    requests: int = field(default=0, init=False)
+    errors: int = field(default=0, init=False)
+    ejections: int = field(default=0, init=False)
+    next_at: float = field(default=0.0, init=False, repr=False)
+    ejected_until: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self):
+        if not self.label:
+            self.label = f"{self.key[:4]}…{self.key[-2:]}" if len(self.key) > 8 else "key"
+
+    @property
+    def load(self) -> float:
+        return self.active / self.concurrency
+
+    def usable(self, now: float) -> bool:
+        return self.ejected_until <= now and (self.quota is None or self.quota > 0)
+
+
+def parse_api_keys(spec: Optional[str]) -> List[ApiKey]:
+    """
+    Keys from a comma-separated `key[:concurrency[:rate[:quota]]]` list,
+    e.g. ZENROWS_API_KEYS="abc:10:5,def:5::250000". Empty fields keep the defaults.
+    """
+    keys = []
+    for entry in (spec or "").split(","):
+        parts = entry.strip().split(":")
+        if not parts[0]:
+            continue
+        fields = parts + [""] * (4 - len(parts))
+        keys.append(ApiKey(key=fields[0], concurrency=int(fields[1] or 5),
+                           rate=float(fields[2]) if fields[2] else None,
+                           quota=int(fields[3]) if fields[3] else None))
+    return keys
+
+
+def keys_from_env() -> List[ApiKey]:
+    """ZENROWS_API_KEYS when set, otherwise the single ZENROWS_API_KEY."""
+    keys = parse_api_keys(os.environ.get("ZENROWS_API_KEYS"))
+    if not keys and os.environ.get("ZENROWS_API_KEY"):
+        keys = [ApiKey(os.environ["ZENROWS_API_KEY"])]
+    return keys
+
+
+class KeyLease:
+    """One request's hold on a key; report() the response so the pool can account for it."""
+
+    def __init__(self, pool: "ApiKeyPool", key: ApiKey):
+        self.pool = pool
+        self.key = key
+
+    def report(self, status: int, headers: Optional[Dict[str, str]] = None) -> bool:
+        """Account for a response; False when the key itself was rejected and the request should move on."""
+        return self.pool.report(self.key, status, headers or {})
+
+
+class ApiKeyPool:
+    """
+    API keys with their own concurrency, rate and credit quota. Each request goes to the
+    least-loaded key that has a free slot, has waited out its rate interval and still has
+    quota. Keys rejected for auth or quota are ejected for `eject_seconds`; throttled keys
+    (429) rest for Retry-After or `throttle_seconds`.
+    """
+
+    def __init__(self, keys: List[ApiKey], eject_seconds: float = 3600.0, throttle_seconds: float = 30.0,
+                 default_cost: int = 5):
+        if not keys:
+            raise ValueError("ApiKeyPool needs at least one key")
+        self.keys = keys
+        self.eject_seconds = eject_seconds
+        self.throttle_seconds = throttle_seconds
+        self.default_cost = default_cost
+        self._changed = asyncio.Event()
+
+    def _pick(self, now: float) -> Optional[ApiKey]:
+        ready = [key for key in self.keys
+                 if key.usable(now) and key.active < key.concurrency and key.next_at <= now]
+        return min(ready, key=lambda key: (key.load, key.requests)) if ready else None
+
+    async def acquire(self) -> ApiKey:
+        """Wait for a key; raises NoApiKeyAvailable when none can ever become ready."""
+        while True:
+            now = time.monotonic()
+            key = self._pick(now)
+            if key is not None:
+                key.active += 1
+                key.requests += 1
+                if key.rate:
+                    key.next_at = now + 1 / key.rate
+                return key
+
+            usable = [key for key in self.keys if key.usable(now)]
+            if not usable:
+                # 쿼터가 바닥난 키는 돌아오지 않고, 퇴출된 키는 기다려도 오래 걸립니다.
+                raise NoApiKeyAvailable("All API keys are ejected or out of quota")
+            # 슬롯이 비면 release()가 깨우고, 요청 간격/429 휴식만 남은 키는 그 시각까지 기다립니다.
+            waits = [key.next_at - now for key in usable if key.active < key.concurrency and key.next_at > now]
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), min(waits) if waits else None)
+            except asyncio.TimeoutError:
+                pass
+
+    def release(self, key: ApiKey) -> None:
+        key.active -= 1
+        self._changed.set()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[KeyLease]:
+        key = await self.acquire()
+        try:
+            yield KeyLease(self, key)
+        finally:
+            self.release(key)
+
+    def report(self, key: ApiKey, status: int, headers: Dict[str, str]) -> bool:
+        now = time.monotonic()
+        headers = {name.lower(): value for name, value in headers.items()}
+        if status in AUTH_STATUSES or status in QUOTA_STATUSES:
+            key.errors += 1
+            if key.ejected_until <= now:  # 동시에 진행 중이던 요청의 실패는 한 번만 셉니다.
+                key.ejections += 1
+                print(f"⚠️ API key {key.label} rejected (status {status}), ejected for {self.eject_seconds:.0f}s")
+            key.ejected_until = now + self.eject_seconds
+            return False
+        if status in THROTTLE_STATUSES:
+            key.errors += 1
+            try:
+                rest = float(headers.get("retry-after") or self.throttle_seconds)
+            except ValueError:
+                rest = self.throttle_seconds
+            # 퇴출하지 않고 다음 요청 시각만 늦춥니다.
+            key.next_at = max(key.next_at, now + rest)
+            return False
+        if key.quota is not None:
+            try:
+                key.quota -= int(headers.get("x-request-cost") or self.default_cost)
+            except ValueError:
+                key.quota -= self.default_cost
+        return True
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        now = time.monotonic()
+        return {
+            key.label: {"requests": key.requests, "errors": key.errors, "ejections": key.ejections,
+                        "quota": key.quota, "available": key.usable(now)}
+            for key in self.keys
+        }
@@ -0,0 +1,154 @@
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional
+from urllib.parse import urljoin, urlparse
+
+from bs4 import NavigableString, SoupStrainer, Tag, Comment
+
+# 본문이 아닌 요소 (스크립트, 임베드, 광고 등)
+SKIP_TAGS = {
+    "script", "style", "noscript", "template", "iframe", "object", "embed", "svg", "canvas",
+    "video", "audio", "form", "button", "input", "select", "textarea", "nav", "aside", "footer",
+}
+
+BLOCK_TAGS = {
+    "p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "blockquote", "pre", "figcaption",
+    "div", "section", "article", "header", "main", "ul", "ol", "table", "tr", "dd", "dt", "br", "hr",
+}
+
+BOILERPLATE_PATTERN = re.compile(
+    r"share|social|related|recommend|newsletter|subscribe|promo|advert|\bads?\b|\bad[-_]|sponsor|"
+    r"embed|twitter-tweet|instagram|tiktok|outbrain|taboola|read-more|readmore|more-stories|"
+    r"author-bio|tags?-list|breadcrumb|comment",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class ExtractedArticle:
+    paragraphs: List[str] = field(default_factory=list)
+    links: List[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.paragraphs)
+
+    @property
+    def word_count(self) -> int:
+        return sum(len(paragraph.split()) for paragraph in self.paragraphs)
+
+
+def _is_boilerplate(tag: Tag) -> bool:
+    if tag.name in SKIP_TAGS:
+        return True
+    if tag.attrs is None:
+        return False
+    marker = " ".join(tag.get("class", [])) + " " + (tag.get("id") or "")
+    if tag.get("aria-hidden") == "true" or tag.get("hidden") is not None:
+        return True
+    return bool(marker.strip()) and BOILERPLATE_PATTERN.search(marker) is not None
+
+
+def extract_article(body: Optional[Tag], base_url: str = "") -> ExtractedArticle:
+    """기사 본문 요소를 한 번 순회하며 광고/공유/관련 기사 등을 제외한 문단과 링크를 추출합니다."""
+    article = ExtractedArticle()
+    if body is None:
+        return article
+
+    buffer: List[str] = []
+    seen_links = set()
+
+    def flush() -> None:
+        text = " ".join("".join(buffer).split())
+        buffer.clear()
+        if text:
+            article.paragraphs.append(text)
+
+    # (node, is_closing) 스택으로 재귀 없이 순회
+    stack = [(body, False)]
+    while stack:
+        node, closing = stack.pop()
+
+        if closing:
+            flush()
+            continue
+
+        if isinstance(node, Comment):
+            continue
+        if isinstance(node, NavigableString):
+            buffer.append(str(node))
+            continue
+        if not isinstance(node, Tag) or (node is not body and _is_boilerplate(node)):
+            continue
+
+        if node.name == "a":
+            href = node.get("href")
+            if href and not href.startswith(("#", "javascript:", "mailto:")):
+                link = urljoin(base_url, href)
+                if urlparse(link).scheme in ("http", "https") and link not in seen_links:
+                    seen_links.add(link)
+                    article.links.append(link)
+
+        is_block = node.name in BLOCK_TAGS
+        if is_block:
+            flush()
+            stack.append((node, True))
+        stack.extend((child, False) for child in reversed(node.contents))
+
+    flush()
+    return article
+
+
+def find_published_time(soup: Tag) -> Optional[str]:
+    """기사 페이지의 메타데이터에서 발행 시각 문자열을 찾습니다."""
+    meta = soup.find("meta", attrs={"property": "article:published_time"}) or \
+        soup.find(attrs={"itemprop": "datePublished"})
+    if meta is not None:
+        value = meta.get("content") or meta.get("datetime")
+        if value:
+            return value
+    time_tag = soup.find("time", attrs={"datetime": True})
+    return time_tag["datetime"] if time_tag else None
+
+
+def article_strainer(class_name: str) -> SoupStrainer:
+    """
+    큰 기사 페이지용 strainer: class_name 요소와 함께 find_published_time이 읽는
+    발행 시각 메타/<time> 태그도 남깁니다 (본문 밖에 있어도 published_ts를 구할 수 있도록).
+    """
+    def keep(name: str, attrs: dict) -> bool:
+        if name == "meta" and attrs.get("property") == "article:published_time":
+            return True
+        if attrs.get("itemprop") == "datePublished" or (name == "time" and attrs.get("datetime")):
+            return True
+        classes = attrs.get("class") or ""
+        return class_name in (classes.split() if isinstance(classes, str) else classes)
+
+    return SoupStrainer(keep)
+
+
+def _paragraph_chars(tag: Tag) -> int:
+    return sum(len(p.get_text(strip=True)) for p in tag.find_all("p", recursive=False))
+
+
+def find_article_body(soup: Tag) -> Optional[Tag]:
+    """
+    선택자를 모르는 기사 페이지에서 본문 요소를 찾습니다.
+    articleBody 마크업 → <article> → 직계 <p> 텍스트가 가장 많은 요소 순으로 시도합니다.
+    """
+    body = soup.find(attrs={"itemprop": "articleBody"})
+    if body is not None:
+        return body
+    articles = soup.find_all("article")
+    if articles:
+        return max(articles, key=lambda tag: len(tag.get_text(strip=True)))
+    best, best_chars, seen = None, 0, set()
+    for paragraph in soup.find_all("p"):
+        parent = paragraph.parent
+        if parent is None or id(parent) in seen:
+            continue
+        seen.add(id(parent))
+        chars = _paragraph_chars(parent)
+        if chars > best_chars:
+            best, best_chars = parent, chars
+    return best
@@ -0,0 +1,51 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+_DONE = object()
+
+
+async def completed(awaitables: Iterable[Awaitable[T]]) -> AsyncIterator[T]:
+    """
+    Results of the awaitables in the order they finish.
+    If the consumer stops early (break, exception), the unfinished ones are cancelled.
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def merge(streams: List[Tuple[K, AsyncIterator[T]]], buffer: int = 64) -> AsyncIterator[Tuple[K, T]]:
+    """
+    (key, item) pairs from several async iterators run concurrently, as each item arrives.
+    An iterator that raises ends on its own; the error is printed and the others keep going.
+    """
+    queue: asyncio.Queue = asyncio.Queue(buffer)
+
+    async def drain(key: K, stream: AsyncIterator[T]) -> None:
+        try:
+            async for item in stream:
+                await queue.put((key, item))
+        except Exception as e:
+            print(f"❌ {key} stream failed: {e}")
+        finally:
+            await queue.put(_DONE)
+
+    tasks = [asyncio.create_task(drain(key, stream)) for key, stream in streams]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            entry = await queue.get()
+            if entry is _DONE:
+                remaining -= 1
+                continue
+            yield entry
+    finally:
+        for task in tasks:
+            task.cancel()
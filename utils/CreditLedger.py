@@ -0,0 +1,165 @@
+import json
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional
+
+# 전송 수단별 요청당 크레딧 (ZenRows JS 렌더링 = 5)
+CREDIT_COSTS = {"zenrows": 5, "direct": 0}
+
+# 요청을 보낸 소스 이름 (use case 실행 단위로 설정)
+current_source: ContextVar[Optional[str]] = ContextVar("current_source", default=None)
+
+
+class BudgetExceeded(Exception):
+    """Raised instead of fetching when the render budget does not allow the request."""
+
+
+@dataclass
+class SourceUsage:
+    renders: int = 0
+    credits: int = 0
+    bytes: int = 0
+    parsed_pages: int = 0
+    items: int = 0
+    zero_yield: int = 0
+    zero_streak: int = 0
+    skipped: int = 0
+
+    @property
+    def items_per_render(self) -> float:
+        return self.items / self.renders if self.renders else 0.0
+
+
+class CreditLedger:
+    """
+    Per-source accounting of render credits, bytes and yielded items, with per-run and per-day budgets.
+    Detail fetches (priority > 0) stop once spend reaches the reserve threshold so the remaining budget
+    stays available for listing pages.
+    """
+
+    def __init__(self, run_budget: Optional[int] = None, daily_budget: Optional[int] = None,
+                 detail_reserve: float = 0.2, state_path: Optional[str] = None, zero_streak_alert: int = 3):
+        self.run_budget = run_budget
+        self.daily_budget = daily_budget
+        self.detail_reserve = detail_reserve
+        self.state_path = state_path
+        self.zero_streak_alert = zero_streak_alert
+        self.sources: Dict[str, SourceUsage] = {}
+        self.run_credits = 0
+        # 진행 중인 요청에 예약된 크레딧 (동시 요청이 함께 예산을 넘지 않도록)
+        self.reserved = 0
+        self.day = time.strftime("%Y-%m-%d")
+        self.daily_credits = self._load_daily()
+
+    def _load_daily(self) -> int:
+        if not self.state_path:
+            return 0
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f).get("daily", {}).get(self.day, 0)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return 0
+
+    def _roll_day(self) -> None:
+        """Switch the daily total to a new date once the day changes (long-running serve mode)."""
+        today = time.strftime("%Y-%m-%d")
+        if today == self.day:
+            return
+        # 전날 합계를 먼저 기록한 뒤 새 날짜의 합계로 전환
+        self.save()
+        self.day = today
+        self.daily_credits = self._load_daily()
+
+    def start_run(self) -> None:
+        """Reset the per-run counters before another crawl with the same ledger (serve mode)."""
+        self._roll_day()
+        self.sources = {}
+        self.run_credits = 0
+
+    def usage(self, source: str) -> SourceUsage:
+        usage = self.sources.get(source)
+        if usage is None:
+            usage = self.sources[source] = SourceUsage()
+        return usage
+
+    def allow(self, source: str, transport: str = "zenrows", priority: int = 0, held: int = 0) -> bool:
+        """
+        Whether a fetch may go ahead on `transport`; low-priority (detail) fetches are cut first.
+        `held` is what the caller has already reserved, so it is not counted twice. A refusal only
+        rules out this transport; the request is dropped (record_skip) when every transport is refused.
+        """
+        cost = CREDIT_COSTS.get(transport, 0)
+        if cost == 0:
+            return True
+        self._roll_day()
+        pending = self.reserved - held + cost
+        after = []
+        if self.run_budget:
+            after.append((self.run_credits + pending) / self.run_budget)
+        if self.daily_budget:
+            after.append((self.daily_credits + pending) / self.daily_budget)
+        if not after:
+            return True
+        limit = 1.0 - self.detail_reserve if priority > 0 else 1.0
+        return max(after) <= limit
+
+    def record_skip(self, source: str) -> None:
+        """Count a request dropped because no transport was within budget."""
+        self.usage(source).skipped += 1
+
+    def reserve(self, credits: int) -> None:
+        self.reserved += credits
+
+    def release(self, credits: int) -> None:
+        self.reserved -= credits
+
+    def record_fetch(self, source: str, transport: str, size: int) -> None:
+        cost = CREDIT_COSTS.get(transport, 0)
+        self._roll_day()
+        usage = self.usage(source)
+        usage.renders += 1 if cost else 0
+        usage.credits += cost
+        usage.bytes += size
+        self.run_credits += cost
+        self.daily_credits += cost
+
+    def record_yield(self, source: str, url: Optional[str], items: int) -> None:
+        """Count items produced by one parsed page and alert when a page yields nothing."""
+        usage = self.usage(source)
+        usage.parsed_pages += 1
+        usage.items += items
+        if items:
+            usage.zero_streak = 0
+            return
+        usage.zero_yield += 1
+        usage.zero_streak += 1
+        print(f"⚠️ {source}: page yielded 0 items ({url or 'listing'}), selectors may be stale")
+        if usage.zero_streak == self.zero_streak_alert:
+            print(f"🚨 {source}: {usage.zero_streak} consecutive empty pages, "
+                  f"{usage.credits} credits spent this run")
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        return {
+            source: dict(asdict(usage), items_per_render=round(usage.items_per_render, 2))
+            for source, usage in self.sources.items()
+        }
+
+    def save(self) -> None:
+        """Write this run's report and the running daily total."""
+        if not self.state_path:
+            return
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            state = {}
+        daily = state.get("daily", {})
+        daily[self.day] = self.daily_credits
+        state = {"daily": daily, "last_run": {"credits": self.run_credits, "sources": self.report()}}
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
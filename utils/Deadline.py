@@ -0,0 +1,30 @@
+import asyncio
+from contextvars import ContextVar
+from typing import Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised instead of (or while) fetching once the source's deadline has passed."""
+
+
+class Deadline:
+    """A point on the event-loop clock after which fetches are cut; remembers whether it was hit."""
+
+    def __init__(self, at: float):
+        self.at = at
+        self.expired = False
+
+    @classmethod
+    def after(cls, seconds: Optional[float], cap: Optional[float] = None) -> Optional["Deadline"]:
+        """Deadline `seconds` from now, never later than `cap` (loop time); None when neither is set."""
+        candidates = [] if cap is None else [cap]
+        if seconds:
+            candidates.append(asyncio.get_running_loop().time() + seconds)
+        return cls(min(candidates)) if candidates else None
+
+    def remaining(self) -> float:
+        return self.at - asyncio.get_running_loop().time()
+
+
+# 실행 중인 use case (또는 파이프라인 작업)의 마감 시각
+current_deadline: ContextVar[Optional[Deadline]] = ContextVar("current_deadline", default=None)
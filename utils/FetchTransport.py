@@ -0,0 +1,252 @@
+import asyncio
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Tuple, Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.ApiKeyPool import ApiKey, ApiKeyPool, keys_from_env
+
+
+BLOCK_STATUSES = {401, 403, 407, 429, 503}
+
+# 봇 차단/챌린지 페이지에서 흔히 보이는 문구
+CHALLENGE_MARKERS = (
+    "cf-chl",
+    "challenge-platform",
+    "Just a moment...",
+    "Attention Required!",
+    "Access denied",
+    "captcha",
+    "px-captcha",
+    "Please enable JS and disable any ad blocker",
+)
+
+DEFAULT_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+}
+
+
+@dataclass
+class FetchResponse:
+    url: str
+    status: int
+    text: str = field(repr=False)
+    transport: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_blocked(self) -> bool:
+        """Whether the response looks like a block or anti-bot challenge instead of the page."""
+        if self.status in BLOCK_STATUSES:
+            return True
+        head = self.text[:4096]
+        return any(marker in head for marker in CHALLENGE_MARKERS)
+
+
+class ExtractionUnavailable(Exception):
+    """Raised when remote extraction is requested but no transport supports it."""
+
+
+class FetchTransport:
+    """Base class for the ways a page can be fetched."""
+    name = "base"
+    supports_js = False
+    supports_extraction = False  # css_extractor로 필드만 JSON으로 돌려받을 수 있는지
+
+    async def get(self, url: str, wait: int, js_instructions: Optional[str],
+                  css_extractor: Optional[Dict[str, str]] = None) -> FetchResponse:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class DirectHttpTransport(FetchTransport):
+    """Plain HTTP client with a keep-alive connection pool shared across requests."""
+    name = "direct"
+
+    def __init__(self, pool_size: int = 20, timeout: float = 15.0, headers: Optional[Dict[str, str]] = None):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    async def get(self, url: str, wait: int, js_instructions: Optional[str],
+                  css_extractor: Optional[Dict[str, str]] = None) -> FetchResponse:
+        response = await asyncio.to_thread(self.session.get, url, timeout=self.timeout)
+        return FetchResponse(url=url, status=response.status_code, text=response.text,
+                             transport=self.name, headers=dict(response.headers))
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class ZenRowsTransport(FetchTransport):
+    """
+    JS rendering through the ZenRows API, spread over a pool of API keys (see ApiKeyPool).
+    A request rejected because of its key (auth, quota, throttling) is retried once on each other key.
+    """
+    name = "zenrows"
+    supports_js = True
+    supports_extraction = True
+
+    def __init__(self, api_key: Optional[str] = None, concurrency: int = 5, retries: int = 1,
+                 keys: Optional[List[ApiKey]] = None):
+        from zenrows import ZenRowsClient
+
+        if keys is None:
+            keys = [ApiKey(api_key, concurrency)] if api_key else keys_from_env()
+        if not keys:
+            keys = [ApiKey("", concurrency)]  # 키 없이 요청하면 ZenRows가 401을 반환합니다.
+        self.pool = ApiKeyPool(keys)
+        self.clients = {id(key): ZenRowsClient(key.key, concurrency=key.concurrency, retries=retries)
+                        for key in keys}
+
+    async def get(self, url: str, wait: int, js_instructions: Optional[str],
+                  css_extractor: Optional[Dict[str, str]] = None) -> FetchResponse:
+        params = {
+            'js_render': True,
+            'wait': wait,
+            'js_instructions': js_instructions
+        }
+        if css_extractor:
+            params['css_extractor'] = json.dumps(css_extractor)
+        for attempt in range(len(self.pool.keys)):
+            async with self.pool.lease() as lease:
+                response = await asyncio.to_thread(self.clients[id(lease.key)].get, url, params=params)
+                accepted = lease.report(response.status_code, dict(response.headers))
+            if accepted or attempt == len(self.pool.keys) - 1:
+                break
+            print(f"zenrows key {lease.key.label} rejected {url} (status {response.status_code}), trying another key")
+        return FetchResponse(url=url, status=response.status_code, text=response.text,
+                             transport=self.name, headers=dict(response.headers))
+
+
+class ExtractionStandIn(FetchTransport):
+    """
+    Local stand-in for the rendering service's remote extraction: fetches the page with
+    another transport and applies css_extractor to it locally, answering with the same JSON.
+    Register it as "zenrows" to test extraction specs without credits.
+    """
+    name = "zenrows"
+    supports_js = True
+    supports_extraction = True
+
+    def __init__(self, inner: FetchTransport):
+        self.inner = inner
+
+    async def get(self, url: str, wait: int, js_instructions: Optional[str],
+                  css_extractor: Optional[Dict[str, str]] = None) -> FetchResponse:
+        from utils.RemoteExtraction import apply_css_extractor
+
+        response = await self.inner.get(url, wait, js_instructions)
+        if not css_extractor or response.status != 200:
+            return response
+        text = json.dumps(apply_css_extractor(response.text, css_extractor), ensure_ascii=False)
+        return FetchResponse(url=url, status=response.status, text=text, transport=self.name,
+                             headers={"Content-Type": "application/json"})
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+@dataclass
+class RouteRule:
+    pattern: str
+    transports: Tuple[str, ...]
+
+    def matches(self, url: str) -> bool:
+        return re.search(self.pattern, url) is not None
+
+
+# 서버 렌더링으로 충분한 페이지는 직접 요청하고, 차단되면 ZenRows로 넘어갑니다.
+DEFAULT_ROUTES: List[RouteRule] = [
+    RouteRule(r"^https?://(www\.)?coinness\.com", ("zenrows",)),
+    RouteRule(r"^https?://(www\.)?coindesk\.com", ("zenrows",)),
+    RouteRule(r"^https?://(www\.)?cointelegraph\.com/news/", ("direct", "zenrows")),
+    RouteRule(r"^https?://(www\.)?decrypt\.co/+\d+/", ("direct", "zenrows")),
+    RouteRule(r"^https?://news\.bitcoin\.com", ("direct", "zenrows")),
+    RouteRule(r"^https?://finance\.yahoo\.com", ("direct", "zenrows")),
+    RouteRule(r"^https?://(www\.)?cryptonews\.com", ("direct", "zenrows")),
+    RouteRule(r"^https?://(www\.)?cryptoslate\.com", ("direct", "zenrows")),
+]
+
+
+class TransportRouter:
+    """Picks the transport order for a URL and falls back when a response is blocked."""
+
+    def __init__(self, transports: Dict[str, FetchTransport], routes: Optional[List[RouteRule]] = None,
+                 default: Tuple[str, ...] = ("zenrows",)):
+        self.transports = transports
+        self.routes = routes if routes is not None else DEFAULT_ROUTES
+        self.default = default
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def route(self, url: str, js_instructions: Optional[str], extraction: bool = False) -> List[str]:
+        if extraction:
+            # 원격 추출은 지원하는 전송 수단만 가능 (없으면 빈 목록)
+            return [name for name, transport in self.transports.items() if transport.supports_extraction]
+        order = next((rule.transports for rule in self.routes if rule.matches(url)), self.default)
+        order = [name for name in order if name in self.transports]
+        if js_instructions:
+            # JS 명령이 필요한 요청은 렌더링 가능한 전송 수단만 사용
+            order = [name for name in order if self.transports[name].supports_js]
+        return order or [name for name in self.transports if self.transports[name].supports_js]
+
+    def _count(self, transport: str, key: str) -> None:
+        counts = self.stats.setdefault(transport, {})
+        counts[key] = counts.get(key, 0) + 1
+
+    async def fetch(self, url: str, wait: int, js_instructions: Optional[str],
+                    allow: Optional[Callable[[str], bool]] = None,
+                    css_extractor: Optional[Dict[str, str]] = None) -> FetchResponse:
+        """
+        allow(transport)가 False를 반환하는 전송 수단(예: 예산 초과)은 건너뜁니다.
+        css_extractor가 있으면 원격 추출을 지원하는 전송 수단만 사용합니다.
+        """
+        order = self.route(url, js_instructions, extraction=bool(css_extractor))
+        if css_extractor and not order:
+            raise ExtractionUnavailable(f"No transport supports remote extraction for {url}")
+        if allow is not None:
+            order = [name for name in order if allow(name)]
+            if not order:
+                from utils.CreditLedger import BudgetExceeded
+
+                raise BudgetExceeded(f"Render budget exhausted, skipping {url}")
+
+        for index, name in enumerate(order):
+            is_last = index == len(order) - 1
+            try:
+                transport = self.transports[name]
+                response = await (transport.get(url, wait, js_instructions, css_extractor) if css_extractor
+                                  else transport.get(url, wait, js_instructions))
+            except Exception as error:
+                self._count(name, "error")
+                if is_last:
+                    raise
+                print(f"{name} failed for {url}: {error}, falling back")
+                continue
+
+            if response.is_blocked:
+                self._count(name, "blocked")
+                if not is_last:
+                    print(f"{name} blocked for {url} (status {response.status}), falling back")
+                    continue
+            else:
+                self._count(name, "ok")
+            return response
+
+        raise RuntimeError(f"No transport available for {url}")
+
+    def close(self) -> None:
+        for transport in self.transports.values():
+            transport.close()
@@ -0,0 +1,113 @@
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """The last `window` fetch latencies per source, for percentile thresholds."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def observe(self, key: str, seconds: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def percentile(self, key: str, pct: float) -> Optional[float]:
+        """None until the source has `min_samples` observations."""
+        samples = self._samples.get(key)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))]
+
+
+@dataclass
+class HedgeStats:
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0  # 복제 요청이 먼저 끝난 횟수
+    over_budget: int = 0  # 지연됐지만 예산이 없어 복제하지 않은 횟수
+
+    def report(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests, "hedged": self.hedged, "hedge_wins": self.hedge_wins,
+            "over_budget": self.over_budget,
+            "hedge_rate": round(self.hedged / self.requests, 4) if self.requests else 0.0,
+            "win_rate": round(self.hedge_wins / self.hedged, 4) if self.hedged else 0.0,
+        }
+
+
+class HedgePolicy:
+    """
+    Hedged requests: when a fetch is still running after its source's observed `percentile`
+    latency (never earlier than `min_delay`), the same request is sent again; whichever
+    finishes first wins and the other is cancelled. Hedges are capped at `budget` extra
+    requests per request (a token bucket holding at most `burst` hedges), so the extra
+    spend stays bounded however slow the service gets.
+    """
+
+    def __init__(self, percentile: float = 95.0, budget: float = 0.05, burst: float = 5.0,
+                 min_delay: float = 1.0, window: int = 200, min_samples: int = 20):
+        self.percentile = percentile
+        self.budget = budget
+        self.burst = burst
+        self.min_delay = min_delay
+        self.tracker = LatencyTracker(window, min_samples)
+        self.stats = HedgeStats()
+        self._tokens = 0.0
+
+    def delay(self, key: str) -> Optional[float]:
+        """Seconds to wait before hedging a fetch for this source; None while there are too few samples."""
+        threshold = self.tracker.percentile(key, self.percentile)
+        return max(threshold, self.min_delay) if threshold is not None else None
+
+    def _spend(self) -> bool:
+        if self._tokens < 1.0:
+            self.stats.over_budget += 1
+            return False
+        self._tokens -= 1.0
+        return True
+
+    async def run(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Run fetch(), hedging it with a second fetch() when it is slower than the threshold."""
+        self.stats.requests += 1
+        self._tokens = min(self.burst, self._tokens + self.budget)
+        delay = self.delay(key)
+        started = time.monotonic()
+        primary = asyncio.ensure_future(fetch())
+        hedge: Optional[asyncio.Future] = None
+        try:
+            if delay is not None:
+                await asyncio.wait({primary}, timeout=delay)
+                if not primary.done() and self._spend():
+                    self.stats.hedged += 1
+                    hedge = asyncio.ensure_future(fetch())
+            pending = {primary} | ({hedge} if hedge is not None else set())
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # 먼저 끝난 쪽이 실패했으면 남은 요청을 기다립니다 (복제 요청이 재시도 역할도 함).
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded or not pending:
+                    break
+            if not succeeded:
+                return primary.result()
+            winner = primary if primary in succeeded else succeeded[0]
+            if winner is hedge:
+                self.stats.hedge_wins += 1
+            # 복제 요청이 이긴 경우 원래 요청의 지연은 이 값 이상 (하한으로 기록)
+            self.tracker.observe(key, time.monotonic() - started)
+            return winner.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
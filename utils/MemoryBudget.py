@@ -0,0 +1,34 @@
+import asyncio
+
+
+class ByteBudget:
+    """Caps the total size of pages being parsed at the same time."""
+
+    def __init__(self, limit_bytes: int):
+        self.limit = limit_bytes
+        self.in_flight = 0
+        self.peak = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self, size: int) -> None:
+        async with self._condition:
+            # 한도보다 큰 페이지는 다른 페이지가 모두 해제된 뒤 단독으로 처리
+            await self._condition.wait_for(
+                lambda: self.in_flight == 0 or self.in_flight + size <= self.limit)
+            self.in_flight += size
+            self.peak = max(self.peak, self.in_flight)
+
+    async def resize(self, old: int, new: int) -> None:
+        """Swaps a reservation of old bytes for new bytes without giving up the old one while waiting."""
+        async with self._condition:
+            # 기존 예약분은 이미 자신의 몫이므로 제외하고 판단 (취소되어도 상태는 그대로 유지)
+            await self._condition.wait_for(
+                lambda: new <= old or self.in_flight == old or self.in_flight - old + new <= self.limit)
+            self.in_flight += new - old
+            self.peak = max(self.peak, self.in_flight)
+            self._condition.notify_all()
+
+    async def release(self, size: int) -> None:
+        async with self._condition:
+            self.in_flight -= size
+            self._condition.notify_all()
@@ -0,0 +1,81 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+
+@dataclass(frozen=True)
+class ExtractSpec:
+    """
+    Field selectors for remote CSS extraction of a listing page, in the `css_extractor` syntax:
+    "selector" for an element's text, "selector @attr" for an attribute.
+    The service returns one flat list per field, so items are rebuilt by position: every
+    `required` field must match the same number of elements, and an `optional` field must
+    either line up with them too or match nothing at all; otherwise the page is parsed locally.
+    A column with a different count cannot be assigned to items by position.
+    """
+    name: str
+    required: Dict[str, str]
+    optional: Dict[str, str] = field(default_factory=dict)
+    url_fields: Tuple[str, ...] = ("url",)  # 상대 경로를 절대 URL로 바꿀 필드
+
+    @property
+    def selectors(self) -> Dict[str, str]:
+        return {**self.required, **self.optional}
+
+    def rows(self, data: Any, base_url: str = "") -> Optional[List[Dict[str, Optional[str]]]]:
+        """Per-item field dicts from the extraction result; None when it cannot be trusted."""
+        if not isinstance(data, dict):
+            return None
+        columns = {name: _as_list(data.get(name)) for name in self.selectors}
+        counts = {len(columns[name]) for name in self.required}
+        if len(counts) != 1 or not next(iter(counts)):
+            return None
+        size = counts.pop()
+        if any(len(values) not in (0, size) for values in columns.values()):
+            return None
+        rows = []
+        for index in range(size):
+            row = {name: (values[index] if values else None) for name, values in columns.items()}
+            for name in self.url_fields:
+                if row.get(name):
+                    row[name] = urljoin(base_url, row[name])
+            rows.append(row)
+        return rows
+
+
+def _as_list(value: Any) -> List[Optional[str]]:
+    # 하나만 일치하면 문자열, 여러 개면 배열로 돌아옵니다.
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [item.strip() if isinstance(item, str) else item for item in value]
+    return [value.strip() if isinstance(value, str) else value]
+
+
+def apply_css_extractor(html: str, selectors: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Local implementation of the remote `css_extractor` (same input and output shape),
+    used by the stand-in transport to test extraction without the rendering service.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    try:
+        result: Dict[str, Any] = {}
+        for name, spec in selectors.items():
+            selector, _, attribute = spec.partition(" @")
+            values = [element.get(attribute.strip()) if attribute else element.get_text(" ", strip=True)
+                      for element in soup.select(selector)]
+            values = [value for value in values if value is not None]
+            result[name] = values[0] if len(values) == 1 else values
+        return result
+    finally:
+        soup.decompose()
+
+
+def decode(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
@@ -0,0 +1,118 @@
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+
+# <script ...>...</script>를 DOM 없이 찾습니다 (속성과 내용만 필요).
+_SCRIPT = re.compile(r"<script\b([^>]*)>(.*?)</script\s*>", re.IGNORECASE | re.DOTALL)
+_ATTR = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+
+ARTICLE_TYPES = {"NewsArticle", "Article", "BlogPosting", "ReportageNewsArticle", "AnalysisNewsArticle"}
+# 기사가 아닌 페이지/사이트 메타데이터
+NON_ARTICLE_TYPES = {"WebPage", "WebSite", "CollectionPage", "Organization", "NewsMediaOrganization", "Person",
+                     "ImageObject", "VideoObject", "BreadcrumbList", "SearchAction", "SiteNavigationElement"}
+_TITLE_KEYS = ("headline", "title", "name")
+_URL_KEYS = ("url", "canonical_url", "canonicalUrl", "link", "permalink", "@id")
+_DATE_KEYS = ("datePublished", "date_published", "publishedAt", "published_at", "publishDate",
+              "display_date", "first_publish_date", "dateModified", "date")
+_SUMMARY_KEYS = ("description", "subheadline", "excerpt", "summary", "dek")
+
+
+def script_payloads(html: str, types: tuple = ("application/ld+json",),
+                    ids: tuple = ("__NEXT_DATA__", "__NUXT_DATA__")) -> Iterator[Any]:
+    """Decoded JSON of <script> tags with one of the given types or ids; malformed payloads are skipped."""
+    for match in _SCRIPT.finditer(html):
+        attrs = {m.group(1).lower(): m.group(2) or m.group(3) or m.group(4) or ""
+                 for m in _ATTR.finditer(match.group(1))}
+        if attrs.get("type", "").lower() not in types and attrs.get("id") not in ids:
+            continue
+        body = match.group(2).strip()
+        if body.startswith("<!--"):
+            body = body[4:].rsplit("-->", 1)[0]
+        try:
+            yield json.loads(body)
+        except ValueError:
+            continue
+
+
+def _walk(payload: Any) -> Iterator[Dict[str, Any]]:
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if node.get("@type") == "BreadcrumbList":
+                continue
+            yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _first(node: Dict[str, Any], keys: tuple) -> Optional[str]:
+    for key in keys:
+        value = node.get(key)
+        if isinstance(value, dict):
+            value = value.get("@value") or value.get("url") or value.get("name")
+        if isinstance(value, list) and value and isinstance(value[0], str):
+            value = value[0]
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return None
+
+
+def _image(node: Dict[str, Any]) -> Optional[str]:
+    image = node.get("image") or node.get("thumbnail") or node.get("thumbnailUrl")
+    if isinstance(image, list):
+        image = image[0] if image else None
+    if isinstance(image, dict):
+        image = image.get("url") or image.get("src")
+    return image if isinstance(image, str) else None
+
+
+def article_records(html: str, base_url: str = "") -> List[Dict[str, Any]]:
+    """
+    Article-like objects (a title and a URL) found in JSON-LD and framework hydration payloads,
+    in document order and deduplicated by URL. Each record has title, url, summary, published,
+    section, image, author and body (the JSON-LD articleBody when present).
+    """
+    records: List[Dict[str, Any]] = []
+    index: Dict[str, int] = {}
+    for payload in script_payloads(html):
+        for node in _walk(payload):
+            title = _first(node, _TITLE_KEYS)
+            url = _first(node, _URL_KEYS)
+            types = node.get("@type")
+            types = set(types if isinstance(types, list) else [types])
+            if types & NON_ARTICLE_TYPES:
+                continue
+            is_article = bool(types & ARTICLE_TYPES)
+            if node.get("@type") == "ListItem" and isinstance(node.get("item"), dict):
+                continue  # 내부 item에서 처리
+            if not title or not url or not (is_article or _first(node, _DATE_KEYS) or node.get("@type") == "ListItem"):
+                continue
+            url = urljoin(base_url, url)
+            if not url.startswith(("http://", "https://")):
+                continue
+            author = node.get("author")
+            if isinstance(author, list):
+                author = author[0] if author else None
+            record = {
+                "title": title,
+                "url": url,
+                "summary": _first(node, _SUMMARY_KEYS),
+                "published": _first(node, _DATE_KEYS),
+                "section": _first(node, ("articleSection", "section", "category")),
+                "image": _image(node),
+                "author": author.get("name") if isinstance(author, dict) else author,
+                "body": node.get("articleBody") if isinstance(node.get("articleBody"), str) else None,
+            }
+            if url in index:
+                # 같은 기사가 여러 번 나오면 비어 있는 필드만 채웁니다.
+                existing = records[index[url]]
+                for key, value in record.items():
+                    if existing.get(key) is None:
+                        existing[key] = value
+                continue
+            index[url] = len(records)
+            records.append(record)
+    return records
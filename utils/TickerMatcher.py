@@ -0,0 +1,133 @@
+import json
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 티커: [별칭...]. 대문자 티커와 WORD_ALIASES는 대소문자를 구분해 매칭하고, 나머지 이름 별칭은 구분하지 않습니다.
+DEFAULT_TICKERS: Dict[str, List[str]] = {
+    "BTC": ["BTC", "$BTC", "Bitcoin", "비트코인"],
+    "ETH": ["ETH", "$ETH", "Ethereum", "Ether", "이더리움"],
+    "SOL": ["SOL", "$SOL", "Solana", "솔라나"],
+    "XRP": ["XRP", "$XRP", "Ripple", "리플"],
+    "BNB": ["BNB", "$BNB", "Binance Coin", "BNB Chain"],
+    "DOGE": ["DOGE", "$DOGE", "Dogecoin", "도지코인"],
+    "ADA": ["ADA", "$ADA", "Cardano", "카르다노"],
+    "TRX": ["TRX", "$TRX", "Tron", "트론"],
+    "AVAX": ["AVAX", "$AVAX", "Avalanche", "아발란체"],
+    "LINK": ["$LINK", "Chainlink", "체인링크"],
+    "DOT": ["$DOT", "Polkadot", "폴카닷"],
+    "TON": ["$TON", "Toncoin"],
+    "SHIB": ["SHIB", "$SHIB", "Shiba Inu", "시바이누"],
+    "LTC": ["LTC", "$LTC", "Litecoin", "라이트코인"],
+    "BCH": ["BCH", "$BCH", "Bitcoin Cash", "비트코인캐시"],
+    "SUI": ["$SUI", "Sui Network"],
+    "PEPE": ["PEPE", "$PEPE", "페페"],
+    "USDT": ["USDT", "Tether", "테더"],
+    "USDC": ["USDC", "USD Coin"],
+    "XLM": ["XLM", "$XLM", "Stellar", "스텔라루멘"],
+    "HBAR": ["HBAR", "$HBAR", "Hedera"],
+    "UNI": ["$UNI", "Uniswap", "유니스왑"],
+    "APT": ["$APT", "Aptos", "앱토스"],
+    "ARB": ["$ARB", "Arbitrum", "아비트럼"],
+    "OP": ["$OP", "Optimism"],
+    "NEAR": ["$NEAR", "NEAR Protocol"],
+    "MATIC": ["MATIC", "$MATIC", "Polygon", "폴리곤"],
+}
+
+# 일반 영어 단어이기도 한 별칭 ("ripple effect", "polygon mesh" 등)은 고유명사로 쓰인 경우만 매칭합니다.
+WORD_ALIASES = {"Ripple", "Tron", "Avalanche", "Stellar", "Optimism", "Polygon", "Ether", "Tether"}
+
+# 한글 별칭이나 티커 바로 뒤에 붙어도 되는 조사 ("비트코인이", "BTC는"). 그 밖의 한글이 이어지면 다른 단어입니다 ("리플레이").
+KOREAN_PARTICLES = ("이", "가", "은", "는", "을", "를", "의", "에", "와", "과", "도", "만", "로", "으로", "까지", "부터",
+                    "보다", "처럼", "랑", "한테", "께서", "라는", "라고")
+
+
+def load_tickers(path: Optional[str]) -> Dict[str, List[str]]:
+    """JSON 파일({"BTC": ["Bitcoin", ...]})이 주어지면 그것을, 아니면 기본 사전을 사용합니다."""
+    if not path:
+        return DEFAULT_TICKERS
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _is_hangul(char: str) -> bool:
+    return "가" <= char <= "힣"
+
+
+def _ends_word(text: str, end: int) -> bool:
+    """Whether a match ending before `end` is a whole word, allowing a trailing Korean particle."""
+    if end >= len(text) or not _is_word_char(text[end]):
+        return True
+    return _is_hangul(text[end]) and text.startswith(KOREAN_PARTICLES, end)
+
+
+class TickerMatcher:
+    """Aho-Corasick automaton that finds every ticker alias in a text in one pass."""
+
+    def __init__(self, tickers: Dict[str, List[str]], case_sensitive: Iterable[str] = WORD_ALIASES):
+        self._case_sensitive = set(case_sensitive)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 노드별 (패턴 길이, 티커, 원래 별칭, 대소문자 구분 여부)
+        self._output: List[List[Tuple[int, str, str, bool]]] = [[]]
+
+        for ticker, aliases in tickers.items():
+            for alias in aliases:
+                self._add(alias, ticker)
+        self._build()
+
+    def _add(self, alias: str, ticker: str) -> None:
+        node = 0
+        for char in alias.lower():
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        case_sensitive = alias.lstrip("$").isupper() or alias in self._case_sensitive
+        self._output[node].append((len(alias), ticker, alias, case_sensitive))
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, text: str) -> Set[str]:
+        """Tickers whose aliases appear in `text` as whole words."""
+        found: Set[str] = set()
+        if not text:
+            return found
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # 소문자 변환으로 길이가 바뀌는 문자는 그대로 두어 위치를 맞춥니다.
+            lowered = "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+        node = 0
+        for end, char in enumerate(lowered):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for length, ticker, alias, case_sensitive in self._output[node]:
+                if ticker in found:
+                    continue
+                start = end - length + 1
+                if start > 0 and _is_word_char(text[start - 1]) and alias[0] != "$":
+                    continue
+                if not _ends_word(text, end + 1):
+                    continue
+                if case_sensitive and text[start:end + 1] != alias:
+                    continue
+                found.add(ticker)
+        return found
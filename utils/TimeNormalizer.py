@@ -0,0 +1,102 @@
+import re
+import time
+from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional, Tuple
+
+KST = timezone(timedelta(hours=9))
+
+_UNIT_SECONDS = {
+    "s": 1, "sec": 1, "secs": 1, "second": 1, "seconds": 1, "초": 1,
+    "m": 60, "min": 60, "mins": 60, "minute": 60, "minutes": 60, "분": 60,
+    "h": 3600, "hr": 3600, "hrs": 3600, "hour": 3600, "hours": 3600, "시간": 3600,
+    "d": 86400, "day": 86400, "days": 86400, "일": 86400,
+    "w": 604800, "week": 604800, "weeks": 604800, "주": 604800,
+    "mo": 2592000, "month": 2592000, "months": 2592000, "개월": 2592000,
+    "y": 31536000, "yr": 31536000, "year": 31536000, "years": 31536000, "년": 31536000,
+}
+
+_RELATIVE = re.compile(r"^(\d+|an?|one)\s*([a-z가-힣]+)\s*(ago|전)$")
+
+_ABSOLUTE_FORMATS = (
+    "%b %d, %Y", "%B %d, %Y", "%b. %d, %Y", "%d %b %Y", "%d %B %Y",
+    "%b %d, %Y %I:%M %p", "%b %d, %Y at %I:%M %p", "%B %d, %Y at %I:%M %p", "%b. %d, %Y at %I:%M %p",
+    "%Y-%m-%d", "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%Y.%m.%d", "%Y/%m/%d",
+)
+
+Shape = Tuple[str, float]  # ("relative", 초) 또는 ("absolute", epoch)
+
+
+@lru_cache(maxsize=4096)
+def _parse_shape(raw: str) -> Optional[Shape]:
+    """
+    문자열의 형태만 해석해 캐시합니다. 상대 시간은 기준 시각에 따라 달라지므로
+    오프셋(초)으로 저장하고, 실제 시각은 호출 시점에 계산합니다.
+    """
+    text = " ".join(raw.split())
+    lowered = text.lower().rstrip(".")
+    if not lowered:
+        return None
+
+    if lowered in ("just now", "now", "방금", "방금 전"):
+        return "relative", 0.0
+    if lowered in ("yesterday", "어제"):
+        return "relative", 86400.0
+
+    match = _RELATIVE.match(lowered)
+    if match:
+        amount, unit, _ = match.groups()
+        seconds = _UNIT_SECONDS.get(unit)
+        if seconds is not None:
+            count = 1 if amount in ("a", "an", "one") else int(amount)
+            return "relative", float(count * seconds)
+
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return "absolute", parsed.timestamp()
+    except ValueError:
+        pass
+
+    # RSS pubDate (RFC 822), 예: "Mon, 02 Jan 2006 15:04:05 +0000"
+    if text[:3].isalpha() and "," in text[:5]:
+        try:
+            parsed = parsedate_to_datetime(text)
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return "absolute", parsed.timestamp()
+        except (TypeError, ValueError):
+            pass
+
+    cleaned = re.sub(r"\s*(UTC|GMT|EST|EDT)$", "", text, flags=re.IGNORECASE)
+    cleaned = re.sub(r"(\d)(st|nd|rd|th)\b", r"\1", cleaned)
+    for fmt in _ABSOLUTE_FORMATS:
+        try:
+            return "absolute", datetime.strptime(cleaned, fmt).replace(tzinfo=timezone.utc).timestamp()
+        except ValueError:
+            continue
+    return None
+
+
+def normalize_timestamp(raw: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """상대/절대 시간 문자열을 UTC epoch(초)로 변환합니다. 해석할 수 없으면 None."""
+    if not raw:
+        return None
+    shape = _parse_shape(raw)
+    if shape is None:
+        return None
+    kind, value = shape
+    if kind == "relative":
+        return (now if now is not None else time.time()) - value
+    return value
+
+
+@lru_cache(maxsize=4096)
+def coinness_timestamp(date: str, clock: str) -> Optional[float]:
+    """Coinness의 날짜 헤더(YYYY-MM-DD)와 24시간제 HH:MM(KST)을 UTC epoch로 변환합니다."""
+    try:
+        return datetime.strptime(f"{date} {clock}", "%Y-%m-%d %H:%M").replace(tzinfo=KST).timestamp()
+    except ValueError:
+        return None
@@ -1,33 +1,226 @@
-import os
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, List, AsyncIterator, Set, Tuple
+from urllib.parse import urlsplit
 
-from bs4 import BeautifulSoup
-from zenrows import ZenRowsClient
-from typing import Optional, Dict, List
+from bs4 import BeautifulSoup, SoupStrainer
+
+from utils.FetchTransport import (
+    FetchTransport, FetchResponse, DirectHttpTransport, ZenRowsTransport, TransportRouter, RouteRule,
+    ExtractionUnavailable
+)
+from utils.ApiKeyPool import ApiKey
+from utils.CreditLedger import CREDIT_COSTS, BudgetExceeded, CreditLedger, current_source
+from utils.Deadline import DeadlineExceeded, current_deadline
+from utils.Hedging import HedgePolicy
+from utils.MemoryBudget import ByteBudget
+from utils.RemoteExtraction import ExtractSpec, decode
+
+LARGE_PAGE_BYTES = 2 * 1024 * 1024
 
 
 class ZenrowsUtil:
-    def __init__(self):
-        self.client = ZenRowsClient(os.environ.get('ZENROWS_API_KEY', None))
+    def __init__(self, transports: Optional[Dict[str, FetchTransport]] = None,
+                 routes: Optional[List[RouteRule]] = None, memory_budget: Optional[int] = None,
+                 large_page_bytes: int = LARGE_PAGE_BYTES, ledger: Optional[CreditLedger] = None,
+                 structured_data: bool = True, api_keys: Optional[List[ApiKey]] = None,
+                 remote_extraction: bool = False, hedging: Optional[HedgePolicy] = None):
+        # api_keys가 없으면 ZENROWS_API_KEYS (key:concurrency:rate:quota,...) 또는 ZENROWS_API_KEY를 사용합니다.
+        if transports is None:
+            transports = {
+                DirectHttpTransport.name: DirectHttpTransport(),
+                ZenRowsTransport.name: ZenRowsTransport(keys=api_keys),
+            }
+        self.router = TransportRouter(transports, routes)
+        # memory_budget(바이트)이 설정되면 동시에 파싱 중인 페이지 크기의 합을 제한합니다.
+        self.budget = ByteBudget(memory_budget) if memory_budget else None
+        self.large_page_bytes = large_page_bytes
+        self.ledger = ledger
+        # 페이지에 포함된 JSON-LD/하이드레이션 데이터를 DOM보다 먼저 사용합니다 (없으면 DOM 파서).
+        self.structured_data = structured_data
+        # 목록 페이지를 원격 CSS 추출(ExtractSpec)로 가져옵니다; 결과가 맞지 않은 spec은 로컬 파싱으로 돌아갑니다.
+        self.remote_extraction = remote_extraction
+        self._extraction_failed: Set[str] = set()
+        # 소스의 p95 지연을 넘긴 요청을 한 번 더 보내고 먼저 끝난 응답을 씁니다 (HedgePolicy의 예산 안에서).
+        self.hedging = hedging
 
-    async def fetch_page(self, url: str, wait: int, js_instructions: Optional[str]) -> BeautifulSoup:
-        """웹 페이지를 가져와서 파싱된 BeautifulSoup 객체를 반환합니다."""
-        print("fetching")
+    async def fetch_response(self, url: str, wait: int, js_instructions: Optional[str],
+                             source: Optional[str] = None, priority: int = 0,
+                             css_extractor: Optional[Dict[str, str]] = None) -> FetchResponse:
+        """
+        라우팅 규칙에 따라 페이지를 가져오고, 차단되면 다음 전송 수단으로 넘어갑니다.
+        source를 주지 않으면 실행 중인 use case, 없으면 URL의 호스트로 크레딧을 집계합니다.
+        마감 시각이 설정되어 있으면 그 시각에 요청을 취소하고 DeadlineExceeded를 발생시킵니다.
+        """
+        deadline = current_deadline.get()
+        if deadline is None:
+            return await self._hedged(url, wait, js_instructions, source, priority, css_extractor)
+        if deadline.remaining() <= 0:
+            deadline.expired = True
+            raise DeadlineExceeded(f"Deadline passed, skipping {url}")
+        scope = asyncio.timeout_at(deadline.at)
+        try:
+            async with scope:
+                return await self._hedged(url, wait, js_instructions, source, priority, css_extractor)
+        except TimeoutError:
+            if not scope.expired():
+                raise
+            deadline.expired = True
+            raise DeadlineExceeded(f"Deadline passed while fetching {url}") from None
+
+    async def _hedged(self, url: str, wait: int, js_instructions: Optional[str], source: Optional[str],
+                      priority: int, css_extractor: Optional[Dict[str, str]]) -> FetchResponse:
+        if self.hedging is None:
+            return await self._fetch_response(url, wait, js_instructions, source, priority, css_extractor)
+        key = source or current_source.get() or urlsplit(url).netloc
+        return await self.hedging.run(key, lambda: self._fetch_response(url, wait, js_instructions, source,
+                                                                         priority, css_extractor))
+
+    async def _fetch_response(self, url: str, wait: int, js_instructions: Optional[str],
+                              source: Optional[str], priority: int,
+                              css_extractor: Optional[Dict[str, str]] = None) -> FetchResponse:
+        print(f"fetching {url}" + (" (remote extraction)" if css_extractor else ""))
+        if self.ledger is None:
+            return await self.router.fetch(url, wait, js_instructions, css_extractor=css_extractor)
+
+        source = source or current_source.get() or urlsplit(url).netloc
+        held = 0
+        held_for = None
+
+        def allow(transport: str) -> bool:
+            # 허용된 전송 수단 중 가장 비싼 비용만큼 요청이 끝날 때까지 예약합니다.
+            nonlocal held, held_for
+            if not self.ledger.allow(source, transport, priority, held):
+                return False
+            cost = CREDIT_COSTS.get(transport, 0)
+            if cost > held:
+                self.ledger.reserve(cost - held)
+                held, held_for = cost, transport
+            return True
 
         try:
-            params = {
-                'js_render': True,
-                'wait': wait,
-                'js_instructions': js_instructions
-            }
+            response = await self.router.fetch(url, wait, js_instructions, allow=allow, css_extractor=css_extractor)
+        except BudgetExceeded:
+            self.ledger.record_skip(source)
+            raise
+        except asyncio.CancelledError:
+            # 취소돼도 스레드의 요청은 끝까지 진행되어 과금되므로 예약한 만큼 사용한 것으로 기록합니다.
+            if held_for is not None:
+                self.ledger.record_fetch(source, held_for, 0)
+            raise
+        finally:
+            self.ledger.release(held)
+        self.ledger.record_fetch(source, response.transport, len(response.text))
+        return response
+
+    async def fetch_extracted(self, url: str, wait: int, js_instructions: Optional[str], spec: ExtractSpec,
+                              source: Optional[str] = None,
+                              priority: int = 0) -> Optional[List[Dict[str, Optional[str]]]]:
+        """
+        원격 CSS 추출로 목록 항목의 필드만 JSON으로 받아옵니다 (HTML 전송/파싱 없음).
+        추출을 쓸 수 없거나 결과가 spec과 맞지 않으면 None을 반환하고, 그 spec은 이후 원격 추출을
+        시도하지 않습니다. 호출한 쪽은 None이면 페이지를 가져와 직접 파싱합니다.
+        """
+        if not self.remote_extraction or spec.name in self._extraction_failed:
+            return None
+        try:
+            response = await self.fetch_response(url, wait, js_instructions, source, priority,
+                                                 css_extractor=spec.selectors)
+        except ExtractionUnavailable:
+            self._extraction_failed.add(spec.name)
+            return None
+        if response.is_blocked:
+            return None
+        rows = spec.rows(decode(response.text), url)
+        if rows is None:
+            print(f"⚠️ Remote extraction for {spec.name} did not line up, parsing its pages locally")
+            self._extraction_failed.add(spec.name)
+        return rows
 
+    async def fetch_html(self, url: str, wait: int, js_instructions: Optional[str],
+                         source: Optional[str] = None, priority: int = 0) -> str:
+        """웹 페이지의 HTML 원문을 반환합니다."""
+        response = await self.fetch_response(url, wait, js_instructions, source, priority)
+        return response.text
+
+    async def fetch_page(self, url: str, wait: int, js_instructions: Optional[str]) -> BeautifulSoup:
+        """웹 페이지를 가져와서 파싱된 BeautifulSoup 객체를 반환합니다."""
+        response = None
+        try:
             # 응답을 텍스트로 가져오기
-            response = self.client.get(url, params=params)
+            response = await self.fetch_response(url, wait, js_instructions)
             html_content = response.text
 
-            return BeautifulSoup(html_content)
+            return BeautifulSoup(html_content, "html.parser")
 
         except Exception as error:
             print(f"Failed to fetch page: {error}")
             print(f"Response type: {type(response)}")
             print(f"Response: {response}")
             raise error
+
+    async def _parse(self, html_content: str, parse_only: Optional[SoupStrainer],
+                     held: int) -> Tuple[BeautifulSoup, int]:
+        """예약된 held 바이트를 실제 페이지 크기로 맞춘 뒤 파싱합니다. (트리, 예약 바이트)를 돌려줍니다."""
+        size = len(html_content)
+        if self.budget:
+            await self.budget.resize(held, size)
+        strainer = parse_only if size > self.large_page_bytes else None
+        try:
+            # HTML 문자열은 이 함수가 끝나면 참조가 사라지고 트리만 남음
+            soup = BeautifulSoup(html_content, "html.parser", parse_only=strainer)
+        except BaseException:
+            if self.budget:
+                await self.budget.resize(size, held)
+            raise
+        return soup, size if self.budget else 0
+
+    @asynccontextmanager
+    async def parsed(self, html_content: str,
+                     parse_only: Optional[SoupStrainer] = None) -> AsyncIterator[BeautifulSoup]:
+        """
+        HTML을 파싱해 넘겨주고, 블록을 벗어나면 파싱 트리를 즉시 해제합니다.
+        큰 페이지는 parse_only에 해당하는 요소만 트리로 만들어 메모리 사용을 줄입니다.
+        """
+        soup, held = await self._parse(html_content, parse_only, 0)
+        try:
+            yield soup
+        finally:
+            soup.decompose()
+            if held:
+                await self.budget.release(held)
+
+    @asynccontextmanager
+    async def page(self, url: str, wait: int, js_instructions: Optional[str],
+                   parse_only: Optional[SoupStrainer] = None, priority: int = 0) -> AsyncIterator[BeautifulSoup]:
+        """
+        페이지를 가져와 파싱합니다. 상세 페이지는 priority=1로 요청합니다.
+        다운로드 전에 large_page_bytes만큼 메모리 예산을 먼저 잡아 두고, 받은 뒤 실제 크기로 맞춥니다.
+        """
+        held = 0
+        if self.budget:
+            await self.budget.acquire(self.large_page_bytes)
+            held = self.large_page_bytes
+        soup = None
+        try:
+            # 받은 HTML을 지역 변수에 담지 않아 파싱 중에도 문자열이 남지 않음
+            soup, held = await self._parse(
+                await self.fetch_html(url, wait, js_instructions, priority=priority), parse_only, held)
+            yield soup
+        finally:
+            if soup is not None:
+                soup.decompose()
+            if held:
+                await self.budget.release(held)
+
+    def key_stats(self) -> Optional[Dict[str, Dict[str, object]]]:
+        """Per-key usage of the ZenRows key pool; None when ZenRows is not one of the transports."""
+        pool = getattr(self.router.transports.get(ZenRowsTransport.name), "pool", None)
+        return pool.stats() if pool is not None else None
+
+    def hedge_stats(self) -> Optional[Dict[str, float]]:
+        """Hedged request counts with hedge and win rates; None when hedging is off."""
+        return self.hedging.stats.report() if self.hedging is not None else None
+
+    def close(self) -> None:
+        self.router.close()